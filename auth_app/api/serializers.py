@@ -1,19 +1,18 @@
 from rest_framework import serializers
+from rest_framework.authtoken.models import Token
 from django.contrib.auth.models import User
 from django.contrib.auth import authenticate
-from rest_framework.validators import UniqueValidator
-from django.db import transaction
+from django.db import IntegrityError, transaction
+from django.utils.crypto import constant_time_compare
+from auth_app.guests import GUEST_LOGINS, get_guest_login
+from profiles_app.models import Profile
 
 
 class RegisterSerializer(serializers.ModelSerializer):
     """Serializer for user registration."""
 
-    email = serializers.EmailField(
-        validators=[UniqueValidator(queryset=User.objects.all(), message="Email already exists.")]
-    )
-    username = serializers.CharField(
-        validators=[UniqueValidator(queryset=User.objects.all(), message="Username already exists.")]
-    )
+    email = serializers.EmailField()
+    username = serializers.CharField()
     password = serializers.CharField(write_only=True)
     repeated_password = serializers.CharField(write_only=True)
     type = serializers.ChoiceField(choices=["customer", "business"])
@@ -27,8 +26,7 @@ class RegisterSerializer(serializers.ModelSerializer):
         attrs["username"] = attrs["username"].strip()
         attrs["email"] = attrs["email"].strip()
 
-        GUEST_LOGINS = ["andrey", "kevin"]
-        if attrs["username"] in GUEST_LOGINS and not User.objects.filter(username=attrs["username"]).exists():
+        if attrs["username"] in GUEST_LOGINS:
             raise serializers.ValidationError({"username": "Username already exists."})
 
         if attrs["password"] != attrs["repeated_password"]:
@@ -37,13 +35,33 @@ class RegisterSerializer(serializers.ModelSerializer):
         return attrs
 
     def create(self, validated_data):
-        """Create a new user from validated data."""
-        validated_data.pop("repeated_password")
-        validated_data.pop("type")
-        validated_data["username"] = validated_data["username"]
-        user = User.objects.create_user(**validated_data)
+        """Create user, typed profile and token in one transaction, relying on the unique constraints for duplicates."""
+        user = User(
+            username=User.normalize_username(validated_data["username"]),
+            email=User.objects.normalize_email(validated_data["email"]),
+        )
+        user.set_password(validated_data["password"])
+        user.profile_type = validated_data["type"]
+        try:
+            with transaction.atomic():
+                user.save()
+                Token.objects.create(user=user)
+        except IntegrityError:
+            errors = self.get_duplicate_errors(user)
+            if not errors:
+                raise
+            raise serializers.ValidationError(errors)
         return user
 
+    def get_duplicate_errors(self, user):
+        """Return the field errors for a username or email that is already taken."""
+        errors = {}
+        if User.objects.filter(username=user.username).exists():
+            errors["username"] = ["Username already exists."]
+        if Profile.objects.filter(email=user.email).exists():
+            errors["email"] = ["Email already exists."]
+        return errors
+
 
 class LoginSerializer(serializers.ModelSerializer):
     """Serializer for user login."""
@@ -60,29 +78,13 @@ class LoginSerializer(serializers.ModelSerializer):
         username = attrs.get("username").strip()
         password = attrs.get("password")
 
-        GUEST_LOGINS = {
-            "andrey": ("asdasd", "customer"),
-            "kevin": ("asdasd24", "business"),
-        }
-
         if username in GUEST_LOGINS:
-            guest_password, guest_type = GUEST_LOGINS[username]
-            if password == guest_password:
-                with transaction.atomic():
-                    user, created = User.objects.get_or_create(
-                        username=username, defaults={"email": f"{username}@guest.local"}
-                    )
-
-                    if created or not user.check_password(password):
-                        user.set_password(password)
-                        user.save()
-                        profile = user.profile
-                        profile.type = guest_type
-                        profile.save()
-                attrs["user"] = user
-                return attrs
-            else:
+            if not constant_time_compare(password, GUEST_LOGINS[username][0]):
+                raise serializers.ValidationError({"non_field_errors": "Invalid username or password."})
+            attrs["guest_login"] = get_guest_login(username)
+            if attrs["guest_login"] is None:
                 raise serializers.ValidationError({"non_field_errors": "Invalid username or password."})
+            return attrs
 
         user = authenticate(username=username, password=password)
         if user is None:
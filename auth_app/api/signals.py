@@ -1,13 +1,50 @@
-from django.db.models.signals import post_save
+from django.contrib.auth.models import User
+from django.db.models.signals import post_delete, post_save
 from django.dispatch import receiver
+from rest_framework.authtoken.models import Token
+from auth_app.guests import GUEST_LOGINS, invalidate_guest_logins
+from core.utils.authentication import CachedTokenAuthentication
 from profiles_app.models import Profile
 
 
 @receiver(post_save, sender=Profile)
-def edit_user_after_profile_update(sender, instance, **kwargs):
-    """Update user fields after profile update."""
+def edit_user_after_profile_update(sender, instance, created, **kwargs):
+    """Copy changed name and email fields of the profile to the user with update_fields."""
+    if created:
+        return
+    changed = [name for name in instance.get_changed_fields() if name in Profile.USER_SYNC_FIELDS]
+    if not changed:
+        return
     user = instance.user
-    user.first_name = instance.first_name
-    user.last_name = instance.last_name
-    user.email = instance.email
-    user.save()
+    for name in changed:
+        setattr(user, name, getattr(instance, name))
+    user.save(update_fields=changed)
+
+
+def invalidate_user_tokens(user_id):
+    """Drop the cached authentication of all tokens of a user."""
+    for key in Token.objects.filter(user_id=user_id).values_list("key", flat=True):
+        CachedTokenAuthentication.invalidate(key)
+
+
+@receiver(post_delete, sender=Token)
+def invalidate_deleted_token(sender, instance, **kwargs):
+    """Drop the cached authentication of a deleted token and the cached guest logins that may hand it out."""
+    CachedTokenAuthentication.invalidate(instance.key)
+    invalidate_guest_logins()
+
+
+@receiver(post_save, sender=User)
+def invalidate_tokens_after_user_update(sender, instance, created, **kwargs):
+    """Drop the cached authentication of a changed user, e.g. after deactivation."""
+    if not created:
+        invalidate_user_tokens(instance.pk)
+        if instance.username in GUEST_LOGINS:
+            invalidate_guest_logins()
+
+
+@receiver(post_save, sender=Profile)
+def invalidate_tokens_after_profile_type_change(sender, instance, created, **kwargs):
+    """Drop the cached authentication of a user whose profile type changed."""
+    if not created and instance.has_tracked_value("type") and instance.get_tracked_value("type") != instance.type:
+        invalidate_user_tokens(instance.user_id)
@@ -1,5 +1,4 @@
 from rest_framework.authtoken.models import Token
-from django.db import transaction
 from rest_framework.generics import CreateAPIView
 from rest_framework.permissions import AllowAny
 from rest_framework.response import Response
@@ -17,19 +16,14 @@ class RegisterView(CreateAPIView):
         """Create a new user and return token and user info."""
         serializer = self.get_serializer(data=request.data)
         serializer.is_valid(raise_exception=True)
-        with transaction.atomic():
-            type_value = serializer.validated_data["type"]
-            user = serializer.save()
-            user.profile.type = type_value
-            user.profile.save()
-            token, _ = Token.objects.get_or_create(user=user)
-            data = {
-                "token": token.key,
-                "username": user.username,
-                "email": user.email,
-                "user_id": user.id,
-            }
-            return Response(data, status=status.HTTP_201_CREATED)
+        user = serializer.save()
+        data = {
+            "token": user.auth_token.key,
+            "username": user.username,
+            "email": user.email,
+            "user_id": user.id,
+        }
+        return Response(data, status=status.HTTP_201_CREATED)
 
 
 class LoginView(CreateAPIView):
@@ -39,15 +33,17 @@ class LoginView(CreateAPIView):
     serializer_class = LoginSerializer
 
     def create(self, request, *args, **kwargs):
-        """Authenticate user and return token and user info."""
+        """Authenticate user and return token and user info, serving guest logins from cache."""
         serializer = self.get_serializer(data=request.data)
         serializer.is_valid(raise_exception=True)
-        user = serializer.validated_data["user"]
-        token, _ = Token.objects.get_or_create(user=user)
-        data = {
-            "token": token.key,
-            "username": user.username,
-            "email": user.email,
-            "user_id": user.id,
-        }
+        data = serializer.validated_data.get("guest_login")
+        if data is None:
+            user = serializer.validated_data["user"]
+            token, _ = Token.objects.get_or_create(user=user)
+            data = {
+                "token": token.key,
+                "username": user.username,
+                "email": user.email,
+                "user_id": user.id,
+            }
         return Response(data, status=status.HTTP_200_OK)
@@ -0,0 +1,73 @@
+from django.conf import settings
+from django.contrib.auth.hashers import make_password
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.db import IntegrityError, transaction
+from rest_framework.authtoken.models import Token
+
+# Public demo accounts: username -> (password, profile type)
+GUEST_LOGINS = {
+    "andrey": ("asdasd", "customer"),
+    "kevin": ("asdasd24", "business"),
+}
+
+
+def get_guest_cache_key(username):
+    """Return the cache key of the login response of a guest account."""
+    return f"guest-login:{username}"
+
+
+def invalidate_guest_logins():
+    """Drop the cached login responses of all guest accounts."""
+    cache.delete_many([get_guest_cache_key(username) for username in GUEST_LOGINS])
+
+
+def provision_guest_account(username):
+    """Create the guest user with its typed profile and token if missing and return the token."""
+    password, profile_type = GUEST_LOGINS[username]
+    user = User.objects.filter(username=username).first()
+    if user is None:
+        user = User(username=username, email=f"{username}@guest.local", password=make_password(password))
+        user.profile_type = profile_type
+        try:
+            with transaction.atomic():
+                user.save()
+        except IntegrityError:
+            user = User.objects.get(username=username)
+    elif not user.check_password(password) or user.profile.type != profile_type:
+        with transaction.atomic():
+            user.set_password(password)
+            user.save(update_fields=["password"])
+            profile = user.profile
+            profile.type = profile_type
+            profile.save()
+    token, _ = Token.objects.get_or_create(user=user)
+    return token
+
+
+def provision_guest_accounts():
+    """Provision all guest accounts and drop their cached login responses."""
+    for username in GUEST_LOGINS:
+        provision_guest_account(username)
+    invalidate_guest_logins()
+
+
+def get_guest_login(username):
+    """Return the login response of a guest account, or None if it is deactivated.
+
+    The account is provisioned if it is missing. The response is only cached if Django's cache is shared
+    between the workers (SHARED_CACHE), since invalidate_guest_logins cannot reach per-process caches.
+    """
+    cache_key = get_guest_cache_key(username)
+    data = cache.get(cache_key) if settings.SHARED_CACHE else None
+    if data is None:
+        token = Token.objects.select_related("user").filter(user__username=username).first()
+        if token is None:
+            token = provision_guest_account(username)
+        user = token.user
+        if not user.is_active:
+            return None
+        data = {"token": token.key, "username": user.username, "email": user.email, "user_id": user.id}
+        if settings.SHARED_CACHE:
+            cache.set(cache_key, data, settings.TOKEN_AUTH_CACHE_TTL)
+    return data
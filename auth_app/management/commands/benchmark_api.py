@@ -0,0 +1,369 @@
+import json
+import math
+import platform
+import random
+import subprocess
+import time
+from collections import defaultdict
+from decimal import Decimal
+import django
+from django.conf import settings
+from django.contrib.auth.hashers import make_password
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+from django.test import Client
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from rest_framework.authtoken.models import Token
+from auth_app.guests import invalidate_guest_logins
+from core.utils.authentication import CachedTokenAuthentication
+from core.utils.response_cache import bump_version
+from infos_app.models import PlatformStatistics
+from offers_app.models import Offer, OfferDetail
+from offers_app.search import get_search_backend
+from orders_app.models import BusinessOrderStats, Order
+from profiles_app.models import Profile
+from reviews_app.models import Review, ReviewAggregate
+
+BENCH_PASSWORD = "bench-password"
+OFFER_TYPES = ["basic", "standard", "premium"]
+OFFER_WORDS = ["logo", "website", "design", "texte", "fotografie", "seo", "shop", "app", "video", "branding"]
+
+
+class Command(BaseCommand):
+    help = (
+        "Benchmark aller API-Endpunkte mit realistischen Szenarien auf einem generierten Datensatz. "
+        "Schreibt p50/p95/p99, Requests/s und Queries/Request als JSON (Daten werden zurückgerollt)."
+    )
+
+    scenarios = ["browse", "order", "review", "offer", "login"]
+
+    def add_arguments(self, parser):
+        parser.add_argument("--scale", type=int, default=1, help="Größe des Datensatzes (1 = 10 Businesses).")
+        parser.add_argument("--iterations", type=int, default=20, help="Durchläufe pro Szenario.")
+        parser.add_argument("--scenarios", nargs="+", choices=self.scenarios, default=self.scenarios)
+        parser.add_argument("--seed", type=int, default=42, help="Seed für den Zufallsgenerator.")
+        parser.add_argument("--output", default="benchmark_api.json", help="Pfad der JSON-Ergebnisdatei.")
+        parser.add_argument("--compare", help="Frühere JSON-Ergebnisdatei, gegen die verglichen wird.")
+
+    def handle(self, *args, **options):
+        if options["scale"] < 1 or options["iterations"] < 1:
+            raise CommandError("--scale und --iterations müssen mindestens 1 sein.")
+        self.random = random.Random(options["seed"])
+        host = next((h.lstrip(".") for h in settings.ALLOWED_HOSTS if h != "*"), "localhost")
+        self.client = Client(HTTP_HOST=host)
+        self.token_keys = []
+        self.metrics = defaultdict(lambda: {"latencies": [], "queries": [], "errors": 0})
+        try:
+            with transaction.atomic():
+                start = time.perf_counter()
+                self.data = self.seed(options["scale"])
+                self.stdout.write(f"Datensatz in {time.perf_counter() - start:.1f} s angelegt: {self.data['counts']}")
+                for scenario in options["scenarios"]:
+                    self.current_scenario = scenario
+                    run = getattr(self, f"scenario_{scenario}")
+                    for i in range(options["iterations"]):
+                        run(i)
+                transaction.set_rollback(True)
+        finally:
+            invalidate_guest_logins()
+            for key in self.token_keys:
+                CachedTokenAuthentication.invalidate(key)
+            # The rollback never runs the on-commit invalidation, so drop the responses cached from the bench data.
+            for model in (Offer, OfferDetail, Profile, Review):
+                bump_version(model)
+        report = self.build_report(options)
+        with open(options["output"], "w", encoding="utf-8") as file:
+            json.dump(report, file, indent=2)
+        self.print_results(report["results"])
+        self.stdout.write(self.style.SUCCESS(f"Ergebnisse gespeichert in {options['output']}"))
+        if options["compare"]:
+            self.print_comparison(options["compare"], report["results"])
+
+    def seed(self, scale):
+        """Insert users, offers, orders and reviews in bulk and rebuild the counters for them."""
+        password = make_password(BENCH_PASSWORD)
+        businesses = self.create_users("bench_business", 10 * scale, "business", password)
+        customers = self.create_users("bench_customer", 50 * scale, "customer", password)
+        staff = self.create_users("bench_staff", 1, "customer", password, is_staff=True)[0]
+
+        offers, details = [], []
+        for business in businesses:
+            for _ in range(3):
+                words = self.random.sample(OFFER_WORDS, 3)
+                prices = sorted(Decimal(self.random.randint(20, 500)) for _ in OFFER_TYPES)
+                days = sorted((self.random.randint(1, 30) for _ in OFFER_TYPES), reverse=True)
+                offer = Offer(
+                    user=business,
+                    title=" ".join(words).title(),
+                    description=f"Professionelle {words[0]} und {words[1]} für {words[2]}",
+                    min_price=prices[0],
+                    min_delivery_time=days[-1],
+                )
+                offers.append(offer)
+                details.extend(
+                    OfferDetail(
+                        offer=offer,
+                        title=f"{offer_type.capitalize()} Paket",
+                        revisions=j,
+                        delivery_time_in_days=days[j],
+                        price=prices[j],
+                        features=["Feature"],
+                        offer_type=offer_type,
+                    )
+                    for j, offer_type in enumerate(OFFER_TYPES)
+                )
+        Offer.objects.bulk_create(offers)
+        OfferDetail.objects.bulk_create(details)
+        get_search_backend().index_new_offers(offers)
+
+        orders = []
+        for _ in range(200 * scale):
+            order = Order.from_offer_detail(self.random.choice(details), self.random.choice(customers))
+            order.status = self.random.choice(["in_progress", "completed", "cancelled"])
+            orders.append(order)
+        Order.objects.bulk_create(orders)
+        reviews = [
+            Review(business_user=business, reviewer=customer, rating=self.random.randint(1, 5), description="Gut")
+            for business in businesses
+            for customer in customers[:10]
+        ]
+        Review.objects.bulk_create(reviews)
+
+        PlatformStatistics.rebuild()
+        for business in businesses:
+            BusinessOrderStats.rebuild(business.id)
+            ReviewAggregate.rebuild(business.id)
+        return {
+            "businesses": businesses,
+            "customers": customers,
+            "staff": staff,
+            "offers": offers,
+            "details": details,
+            "counts": {
+                "users": len(businesses) + len(customers) + 1,
+                "offers": len(offers),
+                "offer_details": len(details),
+                "orders": len(orders),
+                "reviews": len(reviews),
+            },
+        }
+
+    def create_users(self, prefix, count, profile_type, password, is_staff=False):
+        """Insert users with typed profiles and tokens in bulk; the token key is stored on the user."""
+        users = User.objects.bulk_create(
+            User(username=f"{prefix}_{i}", email=f"{prefix}_{i}@bench.local", password=password, is_staff=is_staff)
+            for i in range(count)
+        )
+        Profile.objects.bulk_create(
+            Profile(user=user, username=user.username, email=user.email, type=profile_type) for user in users
+        )
+        tokens = Token.objects.bulk_create(Token(user=user, key=Token.generate_key()) for user in users)
+        for user, token in zip(users, tokens):
+            user.token_key = token.key
+        self.token_keys.extend(token.key for token in tokens)
+        return users
+
+    def request(self, label, method, path, user=None, data=None, expected=200):
+        """Send one request, record its latency and query count under label and return the response."""
+        headers = {"HTTP_AUTHORIZATION": f"Token {user.token_key}"} if user is not None else {}
+        body = json.dumps(data) if data is not None else ""
+        with CaptureQueriesContext(connection) as captured:
+            start = time.perf_counter()
+            response = self.client.generic(method, path, body, content_type="application/json", **headers)
+            elapsed = time.perf_counter() - start
+        metric = self.metrics[(self.current_scenario, label)]
+        metric["latencies"].append(elapsed)
+        metric["queries"].append(len(captured))
+        if response.status_code != expected:
+            metric["errors"] += 1
+            self.stderr.write(f"{method} {path} -> {response.status_code} (erwartet {expected})")
+        return response
+
+    def pick(self, items, i):
+        """Return the i-th item, wrapping around."""
+        return items[i % len(items)]
+
+    def scenario_browse(self, i):
+        """Browse offers, profiles, reviews and the public statistics like a visitor."""
+        customer = self.pick(self.data["customers"], i)
+        business = self.pick(self.data["businesses"], i)
+        offer = self.pick(self.data["offers"], i)
+        word = self.pick(OFFER_WORDS, i)
+        self.request("GET /api/offers/", "GET", "/api/offers/?page_size=6", customer)
+        self.request("GET /api/offers/?search=", "GET", f"/api/offers/?search={word}&ordering=relevance", customer)
+        self.request("GET /api/offers/?min_price=", "GET", "/api/offers/?min_price=100&ordering=min_price", customer)
+        self.request("GET /api/offers/?pagination=cursor", "GET", "/api/offers/?pagination=cursor", customer)
+        self.request("GET /api/offers/{id}/", "GET", f"/api/offers/{offer.id}/", customer)
+        detail = self.pick(self.data["details"], i)
+        self.request("GET /api/offerdetails/{id}/", "GET", f"/api/offerdetails/{detail.id}/", customer)
+        self.request("GET /api/profile/{id}/", "GET", f"/api/profile/{business.id}/", customer)
+        self.request("GET /api/profiles/business/", "GET", "/api/profiles/business/", customer)
+        self.request("GET /api/profiles/customer/", "GET", "/api/profiles/customer/?pagination=page", customer)
+        self.request("GET /api/reviews/", "GET", f"/api/reviews/?business_user_id={business.id}", customer)
+        self.request("GET /api/review-stats/{id}/", "GET", f"/api/review-stats/{business.id}/", customer)
+        self.request("GET /api/order-count/{id}/", "GET", f"/api/order-count/{business.id}/", customer)
+        completed_url = f"/api/completed-order-count/{business.id}/"
+        self.request("GET /api/completed-order-count/{id}/", "GET", completed_url, customer)
+        self.request("GET /api/order-stats/{id}/", "GET", f"/api/order-stats/{business.id}/", customer)
+        self.request("GET /api/base-info/", "GET", "/api/base-info/")
+
+    def scenario_order(self, i):
+        """Place, list, complete and delete orders, and check out a cart."""
+        customer = self.pick(self.data["customers"], i)
+        detail = self.pick(self.data["details"], i)
+        business = detail.offer.user
+        data = {"offer_detail_id": detail.id}
+        response = self.request("POST /api/orders/", "POST", "/api/orders/", customer, data, 201)
+        order_id = response.json().get("id")
+        self.request("GET /api/orders/", "GET", "/api/orders/", customer)
+        self.request("PATCH /api/orders/{id}/", "PATCH", f"/api/orders/{order_id}/", business, {"status": "completed"})
+        self.request("DELETE /api/orders/{id}/", "DELETE", f"/api/orders/{order_id}/", self.data["staff"], expected=204)
+        cart = [self.pick(self.data["details"], i + j * 7).id for j in range(3)]
+        self.request("POST /api/orders/bulk/", "POST", "/api/orders/bulk/", customer, {"offer_detail_ids": cart}, 201)
+
+    def scenario_review(self, i):
+        """Write, read, edit and delete a review for a business the customer has not reviewed yet."""
+        customers = self.data["customers"][10:]
+        business = self.pick(self.data["businesses"], i)
+        reviewer = self.pick(customers, i // len(self.data["businesses"]))
+        data = {"business_user": business.id, "rating": self.random.randint(1, 5), "description": "Benchmark"}
+        response = self.request("POST /api/reviews/", "POST", "/api/reviews/", reviewer, data, 201)
+        review_id = response.json().get("id")
+        self.request("GET /api/reviews/?reviewer_id=", "GET", f"/api/reviews/?reviewer_id={reviewer.id}", reviewer)
+        self.request("PATCH /api/reviews/{id}/", "PATCH", f"/api/reviews/{review_id}/", reviewer, {"rating": 5})
+        self.request("DELETE /api/reviews/{id}/", "DELETE", f"/api/reviews/{review_id}/", reviewer, expected=204)
+
+    def scenario_offer(self, i):
+        """Create, edit, read and delete an offer, and import a batch of offers."""
+        business = self.pick(self.data["businesses"], i)
+        response = self.request("POST /api/offers/", "POST", "/api/offers/", business, self.offer_payload(i), 201)
+        offer_id = response.json().get("id")
+        patch = {"title": f"Neu {i}", "details": [{"offer_type": "basic", "price": 10 + i}]}
+        self.request("PATCH /api/offers/{id}/", "PATCH", f"/api/offers/{offer_id}/", business, patch)
+        self.request("GET /api/offers/{id}/", "GET", f"/api/offers/{offer_id}/", business)
+        self.request("DELETE /api/offers/{id}/", "DELETE", f"/api/offers/{offer_id}/", business, expected=204)
+        batch = [self.offer_payload(f"{i}-{j}") for j in range(5)]
+        self.request("POST /api/offers/bulk/", "POST", "/api/offers/bulk/", business, batch, 201)
+
+    def scenario_login(self, i):
+        """Log in with a password and as guest, register a new account and edit the own profile."""
+        customer = self.pick(self.data["customers"], i)
+        data = {"username": customer.username, "password": BENCH_PASSWORD}
+        self.request("POST /api/login/", "POST", "/api/login/", data=data)
+        guest = {"username": "andrey", "password": "asdasd"}
+        self.request("POST /api/login/ (Gast)", "POST", "/api/login/", data=guest)
+        registration = {
+            "username": f"bench_registration_{i}",
+            "email": f"bench_registration_{i}@bench.local",
+            "password": BENCH_PASSWORD,
+            "repeated_password": BENCH_PASSWORD,
+            "type": "customer",
+        }
+        self.request("POST /api/registration/", "POST", "/api/registration/", data=registration, expected=201)
+        patch = {"location": f"Stadt {i}", "first_name": f"Bench {i}"}
+        self.request("PATCH /api/profile/{id}/", "PATCH", f"/api/profile/{customer.id}/", customer, patch)
+
+    def offer_payload(self, suffix):
+        """Return a valid offer with basic, standard and premium details."""
+        return {
+            "title": f"Benchmark Angebot {suffix}",
+            "description": "Angebot aus dem Benchmark",
+            "details": [
+                {
+                    "title": offer_type.capitalize(),
+                    "revisions": j,
+                    "delivery_time_in_days": 7 - j,
+                    "price": 100 + j * 50,
+                    "features": ["Feature"],
+                    "offer_type": offer_type,
+                }
+                for j, offer_type in enumerate(OFFER_TYPES)
+            ],
+        }
+
+    def build_report(self, options):
+        """Return the run metadata and the per-endpoint statistics."""
+        results = []
+        for (scenario, label), metric in self.metrics.items():
+            latencies = sorted(metric["latencies"])
+            results.append(
+                {
+                    "scenario": scenario,
+                    "endpoint": label,
+                    "requests": len(latencies),
+                    "errors": metric["errors"],
+                    "p50_ms": round(percentile(latencies, 50) * 1000, 3),
+                    "p95_ms": round(percentile(latencies, 95) * 1000, 3),
+                    "p99_ms": round(percentile(latencies, 99) * 1000, 3),
+                    "req_per_s": round(len(latencies) / sum(latencies), 1),
+                    "queries_per_request": round(sum(metric["queries"]) / len(latencies), 2),
+                }
+            )
+        return {
+            "meta": {
+                "created_at": timezone.now().isoformat(),
+                "git_commit": git_commit(),
+                "database": connection.vendor,
+                "python": platform.python_version(),
+                "django": django.get_version(),
+                "scale": options["scale"],
+                "iterations": options["iterations"],
+                "seed": options["seed"],
+                "password_hashing_policy": settings.PASSWORD_HASHING_POLICY,
+            },
+            "dataset": self.data["counts"],
+            "results": results,
+        }
+
+    def print_results(self, results):
+        """Print the statistics as a table."""
+        self.stdout.write(
+            f"{'Szenario':<8} {'Endpunkt':<44} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} "
+            f"{'Req/s':>8} {'Queries':>8} {'Fehler':>6}"
+        )
+        for row in results:
+            self.stdout.write(
+                f"{row['scenario']:<8} {row['endpoint']:<44} {row['p50_ms']:>8.2f} {row['p95_ms']:>8.2f} "
+                f"{row['p99_ms']:>8.2f} {row['req_per_s']:>8.1f} {row['queries_per_request']:>8.2f} {row['errors']:>6}"
+            )
+
+    def print_comparison(self, path, results):
+        """Print p50, p99 and queries per request against an earlier result file."""
+        with open(path, encoding="utf-8") as file:
+            baseline = {(row["scenario"], row["endpoint"]): row for row in json.load(file)["results"]}
+        self.stdout.write(f"\nVergleich mit {path}:")
+        self.stdout.write(f"{'Szenario':<8} {'Endpunkt':<44} {'p50 ms':>18} {'p99 ms':>18} {'Queries':>14}")
+        for row in results:
+            old = baseline.get((row["scenario"], row["endpoint"]))
+            if old is None:
+                self.stdout.write(f"{row['scenario']:<8} {row['endpoint']:<44} (neu)")
+                continue
+            self.stdout.write(
+                f"{row['scenario']:<8} {row['endpoint']:<44} "
+                f"{format_change(old['p50_ms'], row['p50_ms']):>18} {format_change(old['p99_ms'], row['p99_ms']):>18} "
+                f"{old['queries_per_request']:>6.2f} -> {row['queries_per_request']:<6.2f}"
+            )
+
+
+def percentile(values, p):
+    """Return the nearest-rank percentile of sorted values."""
+    return values[max(0, math.ceil(p / 100 * len(values)) - 1)]
+
+
+def format_change(old, new):
+    """Return 'old -> new (+x%)'."""
+    change = (new - old) / old * 100 if old else 0
+    return f"{old:.1f}->{new:.1f} ({change:+.0f}%)"
+
+
+def git_commit():
+    """Return the current git commit or None outside a git checkout."""
+    try:
+        result = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, cwd=settings.BASE_DIR, check=True
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return result.stdout.strip()
@@ -0,0 +1,139 @@
+import asyncio
+import statistics
+import time
+from concurrent.futures import ThreadPoolExecutor
+from wsgiref.util import setup_testing_defaults
+from django.conf import settings
+from django.contrib.auth.models import User
+from django.core.asgi import get_asgi_application
+from django.core.management.base import BaseCommand
+from django.core.wsgi import get_wsgi_application
+from rest_framework.authtoken.models import Token
+from orders_app.models import Order
+
+
+class Command(BaseCommand):
+    help = "Lasttest der Lese-Endpunkte: Requests/s und p99-Latenz über den ASGI- und den WSGI-Handler im Prozess."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--requests", type=int, default=500, help="Anzahl Requests pro Endpunkt und Handler.")
+        parser.add_argument("--concurrency", type=int, default=20, help="Gleichzeitige Requests (Tasks bzw. Threads).")
+
+    def handle(self, *args, **options):
+        self.host = next((h.lstrip(".") for h in settings.ALLOWED_HOSTS if h != "*"), "localhost")
+        business, customer, token = self.create_fixtures()
+        try:
+            self.stdout.write(f"{'Endpunkt':<36} {'Handler':<6} {'Req/s':>8} {'p50 ms':>8} {'p99 ms':>8}")
+            for path in self.endpoints(business):
+                for name, run in (("ASGI", self.run_asgi), ("WSGI", self.run_wsgi)):
+                    latencies, elapsed = run(path, token, options["requests"], options["concurrency"])
+                    p99 = statistics.quantiles(latencies, n=100)[98]
+                    self.stdout.write(
+                        f"{path:<36} {name:<6} {len(latencies) / elapsed:>8.1f} "
+                        f"{statistics.median(latencies) * 1000:>8.2f} {p99 * 1000:>8.2f}"
+                    )
+        finally:
+            User.objects.filter(pk__in=[business.pk, customer.pk]).delete()
+
+    def create_fixtures(self):
+        """Create a business and a customer with an order and a token; they are deleted afterwards."""
+        business = User.objects.create_user(username="bench_asgi_business", email="bench_asgi_business@bench.local")
+        business.profile.type = "business"
+        business.profile.save()
+        customer = User.objects.create_user(username="bench_asgi_customer", email="bench_asgi_customer@bench.local")
+        customer.profile.type = "customer"
+        customer.profile.save()
+        Order.objects.create(customer_user=customer, business_user=business, title="Bench", price=100)
+        return business, customer, Token.objects.create(user=customer).key
+
+    def endpoints(self, business):
+        """Return the read-only endpoints served by async views."""
+        return [
+            "/api/base-info/",
+            f"/api/order-count/{business.id}/",
+            f"/api/order-stats/{business.id}/",
+            "/api/profiles/business/",
+            "/api/profiles/customer/",
+        ]
+
+    def run_asgi(self, path, token, requests, concurrency):
+        """Send the requests through the ASGI handler from concurrent tasks of one event loop."""
+        application = get_asgi_application()
+        path_info, _, query = path.partition("?")
+        scope = {
+            "type": "http",
+            "asgi": {"version": "3.0"},
+            "http_version": "1.1",
+            "method": "GET",
+            "scheme": "http",
+            "path": path_info,
+            "raw_path": path_info.encode(),
+            "query_string": query.encode(),
+            "root_path": "",
+            "headers": [(b"host", self.host.encode()), (b"authorization", f"Token {token}".encode())],
+            "client": ("127.0.0.1", 0),
+            "server": (self.host, 80),
+        }
+
+        async def request():
+            """Run one request and return its latency."""
+            disconnected = asyncio.Event()
+            messages = iter([{"type": "http.request", "body": b"", "more_body": False}])
+
+            async def receive():
+                """Return the empty body, then wait for a disconnect that never comes."""
+                message = next(messages, None)
+                if message is None:
+                    await disconnected.wait()
+                return message
+
+            async def send(message):
+                """Check the status of the response."""
+                if message["type"] == "http.response.start" and message["status"] != 200:
+                    raise RuntimeError(f"{path} -> {message['status']}")
+
+            start = time.perf_counter()
+            await application(dict(scope), receive, send)
+            return time.perf_counter() - start
+
+        async def run():
+            """Run the requests with at most `concurrency` in flight."""
+            semaphore = asyncio.Semaphore(concurrency)
+
+            async def limited():
+                """Run one request once a slot is free."""
+                async with semaphore:
+                    return await request()
+
+            await asyncio.gather(*(limited() for _ in range(concurrency)))
+            start = time.perf_counter()
+            latencies = await asyncio.gather(*(limited() for _ in range(requests)))
+            return latencies, time.perf_counter() - start
+
+        return asyncio.run(run())
+
+    def run_wsgi(self, path, token, requests, concurrency):
+        """Send the requests through the WSGI handler from a thread pool, like a threaded WSGI server."""
+        application = get_wsgi_application()
+        path_info, _, query = path.partition("?")
+
+        def request(_):
+            """Run one request and return its latency."""
+            environ = {"PATH_INFO": path_info, "QUERY_STRING": query, "HTTP_AUTHORIZATION": f"Token {token}"}
+            environ["HTTP_HOST"] = self.host
+            setup_testing_defaults(environ)
+            statuses = []
+            start = time.perf_counter()
+            response = application(environ, lambda status, headers, exc_info=None: statuses.append(status))
+            b"".join(response)
+            response.close()
+            elapsed = time.perf_counter() - start
+            if not statuses[0].startswith("200"):
+                raise RuntimeError(f"{path} -> {statuses[0]}")
+            return elapsed
+
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            list(executor.map(request, range(concurrency)))
+            start = time.perf_counter()
+            latencies = list(executor.map(request, range(requests)))
+            return latencies, time.perf_counter() - start
@@ -0,0 +1,51 @@
+import time
+from django.conf import settings
+from django.contrib.auth.hashers import get_hasher, make_password
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.test.utils import override_settings
+from rest_framework.test import APIClient
+
+
+class Command(BaseCommand):
+    help = "Misst den Login-Durchsatz pro CPU-Kern für jede Passwort-Hashing-Policy."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--logins", type=int, default=20, help="Anzahl Logins pro Policy.")
+        parser.add_argument(
+            "--policies",
+            nargs="+",
+            choices=list(settings.PASSWORD_HASHING_POLICIES),
+            default=list(settings.PASSWORD_HASHING_POLICIES),
+            help="Zu messende Policies aus PASSWORD_HASHING_POLICIES.",
+        )
+
+    def handle(self, *args, **options):
+        host = next((h.lstrip(".") for h in settings.ALLOWED_HOSTS if h != "*"), "localhost")
+        client = APIClient(HTTP_HOST=host)
+        self.stdout.write(f"{'Policy':<8} {'Hasher':<40} {'ms/Login':>9} {'Logins/s/Kern':>14}")
+        for policy in options["policies"]:
+            with override_settings(PASSWORD_HASHERS=settings.PASSWORD_HASHING_POLICIES[policy]):
+                hasher = get_hasher()
+                try:
+                    make_password("bench-pw", hasher=hasher)
+                except ValueError as error:
+                    self.stdout.write(f"{policy:<8} übersprungen: {error}")
+                    continue
+                elapsed = self.measure(client, options["logins"])
+            self.stdout.write(f"{policy:<8} {type(hasher).__name__:<40} {elapsed * 1000:>9.2f} {1 / elapsed:>14.1f}")
+
+    def measure(self, client, logins):
+        """Return the average seconds per login of a user hashed with the preferred hasher."""
+        with transaction.atomic():
+            User.objects.create_user(username="bench_login", email="bench_login@bench.local", password="bench-pw")
+            data = {"username": "bench_login", "password": "bench-pw"}
+            start = time.perf_counter()
+            for _ in range(logins):
+                response = client.post("/api/login/", data, format="json")
+                if response.status_code != 200:
+                    raise RuntimeError(f"Login fehlgeschlagen: {response.status_code} {response.data}")
+            elapsed = time.perf_counter() - start
+            transaction.set_rollback(True)
+        return elapsed / logins
@@ -0,0 +1,41 @@
+import time
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.db import connection, transaction
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIClient
+
+
+class Command(BaseCommand):
+    help = "Misst Queries und Laufzeit pro Registrierung für Kunden- und Business-Konten."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--requests", type=int, default=50, help="Anzahl Registrierungen pro Profiltyp.")
+
+    def handle(self, *args, **options):
+        host = next((h.lstrip(".") for h in settings.ALLOWED_HOSTS if h != "*"), "localhost")
+        client = APIClient(HTTP_HOST=host)
+        self.stdout.write(f"{'Profiltyp':<12} {'Queries/Req':>11} {'ms/Req':>8}")
+        with transaction.atomic():
+            for profile_type in ("customer", "business"):
+                queries, elapsed = self.measure(client, profile_type, options["requests"])
+                self.stdout.write(f"{profile_type:<12} {queries:>11.2f} {elapsed * 1000:>8.2f}")
+            transaction.set_rollback(True)
+
+    def measure(self, client, profile_type, requests):
+        """Return the average queries and seconds per registration of the given profile type."""
+        start = time.perf_counter()
+        with CaptureQueriesContext(connection) as captured:
+            for i in range(requests):
+                data = {
+                    "username": f"bench_{profile_type}_{i}",
+                    "email": f"bench_{profile_type}_{i}@bench.local",
+                    "password": "bench-password",
+                    "repeated_password": "bench-password",
+                    "type": profile_type,
+                }
+                response = client.post("/api/registration/", data, format="json")
+                if response.status_code != 201:
+                    raise RuntimeError(f"Registrierung fehlgeschlagen: {response.status_code} {response.data}")
+        elapsed = time.perf_counter() - start
+        return len(captured) / requests, elapsed / requests
@@ -0,0 +1,93 @@
+import json
+import time
+from django.conf import settings
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.core.management.base import BaseCommand
+from django.db import connection, transaction
+from django.test.utils import CaptureQueriesContext
+from django.urls import resolve
+from rest_framework.authentication import TokenAuthentication
+from rest_framework.authtoken.models import Token
+from rest_framework.test import APIRequestFactory
+from core.utils.authentication import CachedTokenAuthentication
+from offers_app.models import Offer, OfferDetail
+from orders_app.models import Order
+from reviews_app.models import Review
+
+
+class Command(BaseCommand):
+    help = "Vergleicht Queries und Laufzeit pro Request mit TokenAuthentication und CachedTokenAuthentication."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--requests", type=int, default=200, help="Anzahl Requests pro Endpunkt und Variante.")
+
+    def handle(self, *args, **options):
+        with transaction.atomic():
+            fixtures = self.create_fixtures()
+            self.stdout.write(f"{'Endpunkt':<40} {'Authentifizierung':<28} {'Queries/Req':>11} {'ms/Req':>8}")
+            for method, path, data, token in self.endpoints(fixtures):
+                for auth_class in (TokenAuthentication, CachedTokenAuthentication):
+                    CachedTokenAuthentication.local_cache.clear()
+                    cache.clear()
+                    queries, elapsed = self.measure(method, path, data, token, auth_class, options["requests"])
+                    self.stdout.write(
+                        f"{method + ' ' + path.split('?')[0]:<40} {auth_class.__name__:<28} "
+                        f"{queries:>11.2f} {elapsed * 1000:>8.2f}"
+                    )
+            transaction.set_rollback(True)
+
+    def create_fixtures(self):
+        """Create users with tokens, an order and a review to run the endpoints against."""
+        business = User.objects.create_user(username="bench_business", email="bench_business@bench.local")
+        business.profile.type = "business"
+        business.profile.save()
+        customer = User.objects.create_user(username="bench_customer", email="bench_customer@bench.local")
+        customer.profile.type = "customer"
+        customer.profile.save()
+        offer = Offer.objects.create(user=business, title="Bench Offer", description="Bench")
+        detail = OfferDetail.objects.create(offer=offer, title="Basic", delivery_time_in_days=3, price=100)
+        order = Order.objects.create(customer_user=customer, business_user=business, title="Basic", price=100)
+        review = Review.objects.create(business_user=business, reviewer=customer, rating=5, description="Bench")
+        return {
+            "business": business,
+            "customer": customer,
+            "detail": detail,
+            "order": order,
+            "review": review,
+            "tokens": {user: Token.objects.create(user=user).key for user in (business, customer)},
+        }
+
+    def endpoints(self, fixtures):
+        """Return the (method, path, data, token) requests to benchmark."""
+        business, tokens = fixtures["business"], fixtures["tokens"]
+        business_token, customer_token = tokens[business], tokens[fixtures["customer"]]
+        return [
+            ("GET", "/api/orders/", None, customer_token),
+            ("POST", "/api/orders/", {"offer_detail_id": fixtures["detail"].id}, customer_token),
+            ("PATCH", f"/api/orders/{fixtures['order'].id}/", {"status": "in_progress"}, business_token),
+            ("GET", f"/api/reviews/?business_user_id={business.id}", None, customer_token),
+            ("PATCH", f"/api/reviews/{fixtures['review'].id}/", {"description": "Bench"}, customer_token),
+        ]
+
+    def measure(self, method, path, data, token, auth_class, requests):
+        """Return the average queries and seconds per request with the given authentication class."""
+        host = next((h.lstrip(".") for h in settings.ALLOWED_HOSTS if h != "*"), "localhost")
+        factory = APIRequestFactory()
+        match = resolve(path.split("?")[0])
+        view_func = match.func
+        initkwargs = {**view_func.initkwargs, "authentication_classes": [auth_class]}
+        if hasattr(view_func, "actions"):
+            view = view_func.cls.as_view(view_func.actions, **initkwargs)
+        else:
+            view = view_func.cls.as_view(**initkwargs)
+        headers = {"HTTP_AUTHORIZATION": f"Token {token}", "HTTP_HOST": host}
+        body = json.dumps(data) if data is not None else ""
+        start = time.perf_counter()
+        with CaptureQueriesContext(connection) as captured:
+            for _ in range(requests):
+                request = factory.generic(method, path, body, content_type="application/json", **headers)
+                response = view(request, *match.args, **match.kwargs)
+                response.render()
+        elapsed = time.perf_counter() - start
+        return len(captured) / requests, elapsed / requests
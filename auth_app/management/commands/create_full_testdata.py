@@ -1,5 +1,6 @@
 import random
 from django.core.management.base import BaseCommand
+from django.contrib.auth.hashers import make_password
 from django.contrib.auth.models import User
 from offers_app.models import Offer, OfferDetail
 from orders_app.models import Order
@@ -48,6 +49,8 @@ class Command(BaseCommand):
     help = "Erstellt vollständige Testdaten: 30 User (20 Kunden, 10 Businesses), je Business ein Offer mit 3 OfferDetails, Orders und Reviews."
 
     def handle(self, *args, **options):
+        # Das gemeinsame Passwort nur einmal hashen statt pro User
+        password = make_password("pass1234")
         with transaction.atomic():
             # 1. User und Profile anlegen
             kunden = []
@@ -55,13 +58,10 @@ class Command(BaseCommand):
             for vorname, nachname in KUNDEN_DATEN:
                 username = f"{vorname.lower()}.{nachname.lower()}"
                 email = f"{vorname.lower()}.{nachname.lower()}@beispiel.de"
-                user, created = User.objects.get_or_create(
+                user, _ = User.objects.get_or_create(
                     username=username,
-                    defaults={"email": email, "first_name": vorname, "last_name": nachname, "password": "pass1234"},
+                    defaults={"email": email, "first_name": vorname, "last_name": nachname, "password": password},
                 )
-                if created:
-                    user.set_password("pass1234")
-                    user.save()
                 profile, _ = Profile.objects.get_or_create(user=user)
                 profile.type = "customer"
                 profile.save()
@@ -69,13 +69,10 @@ class Command(BaseCommand):
             for firmenname, stadt in BUSINESS_DATEN:
                 username = f"{firmenname.lower()}_{stadt.lower()}"
                 email = f"{firmenname.lower()}@{stadt.lower()}.de"
-                user, created = User.objects.get_or_create(
+                user, _ = User.objects.get_or_create(
                     username=username,
-                    defaults={"email": email, "first_name": firmenname, "last_name": stadt, "password": "pass1234"},
+                    defaults={"email": email, "first_name": firmenname, "last_name": stadt, "password": password},
                 )
-                if created:
-                    user.set_password("pass1234")
-                    user.save()
                 profile, _ = Profile.objects.get_or_create(user=user)
                 profile.type = "business"
                 profile.save()
@@ -1,5 +1,6 @@
 import random
 from django.core.management.base import BaseCommand
+from django.contrib.auth.hashers import make_password
 from django.contrib.auth.models import User
 from reviews_app.models import Review
 from django.db import IntegrityError
@@ -10,16 +11,14 @@ class Command(BaseCommand):
 
     def handle(self, *args, **options):
         num_reviews_to_create = 20  # Wie viele Reviews sollen erstellt werden?
+        password = make_password("password123")  # Nur einmal hashen statt pro User
 
         # 1. Benutzer holen oder erstellen (Beispiel: 5 Business-User, 10 Reviewer)
         business_users = []
         for i in range(1, 6):
             user, created = User.objects.get_or_create(
-                username=f"business_user_{i}", defaults={"email": f"business{i}@example.com", "password": "password123"}
+                username=f"business_user_{i}", defaults={"email": f"business{i}@example.com", "password": password}
             )
-            if created:
-                user.set_password("password123")  # Passwort setzen, wenn neu erstellt
-                user.save()
             business_users.append(user)
             if created:
                 self.stdout.write(f"Business User '{user.username}' erstellt.")
@@ -27,11 +26,8 @@ class Command(BaseCommand):
         reviewers = []
         for i in range(1, 11):
             user, created = User.objects.get_or_create(
-                username=f"reviewer_{i}", defaults={"email": f"reviewer{i}@example.com", "password": "password123"}
+                username=f"reviewer_{i}", defaults={"email": f"reviewer{i}@example.com", "password": password}
             )
-            if created:
-                user.set_password("password123")  # Passwort setzen, wenn neu erstellt
-                user.save()
             reviewers.append(user)
             if created:
                 self.stdout.write(f"Reviewer '{user.username}' erstellt.")
@@ -0,0 +1,75 @@
+import shutil
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from core.utils.instrumentation import histogram_percentile, load_snapshots
+
+SORT_KEYS = {
+    "p95": lambda stats: (histogram_percentile(stats["histogram"], 95) or float("inf"), mean(stats, "total_time")),
+    "mean": lambda stats: mean(stats, "total_time"),
+    "max": lambda stats: stats["max_time"],
+    "total": lambda stats: stats["total_time"],
+    "queries": lambda stats: mean(stats, "queries"),
+}
+
+
+def mean(stats, field):
+    """Return the per-request mean of a summed field."""
+    return stats[field] / stats["requests"]
+
+
+def format_hit_rate(stats):
+    """Return the response cache hit rate of a route, or '-' if it is not cached."""
+    lookups = stats["cache_hits"] + stats["cache_misses"]
+    return f"{stats['cache_hits'] / lookups:.0%}" if lookups else "-"
+
+
+def format_bucket(value):
+    """Return a histogram bound in ms, or '>max' above the last bucket."""
+    return f"≤{value}" if value is not None else ">2500"
+
+
+class Command(BaseCommand):
+    help = (
+        "Zeigt die langsamsten Routen und doppelt ausgeführte SQL-Statements aus der Request-Instrumentierung "
+        "(REQUEST_INSTRUMENTATION=True) aller Worker-Prozesse."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--top", type=int, default=10, help="Anzahl der angezeigten Routen und Statements.")
+        parser.add_argument("--sort", choices=SORT_KEYS, default="p95", help="Sortierung der Routen.")
+        parser.add_argument("--reset", action="store_true", help="Gespeicherte Statistiken danach löschen.")
+
+    def handle(self, *args, **options):
+        directory = settings.REQUEST_INSTRUMENTATION_DIR
+        stats = load_snapshots(directory)
+        if not stats["routes"]:
+            self.stdout.write(f"Keine Statistiken in {directory} gefunden.")
+            return
+        routes = sorted(stats["routes"].items(), key=lambda item: SORT_KEYS[options["sort"]](item[1]), reverse=True)
+        self.stdout.write(f"Langsamste Routen (nach {options['sort']}):")
+        self.stdout.write(
+            f"{'Route':<50} {'Requests':>8} {'Ø ms':>8} {'p50 ms':>7} {'p95 ms':>7} {'max ms':>8} "
+            f"{'Queries':>8} {'DB ms':>8} {'Ser. ms':>8} {'Cache':>6}"
+        )
+        for route, route_stats in routes[: options["top"]]:
+            histogram = route_stats["histogram"]
+            self.stdout.write(
+                f"{route:<50} {route_stats['requests']:>8} {mean(route_stats, 'total_time') * 1000:>8.1f} "
+                f"{format_bucket(histogram_percentile(histogram, 50)):>7} "
+                f"{format_bucket(histogram_percentile(histogram, 95)):>7} {route_stats['max_time'] * 1000:>8.1f} "
+                f"{mean(route_stats, 'queries'):>8.1f} {mean(route_stats, 'db_time') * 1000:>8.1f} "
+                f"{mean(route_stats, 'serializer_time') * 1000:>8.1f} {format_hit_rate(route_stats):>6}"
+            )
+
+        duplicates = sorted(stats["duplicates"], key=lambda entry: entry["executions"], reverse=True)
+        self.stdout.write("\nDoppelt ausgeführte SQL-Statements (mögliche N+1-Abfragen):")
+        if not duplicates:
+            self.stdout.write("Keine gefunden.")
+        for entry in duplicates[: options["top"]]:
+            self.stdout.write(
+                f"{entry['executions']}x in {entry['requests']} Requests, {entry['route']}:\n    {entry['sql']}"
+            )
+
+        if options["reset"]:
+            shutil.rmtree(directory, ignore_errors=True)
+            self.stdout.write(self.style.SUCCESS(f"Statistiken in {directory} gelöscht."))
@@ -0,0 +1,121 @@
+from asgiref.sync import async_to_sync, iscoroutinefunction
+from django.conf import settings
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+from django.test.utils import CaptureQueriesContext
+from django.urls import resolve
+from rest_framework.test import APIRequestFactory, force_authenticate
+from offers_app.models import Offer, OfferDetail
+from orders_app.models import Order
+from reviews_app.models import Review
+
+
+class Command(BaseCommand):
+    help = "Führt EXPLAIN für die SQL-Abfragen aller GET-Endpunkte aus und meldet Full Table Scans."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--fail-on-scan", action="store_true", help="Mit Fehler beenden, wenn Scans gefunden werden.")
+        parser.add_argument("--verbose-plans", action="store_true", help="Vollständige Query-Pläne ausgeben.")
+
+    def handle(self, *args, **options):
+        if connection.vendor not in ("sqlite", "postgresql"):
+            raise CommandError(f"EXPLAIN-Auswertung für '{connection.vendor}' wird nicht unterstützt.")
+        with transaction.atomic():
+            fixtures = self.create_fixtures()
+            findings = []
+            for path, user in self.endpoints(fixtures):
+                findings += self.explain_endpoint(path, user, options["verbose_plans"])
+            transaction.set_rollback(True)
+        if findings:
+            self.stdout.write(self.style.WARNING(f"{len(findings)} Full Table Scans gefunden."))
+            if options["fail_on_scan"]:
+                raise CommandError("Full Table Scans gefunden.")
+        else:
+            self.stdout.write(self.style.SUCCESS("Keine Full Table Scans gefunden."))
+
+    def create_fixtures(self):
+        """Create a minimal dataset so every endpoint runs its real queries."""
+        business = User.objects.create_user(username="explain_business", email="explain_business@explain.local")
+        business.profile.type = "business"
+        business.profile.save()
+        customer = User.objects.create_user(username="explain_customer", email="explain_customer@explain.local")
+        customer.profile.type = "customer"
+        customer.profile.save()
+        offer = Offer.objects.create(user=business, title="Explain Offer", description="Explain")
+        detail = OfferDetail.objects.create(
+            offer=offer, title="Basic", delivery_time_in_days=3, price=100, offer_type="basic"
+        )
+        Order.objects.create(customer_user=customer, business_user=business, title="Basic", price=100)
+        Review.objects.create(business_user=business, reviewer=customer, rating=5, description="Explain")
+        return {"business": business, "customer": customer, "offer": offer, "detail": detail}
+
+    def endpoints(self, fixtures):
+        """Return the GET requests (path, user) that back the API."""
+        business, customer = fixtures["business"], fixtures["customer"]
+        return [
+            ("/api/offers/", None),
+            ("/api/offers/?ordering=min_price", None),
+            (f"/api/offers/?creator_id={business.id}&min_price=50&max_delivery_time=7", None),
+            ("/api/offers/?search=explain", None),
+            (f"/api/offers/{fixtures['offer'].id}/", customer),
+            (f"/api/offerdetails/{fixtures['detail'].id}/", customer),
+            ("/api/orders/", customer),
+            ("/api/orders/", business),
+            (f"/api/order-count/{business.id}/", customer),
+            (f"/api/completed-order-count/{business.id}/", customer),
+            (f"/api/order-stats/{business.id}/", customer),
+            (f"/api/reviews/?business_user_id={business.id}", customer),
+            (f"/api/reviews/?reviewer_id={customer.id}&ordering=rating", customer),
+            (f"/api/review-stats/{business.id}/", customer),
+            ("/api/profiles/business/?ordering=-average_rating", customer),
+            ("/api/profiles/business/", customer),
+            ("/api/profiles/customer/", customer),
+            (f"/api/profile/{business.id}/", customer),
+            ("/api/base-info/", None),
+        ]
+
+    def explain_endpoint(self, path, user, verbose):
+        """Run the endpoint, EXPLAIN every SELECT it issued and return the scans found."""
+        host = next((h.lstrip(".") for h in settings.ALLOWED_HOSTS if h != "*"), "localhost")
+        request = APIRequestFactory().get(path, HTTP_HOST=host)
+        if user is not None:
+            force_authenticate(request, user=user)
+        match = resolve(path.split("?")[0])
+        view = async_to_sync(match.func) if iscoroutinefunction(match.func) else match.func
+        with CaptureQueriesContext(connection) as captured:
+            response = view(request, *match.args, **match.kwargs)
+            response.render()
+        label = f"{path} ({user.username if user else 'anonym'})"
+        self.stdout.write(self.style.MIGRATE_HEADING(f"{label} -> {response.status_code}, {len(captured)} Queries"))
+        findings = []
+        for query in captured.captured_queries:
+            sql = query["sql"]
+            if not sql.lstrip().upper().startswith("SELECT"):
+                continue
+            plan = self.explain(sql)
+            scans = [line for line in plan if self.is_full_scan(line)]
+            if verbose:
+                self.stdout.write(f"  {sql}")
+                for line in plan:
+                    self.stdout.write(f"    {line}")
+            for line in scans:
+                self.stdout.write(self.style.WARNING(f"  SCAN: {line}"))
+                self.stdout.write(f"    in: {sql[:200]}")
+                findings.append((label, line, sql))
+        return findings
+
+    def explain(self, sql):
+        """Return the query plan lines for the given SQL statement."""
+        with connection.cursor() as cursor:
+            if connection.vendor == "sqlite":
+                cursor.execute(f"EXPLAIN QUERY PLAN {sql}")
+                return [row[-1] for row in cursor.fetchall()]
+            cursor.execute(f"EXPLAIN {sql}")
+            return [row[0] for row in cursor.fetchall()]
+
+    def is_full_scan(self, line):
+        """Return whether a plan line reads a whole table without an index."""
+        if connection.vendor == "sqlite":
+            return line.startswith("SCAN ") and " USING " not in line
+        return "Seq Scan" in line
@@ -0,0 +1,10 @@
+from django.core.management.base import BaseCommand
+from auth_app.guests import GUEST_LOGINS, provision_guest_accounts
+
+
+class Command(BaseCommand):
+    help = "Legt die Gast-Accounts mit Profiltyp und Token an bzw. repariert sie (idempotent, nach jedem Deployment)."
+
+    def handle(self, *args, **options):
+        provision_guest_accounts()
+        self.stdout.write(self.style.SUCCESS(f"{len(GUEST_LOGINS)} Gast-Accounts bereitgestellt."))
@@ -0,0 +1,67 @@
+import json
+import os
+import tempfile
+from io import StringIO
+from django.contrib.auth.models import User
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+from core.utils.response_cache import get_versions
+from offers_app.models import Offer, OfferDetail
+from profiles_app.models import Profile
+from reviews_app.models import Review
+
+
+class BenchmarkApiCommandTests(TestCase):
+    """Tests for the benchmark_api management command."""
+
+    def setUp(self):
+        """Create temporary files for the result and the baseline report."""
+        self.output = self.temporary_file()
+        self.baseline = self.temporary_file()
+
+    def temporary_file(self):
+        """Return the path of a temporary JSON file that is removed after the test."""
+        handle, path = tempfile.mkstemp(suffix=".json")
+        os.close(handle)
+        self.addCleanup(os.remove, path)
+        return path
+
+    def run_benchmark(self, *args, output=None, stdout=None):
+        """Run a small benchmark and return the parsed report."""
+        output = output or self.output
+        stdout = stdout or StringIO()
+        call_command("benchmark_api", "--iterations", "2", "--output", output, *args, stdout=stdout, stderr=StringIO())
+        with open(output, encoding="utf-8") as file:
+            return json.load(file)
+
+    def test_report_covers_all_scenarios_without_errors(self):
+        """Test that every scenario is measured, no request fails and the report is machine-readable."""
+        report = self.run_benchmark()
+        scenarios = {row["scenario"] for row in report["results"]}
+        self.assertEqual(scenarios, {"browse", "order", "review", "offer", "login"})
+        self.assertEqual([row["endpoint"] for row in report["results"] if row["errors"]], [])
+        for row in report["results"]:
+            self.assertEqual(row["requests"], 2)
+            self.assertLessEqual(row["p50_ms"], row["p99_ms"])
+        self.assertEqual(report["meta"]["database"], "sqlite")
+        self.assertEqual(report["dataset"]["offers"], 30)
+
+    def test_rolls_back_data(self):
+        """Test that the generated dataset and the written requests are rolled back."""
+        self.run_benchmark("--scenarios", "login", "order")
+        self.assertFalse(User.objects.filter(username__startswith="bench_").exists())
+
+    @override_settings(RESPONSE_CACHE_TIMEOUT=300)
+    def test_drops_cached_responses_of_the_rolled_back_data(self):
+        """Test that the responses cached during the run are invalidated although the rollback skips on_commit."""
+        models = (Offer, OfferDetail, Profile, Review)
+        versions = get_versions(models)
+        self.run_benchmark("--scenarios", "browse")
+        self.assertTrue(all(new != old for new, old in zip(get_versions(models), versions)))
+
+    def test_compare_with_previous_run(self):
+        """Test that a previous report is printed as baseline next to the new results."""
+        self.run_benchmark("--scenarios", "browse", output=self.baseline)
+        out = StringIO()
+        self.run_benchmark("--scenarios", "browse", "--compare", self.baseline, stdout=out)
+        self.assertIn("GET /api/base-info/", out.getvalue().split(f"Vergleich mit {self.baseline}")[1])
@@ -0,0 +1,20 @@
+from io import StringIO
+from django.core.management import call_command
+from django.test import TestCase
+from django.contrib.auth.models import User
+
+
+class ExplainApiQueriesCommandTests(TestCase):
+    """Tests for the explain_api_queries management command."""
+
+    def test_reports_no_full_scans(self):
+        """Test that no API endpoint query needs a full table scan."""
+        out = StringIO()
+        call_command("explain_api_queries", "--fail-on-scan", stdout=out)
+        self.assertIn("/api/offers/", out.getvalue())
+        self.assertIn("Keine Full Table Scans gefunden.", out.getvalue())
+
+    def test_rolls_back_fixture_data(self):
+        """Test that the fixture data created for EXPLAIN is rolled back."""
+        call_command("explain_api_queries", stdout=StringIO())
+        self.assertFalse(User.objects.filter(username__startswith="explain_").exists())
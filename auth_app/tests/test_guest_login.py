@@ -0,0 +1,138 @@
+import threading
+from io import StringIO
+from unittest.mock import patch
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.core.management import call_command
+from django.db import connection
+from django.test import TransactionTestCase, override_settings, skipUnlessDBFeature
+from django.urls import reverse
+from rest_framework.authtoken.models import Token
+from rest_framework.test import APITestCase
+from auth_app.guests import get_guest_cache_key, provision_guest_account
+from core.utils.test_client import JSONAPIClient
+from infos_app.models import PlatformStatistics
+
+
+class TestGuestLogin(APITestCase):
+    """Test cases for the provisioned guest accounts and the cached guest login."""
+
+    client_class = JSONAPIClient
+
+    def setUp(self):
+        """Drop cached guest logins of earlier tests."""
+        cache.clear()
+
+    def login(self, username="andrey", password="asdasd"):
+        """Log in through the API and return the response."""
+        return self.client.post(reverse("login"), {"username": username, "password": password})
+
+    def test_provision_command_is_idempotent(self):
+        """Test that provisioning twice creates each guest with profile type and token exactly once."""
+        business_profile_count = PlatformStatistics.load().business_profile_count
+        call_command("provision_guest_accounts", stdout=StringIO())
+        call_command("provision_guest_accounts", stdout=StringIO())
+        users = User.objects.filter(username__in=["andrey", "kevin"]).select_related("profile")
+        types = {user.username: user.profile.type for user in users}
+        self.assertEqual(types, {"andrey": "customer", "kevin": "business"})
+        self.assertEqual(Token.objects.filter(user__in=users).count(), 2)
+        self.assertEqual(PlatformStatistics.load().business_profile_count, business_profile_count + 1)
+
+    def test_provision_repairs_guest(self):
+        """Test that provisioning resets a changed guest password and profile type."""
+        call_command("provision_guest_accounts", stdout=StringIO())
+        user = User.objects.get(username="kevin")
+        user.set_password("changed")
+        user.save()
+        user.profile.type = "customer"
+        user.profile.save()
+        call_command("provision_guest_accounts", stdout=StringIO())
+        user = User.objects.select_related("profile").get(username="kevin")
+        self.assertTrue(user.check_password("asdasd24"))
+        self.assertEqual(user.profile.type, "business")
+
+    @override_settings(SHARED_CACHE=True)
+    def test_cached_guest_login_runs_no_queries(self):
+        """Test that repeated guest logins are served from cache without queries, hashing or writes."""
+        call_command("provision_guest_accounts", stdout=StringIO())
+        first = self.login()
+        with self.assertNumQueries(0):
+            second = self.login()
+        self.assertEqual(second.status_code, 200)
+        self.assertEqual(second.data, first.data)
+        self.assertEqual(second.data["token"], Token.objects.get(user__username="andrey").key)
+
+    def test_wrong_guest_password_creates_nothing(self):
+        """Test that a wrong guest password is rejected without provisioning the account."""
+        response = self.login(password="asdasd24")
+        self.assertEqual(response.status_code, 400)
+        self.assertFalse(User.objects.filter(username="andrey").exists())
+
+    def test_per_process_cache_is_skipped(self):
+        """Test that guest logins are not cached in a per-process cache, which other workers cannot invalidate."""
+        call_command("provision_guest_accounts", stdout=StringIO())
+        self.assertEqual(self.login().status_code, 200)
+        self.assertIsNone(cache.get(get_guest_cache_key("andrey")))
+
+    @override_settings(SHARED_CACHE=True)
+    def test_deactivated_guest_is_rejected(self):
+        """Test that a deactivated guest can no longer log in, also after its login was cached."""
+        self.assertEqual(self.login().status_code, 200)
+        user = User.objects.get(username="andrey")
+        user.is_active = False
+        user.save()
+        self.assertEqual(self.login().status_code, 400)
+        self.assertIsNone(cache.get(get_guest_cache_key("andrey")))
+
+    @override_settings(SHARED_CACHE=True)
+    def test_deleted_token_is_not_served(self):
+        """Test that a deleted guest token drops the cached login and the next login returns a working token."""
+        old_key = self.login().data["token"]
+        Token.objects.filter(key=old_key).delete()
+        response = self.login()
+        self.assertNotEqual(response.data["token"], old_key)
+        self.client.credentials(HTTP_AUTHORIZATION=f"Token {response.data['token']}")
+        self.assertEqual(self.client.get(reverse("order-list")).status_code, 200)
+
+
+    def test_provision_race_reuses_winner(self):
+        """Test that a provisioning that loses the insert race reuses the existing guest instead of duplicating it."""
+        winner = provision_guest_account("kevin")
+        business_profile_count = PlatformStatistics.load().business_profile_count
+        with patch.object(User.objects, "filter", return_value=User.objects.none()):
+            token = provision_guest_account("kevin")
+        self.assertEqual(token, winner)
+        self.assertEqual(User.objects.filter(username="kevin").count(), 1)
+        self.assertEqual(Token.objects.filter(user__username="kevin").count(), 1)
+        self.assertEqual(PlatformStatistics.load().business_profile_count, business_profile_count)
+
+
+@skipUnlessDBFeature("test_db_allows_multiple_connections")
+class TestParallelGuestLogin(TransactionTestCase):
+    """Test cases for guest logins racing to provision the account on a database with concurrent writers."""
+
+    def test_parallel_first_logins_create_one_user_and_token(self):
+        """Test that parallel first logins all succeed with one user and one token."""
+        cache.clear()
+        barrier = threading.Barrier(8)
+        responses = []
+
+        def login():
+            """Log in as guest after all threads are ready."""
+            client = JSONAPIClient()
+            barrier.wait()
+            try:
+                responses.append(client.post(reverse("login"), {"username": "kevin", "password": "asdasd24"}))
+            finally:
+                connection.close()
+
+        threads = [threading.Thread(target=login) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual([response.status_code for response in responses], [200] * 8)
+        self.assertEqual(User.objects.filter(username="kevin").count(), 1)
+        self.assertEqual(Token.objects.filter(user__username="kevin").count(), 1)
+        self.assertEqual({response.data["token"] for response in responses}, {Token.objects.get().key})
+        self.assertEqual(PlatformStatistics.load().business_profile_count, 1)
@@ -1,6 +1,7 @@
 from rest_framework.test import APITestCase
 from django.urls import reverse
 from django.contrib.auth.models import User
+from django.core.cache import cache
 from profiles_app.models import Profile
 from core.utils.test_client import JSONAPIClient
 
@@ -10,6 +11,10 @@ class TestLogin(APITestCase):
 
     client_class = JSONAPIClient
 
+    def setUp(self):
+        """Drop cached guest logins of earlier tests."""
+        cache.clear()
+
     def test_login_success(self):
         """Test successful login with valid credentials."""
         user = User.objects.create_user(username="loginuser", email="login@mail.de", password="pw123")
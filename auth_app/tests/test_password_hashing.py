@@ -0,0 +1,50 @@
+from django.conf import settings
+from django.contrib.auth.hashers import get_hasher, make_password
+from django.contrib.auth.models import User
+from django.test import override_settings
+from django.urls import reverse
+from rest_framework.test import APITestCase
+from core.utils.test_client import JSONAPIClient
+
+SCRYPT_POLICY = settings.PASSWORD_HASHING_POLICIES["scrypt"]
+
+
+@override_settings(PASSWORD_PBKDF2_ITERATIONS=1000, PASSWORD_SCRYPT_WORK_FACTOR=2**4)
+class TestPasswordHashingPolicy(APITestCase):
+    """Test cases for the configurable password hashing policy and the re-hash on login."""
+
+    client_class = JSONAPIClient
+
+    def login(self, username, password):
+        """Log in through the API and return the reloaded user."""
+        response = self.client.post(reverse("login"), {"username": username, "password": password})
+        self.assertEqual(response.status_code, 200)
+        return User.objects.get(username=username)
+
+    def test_test_suite_uses_fast_hasher(self):
+        """Test that the test suite hashes passwords with the fast policy."""
+        self.assertEqual(settings.PASSWORD_HASHING_POLICY, "fast")
+        self.assertEqual(get_hasher().algorithm, "md5")
+
+    @override_settings(PASSWORD_HASHERS=SCRYPT_POLICY)
+    def test_login_upgrades_older_algorithm(self):
+        """Test that a PBKDF2 hash is re-hashed with the preferred scrypt hasher on login."""
+        password = make_password("pw123", hasher="pbkdf2_sha256")
+        User.objects.create(username="legacy", email="legacy@mail.de", password=password)
+        user = self.login("legacy", "pw123")
+        self.assertTrue(user.password.startswith("scrypt$16$"))
+        self.assertTrue(user.check_password("pw123"))
+
+    @override_settings(PASSWORD_HASHERS=SCRYPT_POLICY)
+    def test_login_upgrades_changed_cost_parameters(self):
+        """Test that a hash with outdated cost parameters is re-hashed on login."""
+        User.objects.create_user(username="tuned", email="tuned@mail.de", password="pw123")
+        with override_settings(PASSWORD_SCRYPT_WORK_FACTOR=2**5):
+            user = self.login("tuned", "pw123")
+        self.assertTrue(user.password.startswith("scrypt$32$"))
+
+    @override_settings(PASSWORD_HASHERS=SCRYPT_POLICY)
+    def test_current_hash_is_not_rewritten(self):
+        """Test that a login with an up-to-date hash does not write the password."""
+        user = User.objects.create_user(username="current", email="current@mail.de", password="pw123")
+        self.assertEqual(self.login("current", "pw123").password, user.password)
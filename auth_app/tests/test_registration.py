@@ -164,3 +164,39 @@ class TestRegistration(APITestCase):
         self.assertEqual(response.status_code, 400)
         self.assertIn("username", response.data)
         self.assertIn("already exists", str(response.data["username"]).lower())
+
+    def test_registration_query_count(self):
+        """Test that registration inserts user, typed profile and token without pre-check SELECTs or re-saves."""
+        data = {
+            "username": "counted",
+            "email": "counted@mail.de",
+            "password": "testpass123",
+            "repeated_password": "testpass123",
+            "type": "customer",
+        }
+        with self.assertNumQueries(5):
+            response = self.client.post(reverse("register"), data)
+        self.assertEqual(response.status_code, 201)
+        data.update(username="counted_business", email="business@mail.de", type="business")
+        with self.assertNumQueries(8):
+            response = self.client.post(reverse("register"), data)
+        self.assertEqual(response.status_code, 201)
+        user = User.objects.get(username="counted_business")
+        self.assertEqual(user.profile.type, "business")
+        self.assertEqual(user.auth_token.key, response.data["token"])
+        self.assertEqual(user.order_stats.in_progress_count, 0)
+
+    def test_registration_duplicate_rolls_back(self):
+        """Test that a duplicate email caught by the unique constraint returns 400 and creates no user."""
+        User.objects.create_user(username="first", email="dupe@mail.de", password="pw")
+        data = {
+            "username": "second",
+            "email": "dupe@MAIL.de",
+            "password": "pw123",
+            "repeated_password": "pw123",
+            "type": "customer",
+        }
+        response = self.client.post(reverse("register"), data)
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.data, {"email": ["Email already exists."]})
+        self.assertFalse(User.objects.filter(username="second").exists())
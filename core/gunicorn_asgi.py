@@ -0,0 +1,16 @@
+"""
+Gunicorn settings for serving the ASGI application with uvicorn workers.
+
+Usage: gunicorn -c core/gunicorn_asgi.py core.asgi:application
+Requires: pip install gunicorn uvicorn
+"""
+
+import multiprocessing
+import os
+
+bind = os.environ.get("GUNICORN_BIND", "0.0.0.0:8000")
+workers = int(os.environ.get("GUNICORN_WORKERS", multiprocessing.cpu_count()))
+worker_class = "uvicorn.workers.UvicornWorker"
+# Async views share one event loop per worker, so a slow client must not hold a worker for long
+timeout = int(os.environ.get("GUNICORN_TIMEOUT", 30))
+keepalive = int(os.environ.get("GUNICORN_KEEPALIVE", 5))
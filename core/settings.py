@@ -13,6 +13,9 @@ https://docs.djangoproject.com/en/5.2/ref/settings/
 from pathlib import Path
 import environ
 import os
+import sys
+import tempfile
+from django.core.exceptions import ImproperlyConfigured
 
 # Set up environment variables
 BASE_DIR = Path(__file__).resolve().parent.parent
@@ -52,6 +55,7 @@ INSTALLED_APPS = [
 ]
 
 MIDDLEWARE = [
+    "core.utils.instrumentation.RequestInstrumentationMiddleware",
     "django.middleware.security.SecurityMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
     "corsheaders.middleware.CorsMiddleware",
@@ -88,6 +92,17 @@ WSGI_APPLICATION = "core.wsgi.application"
 DATABASES = {"default": env.db(default=f"sqlite:///{BASE_DIR / 'db.sqlite3'}")}
 
 
+# Cache
+# https://docs.djangoproject.com/en/5.2/ref/settings/#caches
+
+CACHES = {"default": env.cache("CACHE_URL", default="locmemcache://")}
+PROCESS_LOCAL_CACHE_BACKENDS = (
+    "django.core.cache.backends.locmem.LocMemCache",
+    "django.core.cache.backends.dummy.DummyCache",
+)
+SHARED_CACHE = CACHES["default"]["BACKEND"] not in PROCESS_LOCAL_CACHE_BACKENDS
+
+
 # Password validation
 # https://docs.djangoproject.com/en/5.2/ref/settings/#auth-password-validators
 
@@ -107,6 +122,54 @@ AUTH_PASSWORD_VALIDATORS = [
 ]
 
 
+# Password hashing
+# https://docs.djangoproject.com/en/5.2/topics/auth/passwords/
+# The first hasher of the policy hashes new passwords; the others still verify older hashes, which are re-hashed
+# with the preferred hasher and the current cost parameters on the next successful login.
+
+PASSWORD_HASHING_POLICIES = {
+    "pbkdf2": [
+        "core.utils.hashers.ConfigurablePBKDF2PasswordHasher",
+        "core.utils.hashers.ConfigurableScryptPasswordHasher",
+        "core.utils.hashers.ConfigurableArgon2PasswordHasher",
+        "django.contrib.auth.hashers.PBKDF2SHA1PasswordHasher",
+    ],
+    "scrypt": [
+        "core.utils.hashers.ConfigurableScryptPasswordHasher",
+        "core.utils.hashers.ConfigurablePBKDF2PasswordHasher",
+        "core.utils.hashers.ConfigurableArgon2PasswordHasher",
+        "django.contrib.auth.hashers.PBKDF2SHA1PasswordHasher",
+    ],
+    "argon2": [
+        "core.utils.hashers.ConfigurableArgon2PasswordHasher",
+        "core.utils.hashers.ConfigurableScryptPasswordHasher",
+        "core.utils.hashers.ConfigurablePBKDF2PasswordHasher",
+        "django.contrib.auth.hashers.PBKDF2SHA1PasswordHasher",
+    ],
+    # Insecure, only for the test suite and local test data
+    "fast": [
+        "django.contrib.auth.hashers.MD5PasswordHasher",
+        "core.utils.hashers.ConfigurableScryptPasswordHasher",
+        "core.utils.hashers.ConfigurablePBKDF2PasswordHasher",
+        "core.utils.hashers.ConfigurableArgon2PasswordHasher",
+        "django.contrib.auth.hashers.PBKDF2SHA1PasswordHasher",
+    ],
+}
+TESTING = sys.argv[1:2] == ["test"]
+PASSWORD_HASHING_POLICY = env("PASSWORD_HASHING_POLICY", default="fast" if TESTING else "scrypt")
+if PASSWORD_HASHING_POLICY not in PASSWORD_HASHING_POLICIES:
+    raise ImproperlyConfigured(f"Unknown PASSWORD_HASHING_POLICY {PASSWORD_HASHING_POLICY!r}.")
+PASSWORD_HASHERS = PASSWORD_HASHING_POLICIES[PASSWORD_HASHING_POLICY]
+
+PASSWORD_PBKDF2_ITERATIONS = env.int("PASSWORD_PBKDF2_ITERATIONS", default=1_000_000)
+PASSWORD_SCRYPT_WORK_FACTOR = env.int("PASSWORD_SCRYPT_WORK_FACTOR", default=2**15)
+PASSWORD_SCRYPT_BLOCK_SIZE = env.int("PASSWORD_SCRYPT_BLOCK_SIZE", default=8)
+PASSWORD_SCRYPT_PARALLELISM = env.int("PASSWORD_SCRYPT_PARALLELISM", default=1)
+PASSWORD_ARGON2_TIME_COST = env.int("PASSWORD_ARGON2_TIME_COST", default=2)
+PASSWORD_ARGON2_MEMORY_COST = env.int("PASSWORD_ARGON2_MEMORY_COST", default=19 * 1024)
+PASSWORD_ARGON2_PARALLELISM = env.int("PASSWORD_ARGON2_PARALLELISM", default=1)
+
+
 # Internationalization
 # https://docs.djangoproject.com/en/5.2/topics/i18n/
 
@@ -138,7 +201,7 @@ DEFAULT_AUTO_FIELD = "django.db.models.BigAutoField"
 
 REST_FRAMEWORK = {
     "DEFAULT_AUTHENTICATION_CLASSES": [
-        "rest_framework.authentication.TokenAuthentication",
+        "core.utils.authentication.CachedTokenAuthentication",
     ],
     "DEFAULT_PERMISSION_CLASSES": [
         "rest_framework.permissions.IsAuthenticated",
@@ -152,6 +215,38 @@ REST_FRAMEWORK = {
     "EXCEPTION_HANDLER": "core.utils.exception_handler.custom_exception_handler",
 }
 
+# Token authentication cache (seconds / entries): Django cache TTL (only with a shared CACHE_URL) and the
+# per-process LRU in front of it, which bounds how long other workers accept a revoked token
+TOKEN_AUTH_CACHE_TTL = env.int("TOKEN_AUTH_CACHE_TTL", default=300)
+TOKEN_AUTH_LOCAL_TTL = env.int("TOKEN_AUTH_LOCAL_TTL", default=30)
+TOKEN_AUTH_LOCAL_CACHE_SIZE = env.int("TOKEN_AUTH_LOCAL_CACHE_SIZE", default=1024)
+
+# Per-request query/timing instrumentation (off by default): per-route statistics are flushed to
+# REQUEST_INSTRUMENTATION_DIR every REQUEST_INSTRUMENTATION_FLUSH_INTERVAL seconds for dump_request_stats
+REQUEST_INSTRUMENTATION = env.bool("REQUEST_INSTRUMENTATION", default=False)
+REQUEST_INSTRUMENTATION_SERVER_TIMING = env.bool("REQUEST_INSTRUMENTATION_SERVER_TIMING", default=False)
+REQUEST_INSTRUMENTATION_DIR = env(
+    "REQUEST_INSTRUMENTATION_DIR", default=os.path.join(tempfile.gettempdir(), "coderr-request-stats")
+)
+REQUEST_INSTRUMENTATION_FLUSH_INTERVAL = env.int("REQUEST_INSTRUMENTATION_FLUSH_INTERVAL", default=10)
+
+# Query budgets declared with core.utils.query_budget.query_budget: 'raise' (test suite), 'log' (DEBUG) or 'off'
+QUERY_BUDGET_MODE = env("QUERY_BUDGET_MODE", default="raise" if TESTING else "log" if DEBUG else "off")
+if QUERY_BUDGET_MODE not in ("raise", "log", "off"):
+    raise ImproperlyConfigured(f"Unknown QUERY_BUDGET_MODE {QUERY_BUDGET_MODE!r}.")
+
+# Response cache for read-mostly GET endpoints (seconds, 0 disables it). Invalidation only reaches the
+# process that saved the row, so it needs a shared CACHE_URL and is off by default with locmem and under tests.
+RESPONSE_CACHE_TIMEOUT = env.int("RESPONSE_CACHE_TIMEOUT", default=300 if SHARED_CACHE and not TESTING else 0)
+if RESPONSE_CACHE_TIMEOUT > 0 and not SHARED_CACHE:
+    raise ImproperlyConfigured(
+        "RESPONSE_CACHE_TIMEOUT needs a shared cache backend: with a per-process cache other workers keep "
+        "serving stale responses after writes. Set CACHE_URL (e.g. redis://localhost:6379/1) or disable it with 0."
+    )
+
+# Search backend for /api/offers/?search= (InvertedIndexSearchBackend or IcontainsSearchBackend)
+OFFER_SEARCH_BACKEND = env("OFFER_SEARCH_BACKEND", default="offers_app.search.InvertedIndexSearchBackend")
+
 CORS_ALLOWED_ORIGINS = env.list(
     "CORS_ALLOWED_ORIGINS",
     default=[
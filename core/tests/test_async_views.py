@@ -0,0 +1,113 @@
+from asgiref.sync import iscoroutinefunction, sync_to_async
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+from django.urls import resolve, reverse
+from rest_framework.authtoken.models import Token
+from core.utils.authentication import CachedTokenAuthentication
+from orders_app.models import Order
+
+
+class TestAsyncViews(TestCase):
+    """Tests for the read-only endpoints served by async views."""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.business = User.objects.create_user(username="business", password="pw1", email="business@test.com")
+        cls.business.profile.type = "business"
+        cls.business.profile.save()
+        cls.customer = User.objects.create_user(username="customer", password="pw1", email="customer@test.com")
+        cls.customer.profile.type = "customer"
+        cls.customer.profile.save()
+        Order.objects.create(customer_user=cls.customer, business_user=cls.business, title="Logo", price=100)
+        cls.token = Token.objects.create(user=cls.customer)
+
+    def setUp(self):
+        """Start every test without cached token lookups."""
+        CachedTokenAuthentication.local_cache.clear()
+        cache.clear()
+
+    def get(self, path, **headers):
+        """Send an authenticated GET through the ASGI request handler."""
+        return self.async_client.get(path, headers={"Authorization": f"Token {self.token.key}", **headers})
+
+    def test_read_endpoints_are_async(self):
+        """Test that Django dispatches the read-only endpoints as coroutines."""
+        for path in [
+            "/api/base-info/",
+            f"/api/order-count/{self.business.id}/",
+            f"/api/completed-order-count/{self.business.id}/",
+            f"/api/order-stats/{self.business.id}/",
+            reverse("customer-profiles"),
+            reverse("business-profiles"),
+        ]:
+            with self.subTest(path=path):
+                self.assertTrue(iscoroutinefunction(resolve(path).func))
+
+    async def test_base_info(self):
+        """Test that the base info is served with its ETag and 304 revalidation."""
+        response = await self.async_client.get("/api/base-info/")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()["business_profile_count"], 1)
+        response = await self.async_client.get("/api/base-info/", headers={"If-None-Match": response["ETag"]})
+        self.assertEqual(response.status_code, 304)
+
+    async def test_order_counts(self):
+        """Test that the order count views authenticate and read the counters asynchronously."""
+        response = await self.get(f"/api/order-count/{self.business.id}/")
+        self.assertEqual(response.json(), {"order_count": 1})
+        response = await self.get(f"/api/order-count/{self.customer.id}/")
+        self.assertEqual(response.status_code, 404)
+        response = await self.async_client.get(f"/api/order-stats/{self.business.id}/")
+        self.assertEqual(response.status_code, 401)
+
+    async def test_profile_lists(self):
+        """Test that plain, paginated and streamed profile lists return the same profiles."""
+        plain = (await self.get(reverse("business-profiles"))).json()
+        self.assertEqual([profile["user"] for profile in plain], [self.business.id])
+        page = (await self.get(reverse("business-profiles") + "?pagination=page")).json()
+        self.assertEqual(page["results"], plain)
+        response = await self.get(reverse("customer-profiles") + "?pagination=stream")
+        body = await sync_to_async(b"".join)(response.streaming_content)
+        self.assertIn(b'"username":"customer"', body)
+
+    def test_plain_profile_list_query_count(self):
+        """Test that the async profile list runs the token lookup, validators and one profile query, none per user."""
+        with self.assertNumQueries(4):
+            response = self.client.get(reverse("business-profiles"), HTTP_AUTHORIZATION=f"Token {self.token.key}")
+        self.assertEqual(response.status_code, 200)
+
+
+@override_settings(
+    CACHES={"default": {"BACKEND": "django.core.cache.backends.db.DatabaseCache", "LOCATION": "test_response_cache"}},
+    RESPONSE_CACHE_TIMEOUT=300,
+    QUERY_BUDGET_MODE="off",
+)
+class TestAsyncResponseCache(TestCase):
+    """Tests for the response cache of async views on a cache backend that uses the database.
+
+    The cache queries would count against the query budgets, so they are not checked here.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        call_command("createcachetable")
+        cls.business = User.objects.create_user(username="business", password="pw1", email="business@test.com")
+        cls.business.profile.type = "business"
+        cls.business.profile.save()
+        cls.token = Token.objects.create(user=cls.business)
+
+    def setUp(self):
+        """Start every test without cached token lookups."""
+        CachedTokenAuthentication.local_cache.clear()
+
+    async def test_misses_are_stored_outside_the_event_loop(self):
+        """Test that async views store and serve cached responses without sync cache calls on the event loop."""
+        headers = {"Authorization": f"Token {self.token.key}"}
+        for path in ("/api/base-info/", reverse("business-profiles")):
+            with self.subTest(path=path):
+                miss = await self.async_client.get(path, headers=headers)
+                self.assertEqual((miss.status_code, miss["X-Cache"]), (200, "MISS"))
+                hit = await self.async_client.get(path, headers=headers)
+                self.assertEqual((hit.status_code, hit["X-Cache"], hit.content), (200, "HIT", miss.content))
@@ -0,0 +1,129 @@
+from unittest.mock import patch
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from rest_framework.authtoken.models import Token
+from rest_framework.test import APITestCase
+from core.utils.authentication import CachedTokenAuthentication, LRUCache
+from core.utils.test_client import JSONAPIClient
+
+
+class TestLRUCache(TestCase):
+    """Tests for the in-process LRU cache with TTL."""
+
+    def test_evicts_least_recently_used(self):
+        """Should evict the least recently used entry above max_size."""
+        lru = LRUCache(max_size=2, ttl=60)
+        lru.set("a", 1)
+        lru.set("b", 2)
+        lru.get("a")
+        lru.set("c", 3)
+        self.assertEqual((lru.get("a"), lru.get("b"), lru.get("c")), (1, None, 3))
+
+    @patch("core.utils.authentication.time.monotonic")
+    def test_expires_after_ttl(self, monotonic):
+        """Should drop entries older than the TTL."""
+        lru = LRUCache(max_size=2, ttl=10)
+        monotonic.return_value = 100
+        lru.set("a", 1)
+        monotonic.return_value = 109
+        self.assertEqual(lru.get("a"), 1)
+        monotonic.return_value = 110
+        self.assertIsNone(lru.get("a"))
+
+
+class TestCachedTokenAuthentication(APITestCase):
+    """Tests for the caching token authentication and its invalidation."""
+
+    client_class = JSONAPIClient
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.customer = User.objects.create_user(username="customer", password="pw1", email="customer@test.com")
+        cls.customer.profile.type = "customer"
+        cls.customer.profile.save()
+        cls.business = User.objects.create_user(username="business", password="pw1", email="business@test.com")
+        cls.business.profile.type = "business"
+        cls.business.profile.save()
+        cls.orders_url = reverse("order-list")
+
+    def setUp(self):
+        CachedTokenAuthentication.local_cache.clear()
+        cache.clear()
+        self.token = Token.objects.create(user=self.customer)
+        self.client.credentials(HTTP_AUTHORIZATION=f"Token {self.token.key}")
+
+    def test_token_lookup_is_cached(self):
+        """Should resolve the token once and serve user and profile from cache afterwards."""
+        with self.assertNumQueries(3):
+            self.assertEqual(self.client.get(self.orders_url).status_code, 200)
+        with self.assertNumQueries(2):
+            self.assertEqual(self.client.get(self.orders_url).status_code, 200)
+
+    @override_settings(SHARED_CACHE=True)
+    def test_shared_cache_fills_local_cache(self):
+        """Should fall back to Django's cache when the in-process LRU misses."""
+        self.client.get(self.orders_url)
+        CachedTokenAuthentication.local_cache.clear()
+        with self.assertNumQueries(2):
+            self.client.get(self.orders_url)
+
+    def test_per_process_cache_is_skipped(self):
+        """Should not store tokens in a per-process Django cache, which other workers cannot invalidate."""
+        self.client.get(self.orders_url)
+        self.assertIsNone(cache.get(CachedTokenAuthentication.get_cache_key(self.token.key)))
+        CachedTokenAuthentication.local_cache.clear()
+        with self.assertNumQueries(3):
+            self.client.get(self.orders_url)
+
+    def test_profile_is_cached_for_permissions(self):
+        """Should answer profile.type permission checks without querying the profile."""
+        self.client.get(self.orders_url)
+        user, _ = CachedTokenAuthentication().authenticate_credentials(self.token.key)
+        with self.assertNumQueries(0):
+            self.assertEqual(user.profile.type, "customer")
+
+    def test_invalid_token(self):
+        """Should reject unknown tokens."""
+        self.client.credentials(HTTP_AUTHORIZATION="Token invalid")
+        self.assertEqual(self.client.get(self.orders_url).status_code, 401)
+
+    def test_deleted_token_is_invalidated(self):
+        """Should reject a token after it was deleted."""
+        self.client.get(self.orders_url)
+        self.token.delete()
+        self.assertEqual(self.client.get(self.orders_url).status_code, 401)
+
+    def test_deactivated_user_is_invalidated(self):
+        """Should reject a cached token once its user is deactivated."""
+        self.client.get(self.orders_url)
+        self.customer.is_active = False
+        self.customer.save()
+        self.assertEqual(self.client.get(self.orders_url).status_code, 401)
+
+    def test_profile_type_change_is_invalidated(self):
+        """Should see the new profile type after it changed."""
+        self.client.get(self.orders_url)
+        profile = self.customer.profile
+        profile.type = "business"
+        profile.save()
+        user, _ = CachedTokenAuthentication().authenticate_credentials(self.token.key)
+        self.assertEqual(user.profile.type, "business")
+
+    def test_cached_users_are_independent_instances(self):
+        """Should return a fresh user instance per request so changes do not leak between requests."""
+        first, _ = CachedTokenAuthentication().authenticate_credentials(self.token.key)
+        first.first_name = "Changed"
+        second, _ = CachedTokenAuthentication().authenticate_credentials(self.token.key)
+        self.assertEqual(second.first_name, "")
+
+    def test_password_hash_is_not_cached(self):
+        """Should leave the password hash out of the cache and load it only when it is read."""
+        self.client.get(self.orders_url)
+        payload = CachedTokenAuthentication.local_cache.get(CachedTokenAuthentication.get_cache_key(self.token.key))
+        self.assertNotIn("password", payload["user"])
+        user, _ = CachedTokenAuthentication().authenticate_credentials(self.token.key)
+        self.assertEqual(user.get_deferred_fields(), {"password"})
+        with self.assertNumQueries(1):
+            self.assertTrue(user.check_password("pw1"))
@@ -0,0 +1,168 @@
+from datetime import timedelta
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.test import override_settings
+from django.urls import reverse
+from django.utils.http import http_date
+from rest_framework.test import APITestCase
+from core.utils.authentication import CachedTokenAuthentication
+from core.utils.test_client import JSONAPIClient
+from offers_app.models import Offer
+from orders_app.models import Order
+from reviews_app.models import Review
+
+
+def create_user(username, profile_type):
+    """Create a user with a typed profile."""
+    user = User.objects.create_user(username=username, password="pw1", email=f"{username}@test.com")
+    user.profile.type = profile_type
+    user.profile.save()
+    return user
+
+
+class TestConditionalGet(APITestCase):
+    """Tests for ETag / Last-Modified validation of list and detail endpoints."""
+
+    client_class = JSONAPIClient
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.business = create_user("business", "business")
+        cls.customer = create_user("customer", "customer")
+        cls.offer = Offer.objects.create(user=cls.business, title="Logo Design", description="Vector logos")
+        cls.offers_url = reverse("offer-list")
+        cls.offer_url = reverse("offer-detail", kwargs={"pk": cls.offer.pk})
+        cls.profile_url = reverse("profile", kwargs={"pk": cls.business.pk})
+
+    def setUp(self):
+        """Start every test with empty caches and an authenticated customer."""
+        CachedTokenAuthentication.local_cache.clear()
+        cache.clear()
+        self.client.force_authenticate(user=self.customer)
+
+    def get_etag(self, path, **params):
+        """Request path and return the ETag of the 200 response."""
+        response = self.client.get(path, params)
+        self.assertEqual(response.status_code, 200)
+        return response["ETag"]
+
+    def assertNotModified(self, path, etag, **params):
+        """Assert that path answers If-None-Match: etag with 304 and the same ETag."""
+        response = self.client.get(path, params, headers={"If-None-Match": etag})
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response["ETag"], etag)
+        self.assertEqual(response.content, b"")
+        return response
+
+    def test_list_not_modified_runs_only_the_validator_query(self):
+        """Test that a matching list ETag returns 304 after one aggregate query and no serialization."""
+        etag = self.get_etag(self.offers_url)
+        with self.assertNumQueries(1):
+            self.assertNotModified(self.offers_url, etag)
+
+    def test_list_sends_no_last_modified(self):
+        """Test that lists only send an ETag, which also changes when rows are deleted."""
+        self.assertNotIn("Last-Modified", self.client.get(self.offers_url))
+
+    def test_list_etag_changes_with_rows(self):
+        """Test that updating, adding and deleting rows each change the list ETag."""
+        etags = [self.get_etag(self.offers_url)]
+        Offer.objects.filter(pk=self.offer.pk).update(updated_at=self.offer.updated_at + timedelta(seconds=1))
+        etags.append(self.get_etag(self.offers_url))
+        Offer.objects.create(user=self.business, title="Web Design", description="Pages")
+        etags.append(self.get_etag(self.offers_url))
+        Offer.objects.filter(pk=self.offer.pk).delete()
+        etags.append(self.get_etag(self.offers_url))
+        self.assertEqual(len(set(etags)), 4)
+
+    def test_list_etag_depends_on_query_and_user(self):
+        """Test that other filters and other users get different ETags."""
+        etag = self.get_etag(self.offers_url)
+        self.assertNotEqual(self.get_etag(self.offers_url, min_price=50), etag)
+        self.client.force_authenticate(user=self.business)
+        self.assertNotEqual(self.get_etag(self.offers_url), etag)
+
+    def test_offer_etags_depend_on_the_owner_profile(self):
+        """Test that renaming the offer owner through the profile changes the offer list and detail ETags."""
+        etags = [self.get_etag(self.offers_url), self.get_etag(self.offer_url)]
+        self.client.force_authenticate(user=self.business)
+        response = self.client.patch(self.profile_url, {"first_name": "Anna"})
+        self.assertEqual(response.status_code, 200)
+        self.client.force_authenticate(user=self.customer)
+        listed = self.client.get(self.offers_url, headers={"If-None-Match": etags[0]})
+        self.assertEqual((listed.status_code, listed.data["results"][0]["user_details"]["first_name"]), (200, "Anna"))
+        detail = self.client.get(self.offer_url, headers={"If-None-Match": etags[1]})
+        self.assertEqual((detail.status_code, detail.data["user_details"]["first_name"]), (200, "Anna"))
+
+    def test_detail_sends_last_modified(self):
+        """Test that an offer answers a current If-Modified-Since with 304 and a stale one with 200."""
+        response = self.client.get(self.offer_url)
+        self.assertEqual(response["Last-Modified"], http_date(self.offer.updated_at.timestamp()))
+        modified_since = self.client.get(self.offer_url, headers={"If-Modified-Since": response["Last-Modified"]})
+        self.assertEqual(modified_since.status_code, 304)
+        stale = http_date((self.offer.updated_at - timedelta(minutes=1)).timestamp())
+        self.assertEqual(self.client.get(self.offer_url, headers={"If-Modified-Since": stale}).status_code, 200)
+
+    def test_detail_loads_the_object_once(self):
+        """Test that retrieve serializes the object loaded for the validators instead of fetching it again."""
+        self.client.force_authenticate(user=self.business)
+        with self.assertNumQueries(2):
+            self.assertEqual(self.client.get(self.offer_url).status_code, 200)
+
+    def test_profile_detail(self):
+        """Test that a profile answers If-None-Match with 304 until it is saved again."""
+        etag = self.get_etag(self.profile_url)
+        with self.assertNumQueries(1):
+            self.assertNotModified(self.profile_url, etag)
+        profile = self.business.profile
+        profile.location = "Berlin"
+        profile.save()
+        response = self.client.get(self.profile_url, headers={"If-None-Match": etag})
+        self.assertEqual((response.status_code, response.data["location"]), (200, "Berlin"))
+
+    def test_business_profile_detail_depends_on_reviews(self):
+        """Test that a new review changes the business profile ETag; business profiles send no Last-Modified."""
+        response = self.client.get(self.profile_url)
+        self.assertNotIn("Last-Modified", response)
+        self.assertNotModified(self.profile_url, response["ETag"])
+        Review.objects.create(reviewer=self.customer, business_user=self.business, rating=4, description="Gut")
+        response = self.client.get(self.profile_url, headers={"If-None-Match": response["ETag"]})
+        self.assertEqual((response.status_code, response.data["review_count"]), (200, 1))
+        customer_url = reverse("profile", kwargs={"pk": self.customer.pk})
+        self.assertIn("Last-Modified", self.client.get(customer_url))
+
+    def test_business_profiles_depend_on_reviews(self):
+        """Test that a new review changes the business profile list ETag, since it changes the ratings."""
+        etag = self.get_etag(reverse("business-profiles"))
+        self.assertNotModified(reverse("business-profiles"), etag)
+        Review.objects.create(reviewer=self.customer, business_user=self.business, rating=4, description="Gut")
+        self.assertNotEqual(self.get_etag(reverse("business-profiles")), etag)
+
+    def test_reviews_and_orders_lists(self):
+        """Test that the review and order lists answer a matching If-None-Match with 304."""
+        Order.objects.create(customer_user=self.customer, business_user=self.business, title="Basic", price=100)
+        for url in (reverse("reviews-list"), reverse("order-list"), reverse("customer-profiles")):
+            self.assertNotModified(url, self.get_etag(url))
+
+    def test_blocked_detail_views_stay_blocked(self):
+        """Test that the order detail still answers GET with 405 and without validators."""
+        order = Order.objects.create(customer_user=self.customer, business_user=self.business, title="B", price=1)
+        response = self.client.get(reverse("order-detail", kwargs={"pk": order.pk}))
+        self.assertEqual(response.status_code, 405)
+        self.assertNotIn("ETag", response)
+
+    def test_unsafe_methods_are_not_validated(self):
+        """Test that PATCH ignores If-None-Match and updates the offer."""
+        self.client.force_authenticate(user=self.business)
+        etag = self.get_etag(self.offer_url)
+        response = self.client.patch(self.offer_url, {"title": "Brand Design"}, headers={"If-None-Match": etag})
+        self.assertEqual(response.status_code, 200)
+        self.assertNotIn("ETag", response)
+
+    @override_settings(RESPONSE_CACHE_TIMEOUT=300)
+    def test_cached_responses_keep_their_validators(self):
+        """Test that the response cache stores the ETag and answers If-None-Match from the cache."""
+        etag = self.get_etag(self.offers_url)
+        with self.assertNumQueries(0):
+            response = self.assertNotModified(self.offers_url, etag)
+        self.assertEqual(response["X-Cache"], "HIT")
@@ -0,0 +1,109 @@
+import shutil
+import tempfile
+from io import StringIO
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+from rest_framework.authtoken.models import Token
+from core.utils.authentication import CachedTokenAuthentication
+from core.utils.instrumentation import RequestMetrics, collector, histogram_percentile
+from offers_app.models import Offer
+
+STATS_DIR = tempfile.mkdtemp(prefix="request-stats-")
+
+
+@override_settings(
+    REQUEST_INSTRUMENTATION=True,
+    REQUEST_INSTRUMENTATION_SERVER_TIMING=True,
+    REQUEST_INSTRUMENTATION_DIR=STATS_DIR,
+    REQUEST_INSTRUMENTATION_FLUSH_INTERVAL=0,
+)
+class TestRequestInstrumentation(TestCase):
+    """Tests for the per-request query and timing instrumentation."""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.business = User.objects.create_user(username="business", password="pw1", email="business@test.com")
+        cls.business.profile.type = "business"
+        cls.business.profile.save()
+        cls.offer = Offer.objects.create(user=cls.business, title="Logo", description="Vector logos")
+        cls.token = Token.objects.create(user=cls.business)
+
+    def setUp(self):
+        """Start every test with empty statistics and without cached token lookups."""
+        CachedTokenAuthentication.local_cache.clear()
+        cache.clear()
+        collector.reset()
+        self.client.defaults["HTTP_AUTHORIZATION"] = f"Token {self.token.key}"
+        shutil.rmtree(STATS_DIR, ignore_errors=True)
+        self.addCleanup(shutil.rmtree, STATS_DIR, ignore_errors=True)
+
+    def test_server_timing_header(self):
+        """Test that the response reports query count, DB, serializer and total time."""
+        with self.assertNumQueries(3):
+            response = self.client.get(f"/api/offers/{self.offer.id}/")
+        self.assertEqual(response.status_code, 200)
+        header = response["Server-Timing"]
+        self.assertRegex(header, r'^db;dur=[\d.]+;desc="3 queries", serializer;dur=[\d.]+, total;dur=[\d.]+$')
+
+    def test_statistics_are_aggregated_per_route(self):
+        """Test that requests to different ids of a route share one entry with query and serializer times."""
+        for _ in range(3):
+            self.client.get(f"/api/offers/{self.offer.id}/")
+        self.client.get("/api/offers/0/")
+        stats = collector.snapshot()["routes"]["GET /api/offers/(?P<pk>[^/.]+)/"]
+        self.assertEqual(stats["requests"], 4)
+        self.assertEqual(stats["queries"], 8)
+        self.assertEqual(sum(stats["histogram"]), 4)
+        self.assertGreater(stats["serializer_time"], 0)
+
+    async def test_async_views_are_measured(self):
+        """Test that queries run from async views in worker threads are counted."""
+        response = await self.async_client.get("/api/base-info/")
+        self.assertEqual(response.status_code, 200)
+        self.assertIn('desc="1 queries"', response["Server-Timing"])
+
+    def test_server_timing_is_opt_in(self):
+        """Test that statistics are collected without exposing the header unless enabled."""
+        with self.settings(REQUEST_INSTRUMENTATION_SERVER_TIMING=False):
+            response = self.client.get(f"/api/offers/{self.offer.id}/")
+        self.assertNotIn("Server-Timing", response)
+        self.assertIn("GET /api/offers/(?P<pk>[^/.]+)/", collector.snapshot()["routes"])
+
+    def test_disabled_middleware_records_nothing(self):
+        """Test that the disabled middleware neither measures requests nor adds headers."""
+        with self.settings(REQUEST_INSTRUMENTATION=False):
+            response = self.client.get(f"/api/offers/{self.offer.id}/")
+        self.assertNotIn("Server-Timing", response)
+        self.assertEqual(collector.snapshot()["routes"], {})
+
+    def test_duplicated_statements_are_collected(self):
+        """Test that statements running more than once in a request are reported with their repeat count."""
+        metrics = RequestMetrics()
+        for _ in range(3):
+            metrics.record_query("SELECT 1 FROM offer WHERE id = %s", 0.001)
+        metrics.record_query("SELECT 2", 0.001)
+        collector.record("GET /api/offers/", metrics, 0.02)
+        duplicates = collector.snapshot()["duplicates"]
+        self.assertEqual(len(duplicates), 1)
+        self.assertEqual((duplicates[0]["executions"], duplicates[0]["requests"]), (3, 1))
+
+    def test_histogram_percentile(self):
+        """Test that percentiles resolve to the upper bound of their histogram bucket."""
+        histogram = [5, 0, 4, 0, 0, 0, 0, 0, 0, 1]
+        self.assertEqual(histogram_percentile(histogram, 50), 5)
+        self.assertEqual(histogram_percentile(histogram, 90), 25)
+        self.assertIsNone(histogram_percentile(histogram, 99))
+
+    def test_dump_command(self):
+        """Test that the command reports the slowest routes from the flushed snapshots and resets them."""
+        self.client.get(f"/api/offers/{self.offer.id}/")
+        self.client.get("/api/offers/")
+        out = StringIO()
+        call_command("dump_request_stats", "--top", "5", "--reset", stdout=out)
+        self.assertIn("GET /api/offers/(?P<pk>[^/.]+)/", out.getvalue())
+        self.assertIn("GET /api/offers/", out.getvalue())
+        out = StringIO()
+        call_command("dump_request_stats", stdout=out)
+        self.assertIn("Keine Statistiken", out.getvalue())
@@ -0,0 +1,98 @@
+from django.contrib.auth.models import User
+from django.http import StreamingHttpResponse
+from django.test import TestCase, override_settings
+from rest_framework.response import Response
+from rest_framework.test import APIRequestFactory
+from rest_framework.views import APIView
+from core.utils.async_views import AsyncAPIView
+from core.utils.query_budget import QueryBudgetExceeded, query_budget
+
+
+@query_budget(get=1, post=None)
+class UserCountView(APIView):
+    """View running two queries on GET and POST."""
+
+    authentication_classes = []
+    permission_classes = []
+
+    def get(self, request):
+        """Return the user count after an extra existence check."""
+        User.objects.exists()
+        return Response({"count": User.objects.count()})
+
+    post = get
+
+
+@query_budget(default=2)
+class StreamedUsernamesView(APIView):
+    """View running one query before and one query per streamed chunk."""
+
+    authentication_classes = []
+    permission_classes = []
+
+    def get(self, request):
+        """Stream the usernames, one chunk per user, each fetched with its own query."""
+        ids = list(User.objects.order_by("id").values_list("id", flat=True))
+        return StreamingHttpResponse(User.objects.get(id=pk).username for pk in ids)
+
+
+@query_budget(default=1)
+class AsyncUserCountView(AsyncAPIView):
+    """Async view running two queries."""
+
+    authentication_classes = []
+    permission_classes = []
+
+    async def get(self, request):
+        """Return the user count after an extra existence check."""
+        await User.objects.aexists()
+        return Response({"count": await User.objects.acount()})
+
+
+class TestQueryBudget(TestCase):
+    """Tests for the query_budget view decorator."""
+
+    def setUp(self):
+        """Create a request factory."""
+        self.factory = APIRequestFactory()
+
+    @override_settings(QUERY_BUDGET_MODE="raise")
+    def test_exceeded_budget_raises(self):
+        """Test that a request above its budget raises in raise mode."""
+        with self.assertRaisesMessage(QueryBudgetExceeded, "UserCountView.get (GET /users/) ran 2 SQL queries"):
+            UserCountView.as_view()(self.factory.get("/users/"))
+
+    @override_settings(QUERY_BUDGET_MODE="log")
+    def test_exceeded_budget_logs(self):
+        """Test that a request above its budget logs a warning and still returns its response in log mode."""
+        with self.assertLogs("core.utils.query_budget", "WARNING") as logs:
+            response = UserCountView.as_view()(self.factory.get("/users/"))
+        self.assertEqual(response.status_code, 200)
+        self.assertIn("budget is 1", logs.output[0])
+
+    @override_settings(QUERY_BUDGET_MODE="off")
+    def test_disabled_budget_is_not_checked(self):
+        """Test that budgets are ignored in off mode."""
+        self.assertEqual(UserCountView.as_view()(self.factory.get("/users/")).status_code, 200)
+
+    @override_settings(QUERY_BUDGET_MODE="raise")
+    def test_unlimited_budget(self):
+        """Test that None disables the budget for one method."""
+        self.assertEqual(UserCountView.as_view()(self.factory.post("/users/")).status_code, 200)
+
+    @override_settings(QUERY_BUDGET_MODE="raise")
+    async def test_async_view_queries_are_counted(self):
+        """Test that queries of async views, run in worker threads, count towards the budget."""
+        with self.assertRaisesMessage(QueryBudgetExceeded, "ran 2 SQL queries"):
+            await AsyncUserCountView.as_view()(self.factory.get("/users/"))
+
+    @override_settings(QUERY_BUDGET_MODE="raise")
+    def test_streamed_queries_are_counted(self):
+        """Test that queries run while a response streams count and are checked after the last chunk."""
+        User.objects.create(username="one", email="one@test.com")
+        response = StreamedUsernamesView.as_view()(self.factory.get("/users/"))
+        self.assertEqual(b"".join(response.streaming_content), b"one")
+        User.objects.create(username="two", email="two@test.com")
+        response = StreamedUsernamesView.as_view()(self.factory.get("/users/"))
+        with self.assertRaisesMessage(QueryBudgetExceeded, "ran 3 SQL queries, budget is 2"):
+            b"".join(response.streaming_content)
@@ -0,0 +1,192 @@
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.test import override_settings
+from django.urls import reverse
+from rest_framework.test import APITestCase
+from core.utils.authentication import CachedTokenAuthentication
+from core.utils.instrumentation import collector
+from core.utils.test_client import JSONAPIClient
+from offers_app.models import Offer, OfferDetail
+from reviews_app.models import Review
+
+
+def create_user(username, profile_type, **extra):
+    """Create a user with a typed profile."""
+    user = User.objects.create_user(username=username, password="pw1", email=f"{username}@test.com", **extra)
+    user.profile.type = profile_type
+    user.profile.save()
+    return user
+
+
+@override_settings(RESPONSE_CACHE_TIMEOUT=300)
+class TestResponseCache(APITestCase):
+    """Tests for the response cache of the read-mostly endpoints and its signal-driven invalidation."""
+
+    client_class = JSONAPIClient
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.business = create_user("business", "business")
+        cls.customer = create_user("customer", "customer")
+        cls.other_customer = create_user("other", "customer")
+        cls.offer = Offer.objects.create(user=cls.business, title="Logo Design", description="Vector logos")
+        cls.detail = OfferDetail.objects.create(
+            offer=cls.offer,
+            title="Basic",
+            revisions=1,
+            delivery_time_in_days=5,
+            price=100,
+            features=["Logo"],
+            offer_type="basic",
+        )
+        cls.offers_url = reverse("offer-list")
+        cls.detail_url = reverse("offerdetails-detail", kwargs={"id": cls.detail.id})
+
+    def setUp(self):
+        """Start every test with an empty cache and an authenticated customer."""
+        CachedTokenAuthentication.local_cache.clear()
+        cache.clear()
+        self.client.force_authenticate(user=self.customer)
+
+    def assertCacheStatus(self, path, status, **params):
+        """Request path and assert that it was served with the given X-Cache status."""
+        response = self.client.get(path, params)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response["X-Cache"], status)
+        return response
+
+    def test_hit_serves_identical_response_without_queries(self):
+        """Test that the second request is served from the cache with the same body and no queries."""
+        miss = self.assertCacheStatus(self.offers_url, "MISS")
+        with self.assertNumQueries(0):
+            hit = self.assertCacheStatus(self.offers_url, "HIT")
+        self.assertEqual(hit.content, miss.content)
+        self.assertEqual(hit["Content-Type"], "application/json")
+
+    def test_key_includes_query_params(self):
+        """Test that different filters are cached separately, independent of parameter order."""
+        self.assertCacheStatus(self.offers_url, "MISS", min_price=50, ordering="min_price")
+        self.assertCacheStatus(self.offers_url, "MISS", min_price=500)
+        self.assertCacheStatus(self.offers_url, "HIT", ordering="min_price", min_price=50)
+
+    def test_key_includes_pagination_header(self):
+        """Test that lists requested with different X-Pagination modes are cached separately."""
+        url = "/api/profiles/business/"
+        plain = self.client.get(url)
+        self.assertEqual(plain["X-Cache"], "MISS")
+        page = self.client.get(url, headers={"X-Pagination": "page"})
+        self.assertEqual((page["X-Cache"], page.data["count"]), ("MISS", 1))
+        stream = self.client.get(url, headers={"X-Pagination": "stream"})
+        self.assertEqual((stream.streaming, stream["X-Cache"]), (True, "MISS"))
+        self.assertEqual(self.client.get(url)["X-Cache"], "HIT")
+        cursor = self.client.get(self.offers_url, headers={"X-Pagination": "cursor"})
+        self.assertEqual(cursor["X-Cache"], "MISS")
+        self.assertEqual(self.client.get(self.offers_url)["X-Cache"], "MISS")
+        hit = self.client.get(self.offers_url, headers={"X-Pagination": "CURSOR"})
+        self.assertEqual(hit["X-Cache"], "HIT")
+        self.assertNotIn("count", hit.json())
+
+    def test_responses_are_shared_per_role(self):
+        """Test that users of the same role share entries while anonymous users and other roles do not."""
+        self.assertCacheStatus(self.offers_url, "MISS")
+        self.client.force_authenticate(user=None)
+        self.assertCacheStatus(self.offers_url, "MISS")
+        self.client.force_authenticate(user=self.other_customer)
+        self.assertCacheStatus(self.offers_url, "HIT")
+        self.client.force_authenticate(user=self.business)
+        self.assertCacheStatus(self.offers_url, "MISS")
+
+    def test_permission_checks_run_before_lookup(self):
+        """Test that a cached offer is not served to anonymous users, who may not retrieve offers."""
+        url = reverse("offer-detail", kwargs={"pk": self.offer.pk})
+        self.assertCacheStatus(url, "MISS")
+        self.client.force_authenticate(user=None)
+        self.assertEqual(self.client.get(url).status_code, 401)
+
+    def test_offer_save_invalidates_offer_responses(self):
+        """Test that saving an offer drops the cached offer list."""
+        self.assertCacheStatus(self.offers_url, "MISS")
+        self.offer.title = "Brand Design"
+        self.offer.save()
+        response = self.assertCacheStatus(self.offers_url, "MISS")
+        self.assertEqual(response.data["results"][0]["title"], "Brand Design")
+
+    def test_detail_patch_invalidates_offer_detail(self):
+        """Test that details written with bulk_update through an offer PATCH drop the cached offer detail."""
+        self.assertCacheStatus(self.detail_url, "MISS")
+        self.client.force_authenticate(user=self.business)
+        response = self.client.patch(
+            reverse("offer-detail", kwargs={"pk": self.offer.pk}), {"details": [{"offer_type": "basic", "price": 80}]}
+        )
+        self.assertEqual(response.status_code, 200)
+        self.client.force_authenticate(user=self.customer)
+        self.assertEqual(self.assertCacheStatus(self.detail_url, "MISS").data["price"], "80.00")
+
+    def test_bulk_created_offers_invalidate_offer_list(self):
+        """Test that offers inserted with bulk_create drop the cached offer list."""
+        self.assertCacheStatus(self.offers_url, "MISS")
+        self.client.force_authenticate(user=self.business)
+        details = [
+            {"title": t, "revisions": 1, "delivery_time_in_days": 3, "price": 10, "features": [], "offer_type": t}
+            for t in ["basic", "standard", "premium"]
+        ]
+        response = self.client.post(reverse("offer-bulk"), [{"title": "Bulk", "description": "d", "details": details}])
+        self.assertEqual(response.status_code, 201)
+        self.client.force_authenticate(user=self.customer)
+        self.assertEqual(self.assertCacheStatus(self.offers_url, "MISS").data["count"], 2)
+
+    def test_invalidation_is_limited_to_dependent_endpoints(self):
+        """Test that a review invalidates business profiles and base info but not offer details."""
+        for url in (self.detail_url, "/api/profiles/business/", "/api/base-info/"):
+            self.assertCacheStatus(url, "MISS")
+        Review.objects.create(reviewer=self.customer, business_user=self.business, rating=4, description="Gut")
+        self.assertCacheStatus(self.detail_url, "HIT")
+        self.assertEqual(self.assertCacheStatus("/api/profiles/business/", "MISS").data[0]["review_count"], 1)
+        self.assertEqual(self.assertCacheStatus("/api/base-info/", "MISS").data["review_count"], 1)
+
+    def test_profile_change_invalidates_business_profiles(self):
+        """Test that a profile update drops the cached business profile list."""
+        self.assertCacheStatus("/api/profiles/business/", "MISS")
+        profile = self.business.profile
+        profile.location = "Berlin"
+        profile.save()
+        self.assertEqual(self.assertCacheStatus("/api/profiles/business/", "MISS").data[0]["location"], "Berlin")
+
+    def test_cached_etag_answers_conditional_requests(self):
+        """Test that a cached response with ETag answers If-None-Match with 304."""
+        etag = self.assertCacheStatus("/api/base-info/", "MISS")["ETag"]
+        response = self.client.get("/api/base-info/", headers={"If-None-Match": etag})
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual((response["ETag"], response["X-Cache"]), (etag, "HIT"))
+
+    def test_cached_validators_are_parsed(self):
+        """Test that a cache hit parses If-None-Match as a list of ETags and evaluates If-Modified-Since."""
+        etag = self.assertCacheStatus("/api/base-info/", "MISS")["ETag"]
+        for header, expected in [(f'"other", W/{etag}', 304), ("*", 304), (etag[1:9], 200), (f'"x{etag}', 200)]:
+            with self.subTest(header=header):
+                response = self.client.get("/api/base-info/", headers={"If-None-Match": header})
+                self.assertEqual((response.status_code, response["X-Cache"]), (expected, "HIT"))
+        offer_url = reverse("offer-detail", kwargs={"pk": self.offer.pk})
+        last_modified = self.assertCacheStatus(offer_url, "MISS")["Last-Modified"]
+        response = self.client.get(offer_url, headers={"If-Modified-Since": last_modified})
+        self.assertEqual((response.status_code, response["Last-Modified"]), (304, last_modified))
+
+    def test_streamed_lists_are_not_cached(self):
+        """Test that streamed responses bypass the cache."""
+        self.assertCacheStatus("/api/profiles/business/", "MISS", pagination="stream")
+        self.assertCacheStatus("/api/profiles/business/", "MISS", pagination="stream")
+
+    @override_settings(RESPONSE_CACHE_TIMEOUT=0)
+    def test_disabled_cache(self):
+        """Test that a timeout of 0 disables the cache."""
+        self.assertNotIn("X-Cache", self.client.get(self.offers_url))
+        self.assertNotIn("X-Cache", self.client.get(self.offers_url))
+
+    @override_settings(REQUEST_INSTRUMENTATION=True, REQUEST_INSTRUMENTATION_FLUSH_INTERVAL=3600)
+    def test_hit_rate_is_reported(self):
+        """Test that hits and misses are counted per route by the request instrumentation."""
+        collector.reset()
+        for _ in range(3):
+            self.client.get(self.offers_url)
+        stats = collector.snapshot()["routes"]["GET /api/offers/"]
+        self.assertEqual((stats["cache_hits"], stats["cache_misses"]), (2, 1))
@@ -0,0 +1,117 @@
+from django.contrib.auth.models import User
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework.test import APITestCase
+from core.utils.authentication import CachedTokenAuthentication
+from core.utils.test_client import JSONAPIClient
+from offers_app.models import Offer, OfferDetail
+from reviews_app.models import Review
+
+
+def create_user(username, profile_type):
+    """Create a user with a typed profile."""
+    user = User.objects.create_user(username=username, password="pw1", email=f"{username}@test.com")
+    user.profile.type = profile_type
+    user.profile.save()
+    return user
+
+
+class TestSparseFields(APITestCase):
+    """Tests for ?fields= / ?omit= sparse fieldsets and the matching queryset trimming."""
+
+    client_class = JSONAPIClient
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.business = create_user("business", "business")
+        cls.customer = create_user("customer", "customer")
+        for index in range(3):
+            offer = Offer.objects.create(user=cls.business, title=f"Offer {index}", description="Long text" * 100)
+            OfferDetail.objects.bulk_create(
+                OfferDetail(offer=offer, title=t, delivery_time_in_days=3, price=10 + index, offer_type=t)
+                for t in ["basic", "standard", "premium"]
+            )
+        cls.offer = offer
+        Review.objects.create(reviewer=cls.customer, business_user=cls.business, rating=4, description="Gut")
+        cls.offers_url = reverse("offer-list")
+
+    def setUp(self):
+        """Authenticate the customer."""
+        CachedTokenAuthentication.local_cache.clear()
+        self.client.force_authenticate(user=self.customer)
+
+    def get_with_queries(self, path, params):
+        """Request path and return the response and the captured SQL statements."""
+        with CaptureQueriesContext(connection) as captured:
+            response = self.client.get(path, params)
+        self.assertEqual(response.status_code, 200)
+        return response, [query["sql"] for query in captured.captured_queries]
+
+    def test_fields_selects_fields(self):
+        """Test that ?fields= returns only the requested fields in every result."""
+        response = self.client.get(self.offers_url, {"fields": "id,title"})
+        self.assertEqual([set(offer) for offer in response.data["results"]], [{"id", "title"}] * 3)
+
+    def test_fields_trims_the_queryset(self):
+        """Test that unrequested columns, joins and prefetches are not queried."""
+        response, queries = self.get_with_queries(self.offers_url, {"fields": "id,title"})
+        offer_query = next(sql for sql in queries if "LIMIT" in sql)
+        self.assertNotIn('"description"', offer_query)
+        self.assertNotIn("auth_user", offer_query)
+        self.assertFalse(any("offers_app_offerdetail" in sql for sql in queries))
+
+    def test_omit_drops_fields(self):
+        """Test that ?omit= drops the listed fields and keeps the joins the remaining ones need."""
+        response, queries = self.get_with_queries(self.offers_url, {"omit": "description,details"})
+        first = response.data["results"][0]
+        self.assertNotIn("description", first)
+        self.assertNotIn("details", first)
+        self.assertEqual(first["user_details"]["username"], "business")
+        self.assertFalse(any("offers_app_offerdetail" in sql for sql in queries))
+
+    def test_nested_serializers_render_in_full(self):
+        """Test that a selected nested serializer keeps all its fields."""
+        response = self.client.get(self.offers_url, {"fields": "user_details,details"})
+        first = response.data["results"][0]
+        self.assertEqual(set(first["user_details"]), {"first_name", "last_name", "username"})
+        self.assertEqual(set(first["details"][0]), {"id", "url"})
+
+    def test_unknown_fields_are_rejected(self):
+        """Test that unknown field names answer 400."""
+        response = self.client.get(self.offers_url, {"fields": "id,price", "omit": "secret"})
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.data["fields"], "Unknown fields: price, secret.")
+
+    def test_cursor_pages_keep_ordering_fields_loaded(self):
+        """Test that cursor pagination reads its keyset fields without per-row queries."""
+        params = {"fields": "id", "pagination": "cursor", "ordering": "min_price", "page_size": 2}
+        response, queries = self.get_with_queries(self.offers_url, params)
+        self.assertEqual(len(response.data["results"]), 2)
+        self.assertEqual(len(queries), 2)
+        self.assertEqual(self.client.get(response.data["next"]).status_code, 200)
+
+    def test_retrieve(self):
+        """Test that retrieve honours ?fields= and still sends its validators."""
+        response = self.client.get(reverse("offer-detail", kwargs={"pk": self.offer.pk}), {"fields": "title"})
+        self.assertEqual(response.data, {"title": "Offer 2"})
+        self.assertIn("Last-Modified", response)
+
+    def test_reviews_skip_unrequested_join(self):
+        """Test that the review list only joins the business user when its username is requested."""
+        response, queries = self.get_with_queries(reverse("reviews-list"), {"fields": "id,rating"})
+        self.assertEqual(response.data, [{"id": response.data[0]["id"], "rating": 4}])
+        self.assertFalse(any("auth_user" in sql and "reviews_app_review" in sql for sql in queries))
+
+    def test_async_profile_list(self):
+        """Test that the async business profile list honours ?fields=."""
+        response = self.client.get(reverse("business-profiles"), {"fields": "user,average_rating"})
+        self.assertEqual(response.data, [{"user": self.business.id, "average_rating": 4.0}])
+
+    def test_writes_ignore_fields(self):
+        """Test that PATCH validates and returns all fields regardless of ?fields=."""
+        self.client.force_authenticate(user=self.business)
+        url = reverse("offer-detail", kwargs={"pk": self.offer.pk}) + "?fields=id"
+        response = self.client.patch(url, {"title": "Renamed"})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data["title"], "Renamed")
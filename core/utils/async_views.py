@@ -0,0 +1,65 @@
+import inspect
+from asgiref.sync import sync_to_async
+from rest_framework.generics import ListAPIView
+from rest_framework.response import Response
+from rest_framework.views import APIView
+from core.utils.pagination import OptionalPagination, get_pagination_mode
+
+
+class AsyncAPIView(APIView):
+    """APIView with coroutine handlers, served by Django without a thread hop per request under ASGI.
+
+    Authentication, permission and throttle checks and finalize_response (e.g. storing the response in
+    the cache) may hit the cache or the database and run in sync_to_async calls; the handler itself uses
+    the async ORM (aget, afirst, acount, async for).
+    Under WSGI Django runs the view in its own event loop, so the same view serves both.
+    """
+
+    async def dispatch(self, request, *args, **kwargs):
+        """Run the DRF request cycle of APIView.dispatch around an awaited handler."""
+        self.args = args
+        self.kwargs = kwargs
+        request = self.initialize_request(request, *args, **kwargs)
+        self.request = request
+        self.headers = self.default_response_headers
+
+        try:
+            await sync_to_async(self.initial)(request, *args, **kwargs)
+            if request.method.lower() in self.http_method_names:
+                handler = getattr(self, request.method.lower(), self.http_method_not_allowed)
+            else:
+                handler = self.http_method_not_allowed
+            response = handler(request, *args, **kwargs)
+            if inspect.isawaitable(response):
+                response = await response
+        except Exception as exc:
+            response = self.handle_exception(exc)
+
+        self.response = await sync_to_async(self.finalize_response)(request, response, *args, **kwargs)
+        return self.response
+
+
+class AsyncListAPIView(ListAPIView, AsyncAPIView):
+    """ListAPIView fetching the plain unpaginated list with async iteration.
+
+    Paginated and streamed lists (any ?pagination= / X-Pagination mode) still run the sync list in one
+    sync_to_async call. Filter backends must not query the database while building the queryset, and the
+    serializer must not load relations that are not joined or prefetched.
+    """
+
+    async def get(self, request, *args, **kwargs):
+        """Return the plain list from the async ORM or delegate other modes to the sync list."""
+        if not self.is_plain_list(request):
+            return await sync_to_async(self.list)(request, *args, **kwargs)
+        queryset = self.filter_queryset(self.get_queryset())
+        objects = [obj async for obj in queryset]
+        return Response(self.get_serializer(objects, many=True).data)
+
+    def is_plain_list(self, request):
+        """Return whether the request asks for the unpaginated list."""
+        if get_pagination_mode(request):
+            return False
+        paginator = self.paginator
+        if paginator is None:
+            return True
+        return isinstance(paginator, OptionalPagination) and paginator.get_paginator_class(request) is None
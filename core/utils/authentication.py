@@ -0,0 +1,131 @@
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from django.conf import settings
+from django.core.cache import cache
+from django.core.exceptions import ObjectDoesNotExist
+from django.db import router
+from rest_framework import exceptions
+from rest_framework.authentication import TokenAuthentication
+
+
+class LRUCache:
+    """Thread-safe in-process LRU cache whose entries expire after a TTL in seconds."""
+
+    def __init__(self, max_size, ttl):
+        self.max_size = max_size
+        self.ttl = ttl
+        self.entries = OrderedDict()
+        self.lock = threading.Lock()
+
+    def get(self, key):
+        """Return the cached value or None if it is missing or expired."""
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at <= time.monotonic():
+                del self.entries[key]
+                return None
+            self.entries.move_to_end(key)
+            return value
+
+    def set(self, key, value):
+        """Store a value and evict the least recently used entries above max_size."""
+        with self.lock:
+            self.entries[key] = (time.monotonic() + self.ttl, value)
+            self.entries.move_to_end(key)
+            while len(self.entries) > self.max_size:
+                self.entries.popitem(last=False)
+
+    def delete(self, key):
+        """Remove a value if it is cached."""
+        with self.lock:
+            self.entries.pop(key, None)
+
+    def clear(self):
+        """Remove all values."""
+        with self.lock:
+            self.entries.clear()
+
+
+class CachedTokenAuthentication(TokenAuthentication):
+    """TokenAuthentication that caches token -> user (with profile) instead of querying on every request.
+
+    Lookups go to an in-process LRU first, then to Django's cache if it is shared between the workers
+    (SHARED_CACHE), then to the database. Entries are invalidated when the token is deleted or the user or
+    profile changes. Invalidation only reaches the LRU of the worker that saved the change, so the LRU of
+    other workers may serve a stale entry for up to TOKEN_AUTH_LOCAL_TTL seconds. A per-process Django
+    cache would keep it for TOKEN_AUTH_CACHE_TTL and is skipped.
+    """
+
+    local_cache = LRUCache(settings.TOKEN_AUTH_LOCAL_CACHE_SIZE, settings.TOKEN_AUTH_LOCAL_TTL)
+
+    @staticmethod
+    def get_cache_key(key):
+        """Return the cache key for a token without exposing the token itself."""
+        return f"auth-token:{hashlib.sha256(key.encode()).hexdigest()}"
+
+    @classmethod
+    def invalidate(cls, key):
+        """Drop the cached user of a token from both cache levels."""
+        cache_key = cls.get_cache_key(key)
+        cls.local_cache.delete(cache_key)
+        cache.delete(cache_key)
+
+    def authenticate_credentials(self, key):
+        """Return (user, token) for the key, serving the user from cache when possible."""
+        cache_key = self.get_cache_key(key)
+        payload = self.local_cache.get(cache_key)
+        if payload is None:
+            payload = cache.get(cache_key) if settings.SHARED_CACHE else None
+            if payload is None:
+                payload = self.load_payload(key)
+                if settings.SHARED_CACHE:
+                    cache.set(cache_key, payload, settings.TOKEN_AUTH_CACHE_TTL)
+            self.local_cache.set(cache_key, payload)
+        if not payload["user"]["is_active"]:
+            raise exceptions.AuthenticationFailed("User inactive or deleted.")
+        token = self.build_token(payload)
+        return (token.user, token)
+
+    def load_payload(self, key):
+        """Load the token with its user and profile in one query and return their field values.
+
+        The password hash is left out; it stays deferred on the rebuilt user and is loaded if it is read.
+        """
+        model = self.get_model()
+        try:
+            token = model.objects.select_related("user__profile").get(key=key)
+        except model.DoesNotExist:
+            raise exceptions.AuthenticationFailed("Invalid token.")
+        try:
+            profile = get_field_values(token.user.profile)
+        except ObjectDoesNotExist:
+            profile = None
+        return {
+            "token": get_field_values(token),
+            "user": get_field_values(token.user, exclude=("password",)),
+            "profile": profile,
+        }
+
+    def build_token(self, payload):
+        """Return fresh token, user and profile instances from the cached field values."""
+        token = build_instance(self.get_model(), payload["token"])
+        token.user = build_instance(token._meta.get_field("user").related_model, payload["user"])
+        if payload["profile"] is not None:
+            token.user.profile = build_instance(token.user._meta.get_field("profile").related_model, payload["profile"])
+        return token
+
+
+def get_field_values(instance, exclude=()):
+    """Return the concrete field values of a model instance by attname."""
+    fields = [field for field in instance._meta.concrete_fields if field.name not in exclude]
+    return {field.attname: getattr(instance, field.attname) for field in fields}
+
+
+def build_instance(model, values):
+    """Return a model instance loaded from field values; missing fields are deferred."""
+    return model.from_db(router.db_for_read(model), list(values), list(values.values()))
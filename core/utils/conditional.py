@@ -0,0 +1,89 @@
+import hashlib
+from django.db.models import Count, Max
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date, quote_etag
+from rest_framework.response import Response
+
+
+class ConditionalGetMixin:
+    """View mixin answering conditional GETs (If-None-Match / If-Modified-Since) with 304 Not Modified.
+
+    Lists are validated by MAX(updated_at) and the row count of the filtered queryset in one aggregate
+    query, detail views by the updated_at of the looked-up row. Views whose representation shows related
+    rows extend get_list_validator_values and get_detail_validators. Validation runs before the handler,
+    so a 304 never runs the serializer. Lists only send an ETag, because a Last-Modified date cannot tell
+    that a row was deleted. Responses served by CachedResponseMixin are validated by their cached ETag.
+    """
+
+    last_modified_field = "updated_at"
+    conditional_detail = True
+    validators = None
+    conditional_object = None
+
+    def initial(self, request, *args, **kwargs):
+        """Compute the validators after the permission checks and short-circuit the handler if they match."""
+        super().initial(request, *args, **kwargs)
+        if request.method != "GET" or getattr(self, "cached_response", None) is not None:
+            return
+        if self.is_detail_request():
+            if not self.conditional_detail:
+                return
+            self.conditional_object = self.get_object()
+            values, last_modified = self.get_detail_validators(self.conditional_object)
+        else:
+            last_modified = None
+            values = self.get_list_validator_values(self.filter_queryset(self.get_queryset()))
+        self.validators = (self.make_etag(request, values), last_modified)
+        timestamp = int(last_modified.timestamp()) if last_modified else None
+        self.conditional_response = get_conditional_response(request, etag=self.validators[0], last_modified=timestamp)
+        if self.conditional_response is not None:
+            self.get = self.respond_not_modified
+
+    def is_detail_request(self):
+        """Return whether the URL addresses a single object."""
+        return (self.lookup_url_kwarg or self.lookup_field) in self.kwargs
+
+    def get_list_validator_values(self, queryset):
+        """Return the values that change whenever the list changes: newest updated_at and row count."""
+        result = queryset.aggregate(last_modified=Max(self.last_modified_field), count=Count("pk"))
+        return [result["last_modified"], result["count"]]
+
+    def get_detail_validators(self, obj):
+        """Return the validator values of an object and its Last-Modified date: its updated_at."""
+        last_modified = getattr(obj, self.last_modified_field)
+        return [last_modified], last_modified
+
+    def make_etag(self, request, values):
+        """Return a quoted ETag over the validator values and everything else the representation depends on."""
+        parts = [
+            repr(values),
+            request.get_full_path(),
+            str(request.user.pk),
+            request.get_host(),
+            request.accepted_media_type,
+        ]
+        return quote_etag(hashlib.md5("\x1f".join(parts).encode()).hexdigest())
+
+    def respond_not_modified(self, request, *args, **kwargs):
+        """Return the 304 (or 412 for a failed If-Match) computed in initial, with the validators."""
+        self.add_validator_headers(self.conditional_response)
+        return self.conditional_response
+
+    def retrieve(self, request, *args, **kwargs):
+        """Serialize the object loaded for the validators instead of fetching it again."""
+        if self.conditional_object is None:
+            return super().retrieve(request, *args, **kwargs)
+        return Response(self.get_serializer(self.conditional_object).data)
+
+    def finalize_response(self, request, response, *args, **kwargs):
+        """Send the validators with successful responses, before a response cache stores them."""
+        if self.validators is not None and isinstance(response, Response) and response.status_code == 200:
+            self.add_validator_headers(response)
+        return super().finalize_response(request, response, *args, **kwargs)
+
+    def add_validator_headers(self, response):
+        """Set ETag and, for detail responses, Last-Modified."""
+        etag, last_modified = self.validators
+        response["ETag"] = etag
+        if last_modified is not None:
+            response["Last-Modified"] = http_date(last_modified.timestamp())
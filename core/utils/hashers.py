@@ -0,0 +1,52 @@
+from django.conf import settings
+from django.contrib.auth.hashers import Argon2PasswordHasher, PBKDF2PasswordHasher, ScryptPasswordHasher
+
+
+class ConfigurablePBKDF2PasswordHasher(PBKDF2PasswordHasher):
+    """PBKDF2-SHA256 hasher whose iteration count comes from PASSWORD_PBKDF2_ITERATIONS."""
+
+    @property
+    def iterations(self):
+        """Return the configured iteration count."""
+        return settings.PASSWORD_PBKDF2_ITERATIONS
+
+
+class ConfigurableScryptPasswordHasher(ScryptPasswordHasher):
+    """Scrypt hasher whose cost parameters come from the PASSWORD_SCRYPT_* settings."""
+
+    # Upper bound for OpenSSL, which only allocates what the parameters of a hash need (about 128 * n * r bytes).
+    maxmem = 512 * 1024 * 1024
+
+    @property
+    def work_factor(self):
+        """Return the configured CPU/memory cost n."""
+        return settings.PASSWORD_SCRYPT_WORK_FACTOR
+
+    @property
+    def block_size(self):
+        """Return the configured block size r."""
+        return settings.PASSWORD_SCRYPT_BLOCK_SIZE
+
+    @property
+    def parallelism(self):
+        """Return the configured parallelism p."""
+        return settings.PASSWORD_SCRYPT_PARALLELISM
+
+
+class ConfigurableArgon2PasswordHasher(Argon2PasswordHasher):
+    """Argon2id hasher whose cost parameters come from the PASSWORD_ARGON2_* settings (requires argon2-cffi)."""
+
+    @property
+    def time_cost(self):
+        """Return the configured number of iterations."""
+        return settings.PASSWORD_ARGON2_TIME_COST
+
+    @property
+    def memory_cost(self):
+        """Return the configured memory in KiB."""
+        return settings.PASSWORD_ARGON2_MEMORY_COST
+
+    @property
+    def parallelism(self):
+        """Return the configured number of lanes."""
+        return settings.PASSWORD_ARGON2_PARALLELISM
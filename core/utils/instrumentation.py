@@ -0,0 +1,286 @@
+import json
+import os
+import threading
+import time
+from collections import Counter
+from contextvars import ContextVar
+from pathlib import Path
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+from django.db import connections
+from django.core.signals import request_started
+from rest_framework.serializers import BaseSerializer
+
+# Upper bounds (ms) of the latency histogram buckets; the last bucket is open-ended
+HISTOGRAM_BUCKETS_MS = [5, 10, 25, 50, 100, 250, 500, 1000, 2500]
+MAX_DUPLICATE_STATEMENTS = 1000
+MAX_STATEMENT_LENGTH = 500
+SUMMED_FIELDS = ("requests", "total_time", "queries", "db_time", "serializer_time", "cache_hits", "cache_misses")
+
+current_metrics = ContextVar("request_metrics", default=None)
+
+
+class RequestMetrics:
+    """Query count, DB time, serializer time and response cache status of the request being handled."""
+
+    __slots__ = ("start", "queries", "db_time", "serializer_time", "serializer_depth", "statements", "cache_status")
+
+    def __init__(self):
+        """Start the clock for a new request."""
+        self.start = time.perf_counter()
+        self.queries = 0
+        self.db_time = 0.0
+        self.serializer_time = 0.0
+        self.serializer_depth = 0
+        self.statements = Counter()
+        self.cache_status = None
+
+    def record_query(self, sql, duration):
+        """Count one executed statement and its duration."""
+        self.queries += 1
+        self.db_time += duration
+        self.statements[sql] += 1
+
+    def duplicated_statements(self):
+        """Return the statements that ran more than once in this request with their repeat count."""
+        return {sql: count for sql, count in self.statements.items() if count > 1}
+
+    def server_timing(self, total):
+        """Return the Server-Timing header value in milliseconds."""
+        return (
+            f'db;dur={self.db_time * 1000:.1f};desc="{self.queries} queries", '
+            f"serializer;dur={self.serializer_time * 1000:.1f}, total;dur={total * 1000:.1f}"
+        )
+
+
+def query_wrapper(execute, sql, params, many, context):
+    """Database execute wrapper that times statements while a request is being measured."""
+    metrics = current_metrics.get()
+    if metrics is None:
+        return execute(sql, params, many, context)
+    start = time.perf_counter()
+    try:
+        return execute(sql, params, many, context)
+    finally:
+        metrics.record_query(sql, time.perf_counter() - start)
+
+
+def install_query_wrappers(**kwargs):
+    """Add the query wrapper once to the connections of the thread that runs the request's ORM calls.
+
+    Connected to request_started, which Django sends from that thread for WSGI and ASGI requests alike.
+    """
+    for connection in connections.all():
+        if query_wrapper not in connection.execute_wrappers:
+            connection.execute_wrappers.append(query_wrapper)
+
+
+def timed_data(self):
+    """BaseSerializer.data replacement adding the time spent serializing to the current request."""
+    metrics = current_metrics.get()
+    if metrics is None or metrics.serializer_depth:
+        return serializer_data(self)
+    metrics.serializer_depth += 1
+    start = time.perf_counter()
+    try:
+        return serializer_data(self)
+    finally:
+        metrics.serializer_time += time.perf_counter() - start
+        metrics.serializer_depth -= 1
+
+
+serializer_data = BaseSerializer.data.fget
+
+
+def install():
+    """Hook the query wrapper into all connections and time serializer output; safe to call repeatedly."""
+    request_started.connect(install_query_wrappers, dispatch_uid="request_instrumentation")
+    if BaseSerializer.data.fget is not timed_data:
+        BaseSerializer.data = property(timed_data)
+
+
+class RequestStatsCollector:
+    """Per-process, per-route latency histograms and duplicated SQL statements.
+
+    The aggregate is written to REQUEST_INSTRUMENTATION_DIR/<pid>.json at most every
+    REQUEST_INSTRUMENTATION_FLUSH_INTERVAL seconds, so the dump_request_stats command can
+    merge the snapshots of all worker processes.
+    """
+
+    def __init__(self):
+        """Start with empty statistics."""
+        self.lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        """Drop all collected statistics."""
+        with self.lock:
+            self.routes = {}
+            self.duplicates = {}
+            self.last_flush = time.monotonic()
+
+    def record(self, route, metrics, total):
+        """Add one finished request to the statistics of its route."""
+        duplicates = metrics.duplicated_statements()
+        with self.lock:
+            stats = self.routes.get(route)
+            if stats is None:
+                stats = self.routes[route] = new_route_stats()
+            stats["requests"] += 1
+            stats["total_time"] += total
+            stats["max_time"] = max(stats["max_time"], total)
+            stats["queries"] += metrics.queries
+            stats["db_time"] += metrics.db_time
+            stats["serializer_time"] += metrics.serializer_time
+            stats["histogram"][bucket_index(total)] += 1
+            if metrics.cache_status is not None:
+                stats["cache_hits" if metrics.cache_status == "hit" else "cache_misses"] += 1
+            for sql, count in duplicates.items():
+                key = f"{route}\n{sql[:MAX_STATEMENT_LENGTH]}"
+                entry = self.duplicates.get(key)
+                if entry is None:
+                    if len(self.duplicates) >= MAX_DUPLICATE_STATEMENTS:
+                        continue
+                    entry = self.duplicates[key] = {"route": route, "sql": sql[:MAX_STATEMENT_LENGTH]}
+                    entry.update(requests=0, executions=0)
+                entry["requests"] += 1
+                entry["executions"] += count
+
+    def snapshot(self):
+        """Return a JSON-serializable copy of the statistics."""
+        with self.lock:
+            return {
+                "routes": {route: dict(stats, histogram=stats["histogram"][:]) for route, stats in self.routes.items()},
+                "duplicates": [dict(entry) for entry in self.duplicates.values()],
+            }
+
+    def flush(self, force=False):
+        """Write the snapshot of this process to the stats directory when the flush interval has passed."""
+        now = time.monotonic()
+        if not force and now - self.last_flush < settings.REQUEST_INSTRUMENTATION_FLUSH_INTERVAL:
+            return
+        self.last_flush = now
+        directory = Path(settings.REQUEST_INSTRUMENTATION_DIR)
+        directory.mkdir(parents=True, exist_ok=True)
+        path = directory / f"{os.getpid()}.json"
+        temporary = path.with_suffix(".tmp")
+        temporary.write_text(json.dumps(self.snapshot()), encoding="utf-8")
+        os.replace(temporary, path)
+
+
+collector = RequestStatsCollector()
+
+
+def new_route_stats():
+    """Return empty statistics for a route."""
+    return {
+        "requests": 0,
+        "total_time": 0.0,
+        "max_time": 0.0,
+        "queries": 0,
+        "db_time": 0.0,
+        "serializer_time": 0.0,
+        "cache_hits": 0,
+        "cache_misses": 0,
+        "histogram": [0] * (len(HISTOGRAM_BUCKETS_MS) + 1),
+    }
+
+
+def bucket_index(seconds):
+    """Return the histogram bucket of a request duration."""
+    milliseconds = seconds * 1000
+    for index, bound in enumerate(HISTOGRAM_BUCKETS_MS):
+        if milliseconds <= bound:
+            return index
+    return len(HISTOGRAM_BUCKETS_MS)
+
+
+def histogram_percentile(histogram, p):
+    """Return the upper bucket bound (ms) below which p percent of the requests finished, or None above the last."""
+    target = sum(histogram) * p / 100
+    seen = 0
+    for index, count in enumerate(histogram):
+        seen += count
+        if count and seen >= target:
+            return HISTOGRAM_BUCKETS_MS[index] if index < len(HISTOGRAM_BUCKETS_MS) else None
+    return None
+
+
+def load_snapshots(directory):
+    """Merge the snapshots of all processes written to directory."""
+    routes, duplicates = {}, {}
+    for path in sorted(Path(directory).glob("*.json")):
+        snapshot = json.loads(path.read_text(encoding="utf-8"))
+        for route, stats in snapshot["routes"].items():
+            merged = routes.setdefault(route, new_route_stats())
+            for field in SUMMED_FIELDS:
+                merged[field] += stats.get(field, 0)
+            merged["max_time"] = max(merged["max_time"], stats["max_time"])
+            merged["histogram"] = [a + b for a, b in zip(merged["histogram"], stats["histogram"])]
+        for entry in snapshot["duplicates"]:
+            merged = duplicates.setdefault((entry["route"], entry["sql"]), dict(entry, requests=0, executions=0))
+            merged["requests"] += entry["requests"]
+            merged["executions"] += entry["executions"]
+    return {"routes": routes, "duplicates": list(duplicates.values())}
+
+
+def get_route(request):
+    """Return 'METHOD /route/pattern/' for the resolved view, so all ids of a route share one entry."""
+    match = getattr(request, "resolver_match", None)
+    if match is None:
+        return f"{request.method} <unresolved>"
+    return f"{request.method} /{match.route.removesuffix('$')}"
+
+
+class RequestInstrumentationMiddleware:
+    """Measure query count, DB time, serializer time and total time of every request.
+
+    Enabled with REQUEST_INSTRUMENTATION; when disabled the middleware removes itself from the
+    chain (MiddlewareNotUsed), so there is no per-request overhead. REQUEST_INSTRUMENTATION_SERVER_TIMING
+    additionally adds a Server-Timing header to each response. Works for sync and async views.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        """Install the hooks or opt out of the middleware chain when instrumentation is disabled."""
+        if not settings.REQUEST_INSTRUMENTATION:
+            raise MiddlewareNotUsed
+        install()
+        self.get_response = get_response
+        self.server_timing = settings.REQUEST_INSTRUMENTATION_SERVER_TIMING
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        """Measure a request handled synchronously."""
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        metrics = RequestMetrics()
+        token = current_metrics.set(metrics)
+        try:
+            response = self.get_response(request)
+        finally:
+            current_metrics.reset(token)
+        return self.finish(request, response, metrics)
+
+    async def __acall__(self, request):
+        """Measure a request handled asynchronously."""
+        metrics = RequestMetrics()
+        token = current_metrics.set(metrics)
+        try:
+            response = await self.get_response(request)
+        finally:
+            current_metrics.reset(token)
+        return self.finish(request, response, metrics)
+
+    def finish(self, request, response, metrics):
+        """Record the request and add the Server-Timing header if enabled."""
+        total = time.perf_counter() - metrics.start
+        collector.record(get_route(request), metrics, total)
+        collector.flush()
+        if self.server_timing:
+            response["Server-Timing"] = metrics.server_timing(total)
+        return response
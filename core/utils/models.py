@@ -0,0 +1,37 @@
+class TrackedFieldsMixin:
+    """Model mixin remembering the last saved value of selected fields.
+
+    Values are captured when an instance is loaded from the database and after each
+    save, so post_save handlers can still compare against the previous values.
+    """
+
+    tracked_fields = ()
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        """Load the instance and remember the loaded values of the tracked fields."""
+        instance = super().from_db(db, field_names, values)
+        instance.snapshot_tracked_fields()
+        return instance
+
+    def save(self, *args, **kwargs):
+        """Save the instance and remember the saved values of the tracked fields."""
+        super().save(*args, **kwargs)
+        self.snapshot_tracked_fields()
+
+    def snapshot_tracked_fields(self):
+        """Remember the current values of all loaded tracked fields."""
+        self._tracked_values = {name: getattr(self, name) for name in self.tracked_fields if name in self.__dict__}
+
+    def has_tracked_value(self, name):
+        """Return whether the previous value of the field is known."""
+        return name in getattr(self, "_tracked_values", {})
+
+    def get_tracked_value(self, name, default=None):
+        """Return the previously saved or loaded value of the field."""
+        return getattr(self, "_tracked_values", {}).get(name, default)
+
+    def get_changed_fields(self):
+        """Return the tracked fields whose value differs from the saved or loaded one."""
+        tracked = getattr(self, "_tracked_values", {})
+        return [name for name in self.tracked_fields if name not in tracked or tracked[name] != getattr(self, name)]
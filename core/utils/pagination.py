@@ -0,0 +1,193 @@
+import base64
+import binascii
+import json
+from django.core.exceptions import ValidationError as DjangoValidationError
+from django.db.models import F, Q
+from rest_framework.exceptions import NotFound, ValidationError
+from rest_framework.pagination import BasePagination, PageNumberPagination
+from rest_framework.response import Response
+from rest_framework.utils.urls import remove_query_param, replace_query_param
+
+
+PAGINATION_MODE_QUERY_PARAM = "pagination"
+PAGINATION_MODE_HEADER = "X-Pagination"
+
+
+def get_pagination_mode(request):
+    """Return the pagination mode requested via ?pagination= or the X-Pagination header, lowercased."""
+    mode = request.query_params.get(PAGINATION_MODE_QUERY_PARAM) or request.headers.get(PAGINATION_MODE_HEADER, "")
+    return mode.lower()
+
+
+class KeysetCursorPagination(BasePagination):
+    """Keyset pagination on (ordering field, id) with opaque cursors and without a COUNT query."""
+
+    cursor_query_param = "cursor"
+    page_size = 6
+    page_size_query_param = "page_size"
+    max_page_size = 1000
+    keyset_fields = ["updated_at"]
+    default_ordering = "-updated_at"
+    invalid_cursor_message = "Invalid cursor."
+
+    def paginate_queryset(self, queryset, request, view=None):
+        """Return one page of the queryset after (or before) the position encoded in the cursor."""
+        self.request = request
+        self.base_url = remove_query_param(request.build_absolute_uri(), "page")
+        self.page_size = self.get_page_size(request)
+        self.field, self.descending = self.get_keyset_ordering(queryset)
+        self.model_field = queryset.model._meta.get_field(self.field)
+        cursor = self.decode_cursor(request)
+        reverse = bool(cursor and cursor["reverse"])
+
+        if cursor is not None:
+            queryset = queryset.filter(self.position_filter(cursor, forward=not reverse))
+        results = list(queryset.order_by(*self.order_by(reverse=reverse))[: self.page_size + 1])
+        has_more = len(results) > self.page_size
+        results = results[: self.page_size]
+        if reverse:
+            results.reverse()
+            self.has_next, self.has_previous = True, has_more
+        else:
+            self.has_next, self.has_previous = has_more, cursor is not None
+        self.page = results
+        return results
+
+    def get_paginated_response(self, data):
+        """Return the page with opaque next/previous links and no count."""
+        return Response({"next": self.get_next_link(), "previous": self.get_previous_link(), "results": data})
+
+    def get_paginated_response_schema(self, schema):
+        """Return the OpenAPI schema of a cursor page."""
+        return {
+            "type": "object",
+            "required": ["results"],
+            "properties": {
+                "next": {"type": "string", "nullable": True, "format": "uri"},
+                "previous": {"type": "string", "nullable": True, "format": "uri"},
+                "results": schema,
+            },
+        }
+
+    def get_page_size(self, request):
+        """Return the requested page size, capped at max_page_size."""
+        try:
+            size = int(request.query_params.get(self.page_size_query_param, self.page_size))
+        except ValueError:
+            return self.page_size
+        return min(size, self.max_page_size) if size > 0 else self.page_size
+
+    def get_keyset_ordering(self, queryset):
+        """Return the keyset field and direction from the queryset's ordering."""
+        ordering = queryset.query.order_by[0] if queryset.query.order_by else self.default_ordering
+        field = ordering.lstrip("-") if isinstance(ordering, str) else None
+        if field not in self.keyset_fields:
+            raise ValidationError(
+                {"ordering": f"Cursor pagination supports ordering by {', '.join(self.keyset_fields)} only."}
+            )
+        return field, ordering.startswith("-")
+
+    def order_by(self, reverse=False):
+        """Return the (field, id) ordering expressions, NULL values always last in forward order."""
+        nulls = {"nulls_first": True} if reverse else {"nulls_last": True}
+        if self.descending != reverse:
+            return [F(self.field).desc(**nulls), "-id"]
+        return [F(self.field).asc(**nulls), "id"]
+
+    def position_filter(self, cursor, forward=True):
+        """Return a Q selecting rows strictly after (forward) or before the cursor position."""
+        value, pk = cursor["value"], cursor["id"]
+        greater = self.descending != forward
+        id_lookup = "id__gt" if greater else "id__lt"
+        if value is None:
+            if forward:
+                return Q(**{f"{self.field}__isnull": True, id_lookup: pk})
+            return Q(**{f"{self.field}__isnull": False}) | Q(**{f"{self.field}__isnull": True, id_lookup: pk})
+        value_lookup = f"{self.field}__gt" if greater else f"{self.field}__lt"
+        position = Q(**{value_lookup: value}) | Q(**{self.field: value, id_lookup: pk})
+        if forward:
+            position |= Q(**{f"{self.field}__isnull": True})
+        return position
+
+    def decode_cursor(self, request):
+        """Decode the opaque cursor from the request or return None for the first page."""
+        encoded = request.query_params.get(self.cursor_query_param)
+        if not encoded:
+            return None
+        try:
+            payload = json.loads(base64.urlsafe_b64decode(encoded.encode("ascii")).decode("utf-8"))
+            value = payload["v"]
+            return {
+                "value": None if value is None else self.model_field.to_python(value),
+                "id": int(payload["id"]),
+                "reverse": bool(payload.get("r", False)),
+            }
+        except (TypeError, ValueError, KeyError, binascii.Error, DjangoValidationError):
+            raise NotFound(self.invalid_cursor_message)
+
+    def encode_cursor(self, obj, reverse):
+        """Return a link to the page after (or before, when reverse) the given object."""
+        value = getattr(obj, self.field)
+        payload = {"v": None if value is None else str(value), "id": obj.id}
+        if reverse:
+            payload["r"] = True
+        encoded = base64.urlsafe_b64encode(json.dumps(payload, separators=(",", ":")).encode("utf-8")).decode("ascii")
+        return replace_query_param(self.base_url, self.cursor_query_param, encoded)
+
+    def get_next_link(self):
+        """Return the link to the next page or None."""
+        if not self.has_next or not self.page:
+            return None
+        return self.encode_cursor(self.page[-1], reverse=False)
+
+    def get_previous_link(self):
+        """Return the link to the previous page or None."""
+        if not self.has_previous or not self.page:
+            return None
+        return self.encode_cursor(self.page[0], reverse=True)
+
+
+class StandardPageNumberPagination(PageNumberPagination):
+    """Page-number pagination with a client-selectable page size, ordering unordered querysets by pk."""
+
+    page_size_query_param = "page_size"
+    max_page_size = 1000
+
+    def paginate_queryset(self, queryset, request, view=None):
+        """Paginate a stably ordered queryset by page number."""
+        if not queryset.ordered:
+            queryset = queryset.order_by("pk")
+        return super().paginate_queryset(queryset, request, view)
+
+
+class OptionalPagination(BasePagination):
+    """Pagination that is off by default and dispatches to the paginator of the requested mode.
+
+    Without ?pagination= / X-Pagination the list is returned unpaginated, as before.
+    A ?page= or ?cursor= parameter implies the matching mode.
+    """
+
+    paginator_classes = {"page": StandardPageNumberPagination}
+
+    def get_paginator_class(self, request):
+        """Return the paginator class of the requested mode or None for an unpaginated list."""
+        mode = get_pagination_mode(request)
+        if not mode:
+            mode = next((name for name in self.paginator_classes if name in request.query_params), "")
+        return self.paginator_classes.get(mode)
+
+    def paginate_queryset(self, queryset, request, view=None):
+        """Return a page from the selected paginator or None for an unpaginated list."""
+        paginator_class = self.get_paginator_class(request)
+        self.paginator = paginator_class() if paginator_class else None
+        if self.paginator is None:
+            return None
+        return self.paginator.paginate_queryset(queryset, request, view)
+
+    def get_paginated_response(self, data):
+        """Return the paginated response of the selected paginator."""
+        return self.paginator.get_paginated_response(data)
+
+    def get_paginated_response_schema(self, schema):
+        """Return the unpaginated schema, which is the default response."""
+        return schema
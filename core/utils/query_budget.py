@@ -0,0 +1,110 @@
+import logging
+from functools import wraps
+from asgiref.sync import iscoroutinefunction, sync_to_async
+from django.conf import settings
+from core.utils.instrumentation import RequestMetrics, current_metrics, install_query_wrappers
+
+logger = logging.getLogger(__name__)
+
+
+class QueryBudgetExceeded(Exception):
+    """Raised in QUERY_BUDGET_MODE 'raise' when a request runs more SQL queries than its view allows."""
+
+
+def query_budget(default=None, **budgets):
+    """Class decorator declaring the maximum number of SQL queries per request of a view.
+
+    Budgets are keyed by viewset action (list, retrieve, create, bulk, ...) or, for plain views, by
+    lower-case HTTP method; default applies to everything else and None means unlimited. Depending on
+    QUERY_BUDGET_MODE an exceeded budget raises QueryBudgetExceeded ('raise', used by the test
+    suite), logs a warning ('log', used with DEBUG) or is not checked at all ('off', production).
+    Streamed responses (?pagination=stream) are checked after their last chunk, since their queries
+    run while the body streams.
+    """
+
+    def decorate(view_class):
+        view_class.query_budgets = {**getattr(view_class, "query_budgets", {}), "default": default, **budgets}
+        dispatch = view_class.dispatch
+        if iscoroutinefunction(dispatch):
+
+            @wraps(dispatch)
+            async def budgeted_dispatch(self, request, *args, **kwargs):
+                if settings.QUERY_BUDGET_MODE == "off":
+                    return await dispatch(self, request, *args, **kwargs)
+                await sync_to_async(install_query_wrappers)()
+                with QueryCounter() as counter:
+                    response = await dispatch(self, request, *args, **kwargs)
+                return check_response_budget(self, request, response, counter.count)
+
+        else:
+
+            @wraps(dispatch)
+            def budgeted_dispatch(self, request, *args, **kwargs):
+                if settings.QUERY_BUDGET_MODE == "off":
+                    return dispatch(self, request, *args, **kwargs)
+                install_query_wrappers()
+                with QueryCounter() as counter:
+                    response = dispatch(self, request, *args, **kwargs)
+                return check_response_budget(self, request, response, counter.count)
+
+        view_class.dispatch = budgeted_dispatch
+        return view_class
+
+    return decorate
+
+
+class QueryCounter:
+    """Count the queries of a block, sharing the request metrics of the instrumentation middleware if active."""
+
+    def __enter__(self):
+        """Start counting."""
+        self.metrics = current_metrics.get()
+        self.token = None
+        if self.metrics is None:
+            self.metrics = RequestMetrics()
+            self.token = current_metrics.set(self.metrics)
+        self.start = self.metrics.queries
+        return self
+
+    def __exit__(self, *exc_info):
+        """Stop counting."""
+        self.count = self.metrics.queries - self.start
+        if self.token is not None:
+            current_metrics.reset(self.token)
+
+
+def check_response_budget(view, request, response, count):
+    """Check the budget now, or for a streamed response once its content has been consumed."""
+    if not response.streaming or getattr(response, "is_async", False):
+        check_budget(view, request, count)
+        return response
+    content = response.streaming_content
+
+    def budgeted_content():
+        install_query_wrappers()
+        with QueryCounter() as counter:
+            yield from content
+        check_budget(view, request, count + counter.count)
+
+    response.streaming_content = budgeted_content()
+    return response
+
+
+def get_action(view, request):
+    """Return the viewset action of the request, or the lower-case HTTP method for plain views."""
+    return getattr(view, "action", None) or request.method.lower()
+
+
+def check_budget(view, request, count):
+    """Raise or log if the request ran more queries than the view's budget allows."""
+    action = get_action(view, request)
+    budget = view.query_budgets.get(action, view.query_budgets["default"])
+    if budget is None or count <= budget:
+        return
+    message = (
+        f"{type(view).__name__}.{action} ({request.method} {request.path}) ran {count} SQL queries, "
+        f"budget is {budget}. Look for per-row queries (N+1) in the serializer or queryset."
+    )
+    if settings.QUERY_BUDGET_MODE == "raise":
+        raise QueryBudgetExceeded(message)
+    logger.warning(message)
@@ -0,0 +1,137 @@
+import hashlib
+import time
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from django.http import HttpResponse
+from django.utils.cache import get_conditional_response
+from django.utils.http import parse_http_date_safe
+from rest_framework.response import Response
+from core.utils.instrumentation import current_metrics
+from core.utils.pagination import get_pagination_mode
+
+CACHED_HEADERS = ("Content-Type", "ETag", "Last-Modified")
+
+
+def get_version_key(model):
+    """Return the cache key of the version counter of a model's cached responses."""
+    return f"response-cache:version:{model._meta.label_lower}"
+
+
+def get_versions(models):
+    """Return the current version of each model, starting a fresh version for models without one."""
+    keys = [get_version_key(model) for model in models]
+    versions = cache.get_many(keys)
+    for key in keys:
+        if key not in versions:
+            cache.add(key, time.time_ns())
+            versions[key] = cache.get(key)
+    return [versions[key] for key in keys]
+
+
+def bump_version(model):
+    """Move a model to a new version so all responses cached under the old one are never read again."""
+    key = get_version_key(model)
+    try:
+        cache.incr(key)
+    except ValueError:
+        cache.add(key, time.time_ns())
+
+
+def invalidate_cached_responses(*models):
+    """Invalidate the cached responses depending on models, now and again once the transaction commits.
+
+    The second bump drops responses that concurrent requests cached from the not yet committed state.
+    """
+    for model in models:
+        bump_version(model)
+        transaction.on_commit(lambda model=model: bump_version(model))
+
+
+def get_cache_role(user):
+    """Return the role a cached response may be shared with: anonymous, staff or the profile type."""
+    if not user or not user.is_authenticated:
+        return "anonymous"
+    if user.is_staff:
+        return "staff"
+    return user.profile.type
+
+
+def get_response_cache_key(request, models):
+    """Return the cache key of a GET response by route, query params, pagination mode, role, host, media type
+    and model versions.
+
+    The pagination mode is part of the key because it can also be selected with the X-Pagination header.
+    """
+    query = sorted((key, value) for key, values in request.query_params.lists() for value in values)
+    parts = [
+        request.path,
+        repr(query),
+        get_pagination_mode(request),
+        get_cache_role(request.user),
+        request.scheme,
+        request.get_host(),
+        request.accepted_media_type,
+        repr(get_versions(models)),
+    ]
+    return f"response-cache:{hashlib.sha256(chr(31).join(parts).encode()).hexdigest()}"
+
+
+def record_cache_status(status):
+    """Report a cache hit or miss to the request instrumentation, if it is measuring this request."""
+    metrics = current_metrics.get()
+    if metrics is not None:
+        metrics.cache_status = status
+
+
+class CachedResponseMixin:
+    """View mixin serving GET responses from Django's cache until one of cache_dependencies changes.
+
+    The lookup runs after authentication, permission and throttle checks, so responses are shared per
+    role (anonymous, customer, business, staff); only use it on views whose GET output and object
+    permissions depend on the role, not on the individual user. Entries are invalidated through model
+    version counters bumped by invalidate_cached_responses from post_save/post_delete receivers.
+    Responses carry X-Cache: HIT or MISS. RESPONSE_CACHE_TIMEOUT = 0 disables the cache.
+    """
+
+    cache_dependencies = ()
+    response_cache_key = None
+    cached_response = None
+
+    def initial(self, request, *args, **kwargs):
+        """Look up the cached response after the request passed authentication and permissions."""
+        super().initial(request, *args, **kwargs)
+        if request.method != "GET" or not settings.RESPONSE_CACHE_TIMEOUT:
+            return
+        self.response_cache_key = get_response_cache_key(request, self.cache_dependencies)
+        self.cached_response = cache.get(self.response_cache_key)
+        record_cache_status("hit" if self.cached_response is not None else "miss")
+        if self.cached_response is not None:
+            self.get = self.respond_from_cache
+
+    def respond_from_cache(self, request, *args, **kwargs):
+        """Return the cached response, or the 304 / 412 its cached validators answer the request with."""
+        content, headers = self.cached_response
+        last_modified = parse_http_date_safe(headers["Last-Modified"]) if "Last-Modified" in headers else None
+        response = get_conditional_response(request, etag=headers.get("ETag"), last_modified=last_modified)
+        if response is None:
+            return HttpResponse(content, headers=headers)
+        for name in ("ETag", "Last-Modified"):
+            if name in headers:
+                response[name] = headers[name]
+        return response
+
+    def finalize_response(self, request, response, *args, **kwargs):
+        """Store a fresh 200 response and mark the response as cache hit or miss."""
+        response = super().finalize_response(request, response, *args, **kwargs)
+        if self.response_cache_key is None:
+            return response
+        if self.cached_response is not None:
+            response["X-Cache"] = "HIT"
+            return response
+        if isinstance(response, Response) and response.status_code == 200:
+            response.render()
+            headers = {name: response[name] for name in CACHED_HEADERS if response.has_header(name)}
+            cache.set(self.response_cache_key, (response.content, headers), settings.RESPONSE_CACHE_TIMEOUT)
+        response["X-Cache"] = "MISS"
+        return response
@@ -0,0 +1,123 @@
+from django.db.models import Prefetch
+from django.db.models.constants import LOOKUP_SEP
+from rest_framework import serializers
+
+
+def parse_field_names(value):
+    """Return the set of comma-separated field names in a query parameter value."""
+    return {name.strip() for name in (value or "").split(",") if name.strip()}
+
+
+def get_sparse_fieldset(request):
+    """Return the (fields, omit) name sets of a GET request; fields is None unless ?fields= restricts them."""
+    if request is None or request.method != "GET":
+        return None, set()
+    params = request.query_params
+    return parse_field_names(params.get("fields")) or None, parse_field_names(params.get("omit"))
+
+
+class SparseFieldsMixin:
+    """ModelSerializer mixin dropping the fields not selected by ?fields= or listed in ?omit= on GET requests.
+
+    Fields are dropped before serialization, so nested serializers and computed fields that were not requested
+    are never evaluated. Only the serializer created by the view (and the child of its many=True list) is
+    trimmed, nested serializers always render in full. Unknown names are rejected with 400.
+    """
+
+    def get_fields(self):
+        """Return the declared fields narrowed to the requested sparse fieldset."""
+        fields = super().get_fields()
+        requested, omitted = get_sparse_fieldset(self._context.get("request"))
+        if requested is None and not omitted:
+            return fields
+        unknown = ((requested or set()) | omitted) - set(fields)
+        if unknown:
+            raise serializers.ValidationError({"fields": f"Unknown fields: {', '.join(sorted(unknown))}."})
+        return {
+            name: field
+            for name, field in fields.items()
+            if (requested is None or name in requested) and name not in omitted
+        }
+
+
+def get_select_related_lookups(tree, prefix=""):
+    """Yield the select_related lookups of a query's nested select_related dict."""
+    for name, subtree in tree.items():
+        if subtree:
+            yield from get_select_related_lookups(subtree, f"{prefix}{name}{LOOKUP_SEP}")
+        else:
+            yield f"{prefix}{name}"
+
+
+def trim_queryset(queryset, fields, required):
+    """Defer the columns and drop the joins and prefetches that none of the serializer fields read.
+
+    Primary and foreign keys and the names in required always stay loaded. Nothing is trimmed if a
+    field reads the whole object (source='*'), since it may access any attribute.
+    """
+    sources = set()
+    traversed = set()
+    for field in fields:
+        if field.write_only:
+            continue
+        if field.source == "*":
+            return queryset
+        sources.add(field.source_attrs[0])
+        if len(field.source_attrs) > 1 or isinstance(field, serializers.BaseSerializer):
+            traversed.add(field.source_attrs[0])
+
+    loaded = sources | set(required)
+    deferred = [
+        field.name
+        for field in queryset.model._meta.concrete_fields
+        if not field.primary_key and not field.is_relation and field.name not in loaded
+    ]
+    if deferred:
+        queryset = queryset.defer(*deferred)
+
+    select_related = queryset.query.select_related
+    if isinstance(select_related, dict):
+        lookups = [
+            lookup
+            for lookup in get_select_related_lookups(select_related)
+            if lookup.split(LOOKUP_SEP)[0] in traversed
+        ]
+        queryset = queryset.select_related(None)
+        if lookups:
+            queryset = queryset.select_related(*lookups)
+
+    prefetches = queryset._prefetch_related_lookups
+    kept = [
+        lookup
+        for lookup in prefetches
+        if (lookup.prefetch_through if isinstance(lookup, Prefetch) else lookup).split(LOOKUP_SEP)[0] in traversed
+    ]
+    if len(kept) != len(prefetches):
+        queryset = queryset.prefetch_related(None).prefetch_related(*kept)
+    return queryset
+
+
+class SparseQuerysetMixin:
+    """View mixin trimming the filtered queryset to the fields selected by ?fields= / ?omit=.
+
+    Columns of unselected fields (e.g. a long description) are deferred and joins and prefetches of
+    unselected relations skipped. The ordering fields, read by cursor pagination, and the updated_at
+    validator of ConditionalGetMixin stay loaded.
+    """
+
+    def filter_queryset(self, queryset):
+        """Filter the queryset and trim it to the requested sparse fieldset."""
+        queryset = super().filter_queryset(queryset)
+        requested, omitted = get_sparse_fieldset(self.request)
+        if requested is None and not omitted:
+            return queryset
+        return trim_queryset(queryset, self.get_serializer().fields.values(), self.get_required_fields(queryset))
+
+    def get_required_fields(self, queryset):
+        """Return the model fields loaded regardless of the sparse fieldset."""
+        ordering = queryset.query.order_by or queryset.model._meta.ordering
+        required = {name.lstrip("-").split(LOOKUP_SEP)[0] for name in ordering if isinstance(name, str)}
+        last_modified_field = getattr(self, "last_modified_field", None)
+        if last_modified_field:
+            required.add(last_modified_field)
+        return required
@@ -0,0 +1,43 @@
+import json
+from django.http import StreamingHttpResponse
+from rest_framework.utils.encoders import JSONEncoder
+from core.utils.pagination import get_pagination_mode
+
+
+class StreamingListMixin:
+    """List mixin adding a streaming JSON mode (?pagination=stream) with flat memory usage.
+
+    Rows are fetched with QuerySet.iterator(chunk_size=...) and serialized chunk by chunk,
+    so the full result set is never held in memory. The body is the same JSON array the
+    unpaginated list returns.
+    """
+
+    stream_mode = "stream"
+    stream_chunk_size = 500
+
+    def list(self, request, *args, **kwargs):
+        """Stream the list when requested, otherwise defer to the regular list."""
+        if get_pagination_mode(request) == self.stream_mode:
+            queryset = self.filter_queryset(self.get_queryset())
+            return StreamingHttpResponse(self.stream_json(queryset), content_type="application/json")
+        return super().list(request, *args, **kwargs)
+
+    def stream_json(self, queryset):
+        """Yield the serialized queryset as a JSON array, one chunk at a time."""
+        yield "["
+        separator = ""
+        chunk = []
+        for obj in queryset.iterator(chunk_size=self.stream_chunk_size):
+            chunk.append(obj)
+            if len(chunk) == self.stream_chunk_size:
+                yield separator + self.encode_chunk(chunk)
+                separator = ","
+                chunk = []
+        if chunk:
+            yield separator + self.encode_chunk(chunk)
+        yield "]"
+
+    def encode_chunk(self, chunk):
+        """Serialize a chunk of objects as comma-separated JSON items."""
+        data = self.get_serializer(chunk, many=True).data
+        return ",".join(json.dumps(item, cls=JSONEncoder, ensure_ascii=False, separators=(",", ":")) for item in data)
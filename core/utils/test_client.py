@@ -1,3 +1,5 @@
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from rest_framework.test import APIClient
 
 
@@ -21,3 +23,28 @@ class JSONAPIClient(APIClient):
         if content_type is None:
             format = format or "json"
         return super().patch(path, data, format=format, content_type=content_type, follow=follow, **extra)
+
+
+class ConstantQueryCountMixin:
+    """APITestCase mixin asserting that an endpoint's query count does not grow with the dataset."""
+
+    client_class = JSONAPIClient
+    dataset_sizes = (10, 100, 1000)
+
+    def assertConstantQueryCount(self, path, add_rows, params=None, sizes=None):
+        """Grow the dataset to each size via add_rows(count) and assert that GET path runs the same queries each time.
+
+        add_rows receives the number of rows to add on top of the previous size. Returns the query count per size.
+        """
+        self.client.get(path, params)
+        counts = {}
+        created = 0
+        for size in sizes or self.dataset_sizes:
+            add_rows(size - created)
+            created = size
+            with CaptureQueriesContext(connection) as captured:
+                response = self.client.get(path, params)
+            self.assertEqual(response.status_code, 200)
+            counts[size] = len(captured)
+        self.assertEqual(len(set(counts.values())), 1, f"Query count of {path} grows with the dataset: {counts}")
+        return counts
@@ -1,3 +1,18 @@
 from django.contrib import admin
+from .models import PlatformStatistics
 
-# Register your models here.
+
+@admin.register(PlatformStatistics)
+class PlatformStatisticsAdmin(admin.ModelAdmin):
+    """Read-only admin for the platform statistics counters."""
+
+    list_display = ("id", "review_count", "rating_sum", "business_profile_count", "offer_count", "updated_at")
+    readonly_fields = list_display
+
+    def has_add_permission(self, request):
+        """Disallow adding rows, the statistics are a single row."""
+        return False
+
+    def has_change_permission(self, request, obj=None):
+        """Disallow editing, use the reconcile_platform_statistics command instead."""
+        return False
@@ -1,29 +1,33 @@
-from rest_framework.views import APIView
+from django.utils.cache import get_conditional_response
 from rest_framework.response import Response
 from rest_framework.permissions import AllowAny
 from rest_framework import status
-from django.db.models import Avg
-from reviews_app.models import Review
-from profiles_app.models import Profile
+from infos_app.models import PlatformStatistics
+from core.utils.async_views import AsyncAPIView
+from core.utils.response_cache import CachedResponseMixin
 from offers_app.models import Offer
+from profiles_app.models import Profile
+from reviews_app.models import Review
 
 
-class BaseInfoView(APIView):
+class BaseInfoView(CachedResponseMixin, AsyncAPIView):
     """API view for base info statistics."""
 
     permission_classes = [AllowAny]
+    cache_dependencies = (Offer, Profile, Review)
 
-    def get(self, request, *args, **kwargs):
-        """Return review, rating, business and offer statistics."""
-        review_count = Review.objects.all().count()
-        average_rating = round(Review.objects.aggregate(Avg("rating"))["rating__avg"] or 0, 1)
-        business_profile_count = Profile.objects.filter(type="business").count()
-        offer_count = Offer.objects.all().count()
+    async def get(self, request, *args, **kwargs):
+        """Return review, rating, business and offer statistics from the counter store."""
+        stats = await PlatformStatistics.aload()
+        conditional_response = get_conditional_response(request, etag=stats.etag)
+        if conditional_response is not None:
+            conditional_response["ETag"] = stats.etag
+            return conditional_response
 
         data = {
-            "review_count": review_count,
-            "average_rating": average_rating,
-            "business_profile_count": business_profile_count,
-            "offer_count": offer_count,
+            "review_count": stats.review_count,
+            "average_rating": stats.average_rating,
+            "business_profile_count": stats.business_profile_count,
+            "offer_count": stats.offer_count,
         }
-        return Response(data, status=status.HTTP_200_OK)
+        return Response(data, status=status.HTTP_200_OK, headers={"ETag": stats.etag})
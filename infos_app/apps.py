@@ -6,3 +6,7 @@ class InfosAppConfig(AppConfig):
 
     default_auto_field = "django.db.models.BigAutoField"
     name = "infos_app"
+
+    def ready(self):
+        """Import signals when app is ready."""
+        import infos_app.signals
@@ -0,0 +1,30 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from infos_app.models import PlatformStatistics
+
+
+class Command(BaseCommand):
+    help = "Berechnet die Plattform-Statistiken neu und meldet Abweichungen der Zähler."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--dry-run", action="store_true", help="Abweichungen nur melden, nicht korrigieren.")
+
+    def handle(self, *args, **options):
+        with transaction.atomic():
+            stored = PlatformStatistics.objects.select_for_update().filter(id=PlatformStatistics.SINGLETON_ID).first()
+            actual = PlatformStatistics.compute()
+            drift = {
+                name: (getattr(stored, name) if stored else None, value)
+                for name, value in actual.items()
+                if stored is None or getattr(stored, name) != value
+            }
+            for name, (old, new) in drift.items():
+                self.stdout.write(self.style.WARNING(f"{name}: gespeichert={old}, tatsächlich={new}"))
+            if not drift:
+                self.stdout.write(self.style.SUCCESS("Keine Abweichungen gefunden."))
+                return
+            if options["dry_run"]:
+                self.stdout.write(self.style.WARNING(f"{len(drift)} Abweichungen gefunden (nicht korrigiert)."))
+                return
+            PlatformStatistics.rebuild()
+        self.stdout.write(self.style.SUCCESS(f"{len(drift)} Abweichungen korrigiert."))
@@ -0,0 +1,49 @@
+# Generated by Django 5.2 on 2026-10-17 21:06
+
+import django.utils.timezone
+from django.db import migrations, models
+from django.db.models import Count, Sum
+
+
+def build_statistics(apps, schema_editor):
+    PlatformStatistics = apps.get_model('infos_app', 'PlatformStatistics')
+    Review = apps.get_model('reviews_app', 'Review')
+    Profile = apps.get_model('profiles_app', 'Profile')
+    Offer = apps.get_model('offers_app', 'Offer')
+    reviews = Review.objects.aggregate(count=Count('id'), total=Sum('rating'))
+    PlatformStatistics.objects.create(
+        id=1,
+        review_count=reviews['count'],
+        rating_sum=reviews['total'] or 0,
+        business_profile_count=Profile.objects.filter(type='business').count(),
+        offer_count=Offer.objects.count(),
+    )
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        ('offers_app', '0009_offer_offers_app__updated_13fbe6_idx_and_more'),
+        ('profiles_app', '0004_profile_profiles_ap_type_8348d7_idx'),
+        ('reviews_app', '0003_review_reviews_app_busines_16a827_idx_and_more'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='PlatformStatistics',
+            fields=[
+                ('id', models.PositiveSmallIntegerField(default=1, editable=False, primary_key=True, serialize=False)),
+                ('review_count', models.IntegerField(default=0)),
+                ('rating_sum', models.IntegerField(default=0)),
+                ('business_profile_count', models.IntegerField(default=0)),
+                ('offer_count', models.IntegerField(default=0)),
+                ('updated_at', models.DateTimeField(default=django.utils.timezone.now)),
+            ],
+            options={
+                'verbose_name_plural': 'Platform statistics',
+            },
+        ),
+        migrations.RunPython(build_statistics, migrations.RunPython.noop),
+    ]
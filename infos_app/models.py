@@ -0,0 +1,84 @@
+import hashlib
+from asgiref.sync import sync_to_async
+from django.db import models
+from django.db.models import Count, F, Sum
+from django.utils import timezone
+from reviews_app.models import Review
+from profiles_app.models import Profile
+from offers_app.models import Offer
+
+
+class PlatformStatistics(models.Model):
+    """Single-row store of the platform counters shown by the base info endpoint."""
+
+    SINGLETON_ID = 1
+
+    id = models.PositiveSmallIntegerField(primary_key=True, default=SINGLETON_ID, editable=False)
+    review_count = models.IntegerField(default=0)
+    rating_sum = models.IntegerField(default=0)
+    business_profile_count = models.IntegerField(default=0)
+    offer_count = models.IntegerField(default=0)
+    updated_at = models.DateTimeField(default=timezone.now)
+
+    COUNTER_FIELDS = ("review_count", "rating_sum", "business_profile_count", "offer_count")
+
+    class Meta:
+        verbose_name_plural = "Platform statistics"
+
+    def __str__(self):
+        """String representation of PlatformStatistics."""
+        return f"Platform statistics ({self.updated_at:%Y-%m-%d %H:%M})"
+
+    @property
+    def average_rating(self):
+        """Return the average review rating rounded to one decimal."""
+        if not self.review_count:
+            return 0
+        return round(self.rating_sum / self.review_count, 1)
+
+    @property
+    def etag(self):
+        """Return a strong ETag derived from the counter values."""
+        values = "-".join(str(getattr(self, name)) for name in self.COUNTER_FIELDS)
+        return f'"{hashlib.md5(values.encode()).hexdigest()}"'
+
+    @classmethod
+    def compute(cls):
+        """Recompute all counters from the source tables."""
+        reviews = Review.objects.aggregate(count=Count("id"), total=Sum("rating"))
+        return {
+            "review_count": reviews["count"],
+            "rating_sum": reviews["total"] or 0,
+            "business_profile_count": Profile.objects.filter(type="business").count(),
+            "offer_count": Offer.objects.count(),
+        }
+
+    @classmethod
+    def rebuild(cls):
+        """Recompute the counters and store them in the singleton row."""
+        stats, _ = cls.objects.update_or_create(
+            id=cls.SINGLETON_ID, defaults={**cls.compute(), "updated_at": timezone.now()}
+        )
+        return stats
+
+    @classmethod
+    def load(cls):
+        """Return the singleton row, rebuilding it if it does not exist yet."""
+        stats = cls.objects.filter(id=cls.SINGLETON_ID).first()
+        return stats if stats is not None else cls.rebuild()
+
+    @classmethod
+    async def aload(cls):
+        """Async version of load() for async views."""
+        stats = await cls.objects.filter(id=cls.SINGLETON_ID).afirst()
+        return stats if stats is not None else await sync_to_async(cls.rebuild)()
+
+    @classmethod
+    def increment(cls, **deltas):
+        """Atomically add the given deltas to the counters in a single UPDATE."""
+        deltas = {name: delta for name, delta in deltas.items() if delta}
+        if not deltas:
+            return
+        cls.objects.filter(id=cls.SINGLETON_ID).update(
+            updated_at=timezone.now(), **{name: F(name) + delta for name, delta in deltas.items()}
+        )
@@ -0,0 +1,58 @@
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+from reviews_app.models import Review
+from profiles_app.models import Profile
+from offers_app.models import Offer
+from offers_app.signals import offers_bulk_created
+from .models import PlatformStatistics
+
+
+@receiver(post_save, sender=Review)
+def count_saved_review(sender, instance, created, **kwargs):
+    """Add a new review or a rating change to the statistics."""
+    if created:
+        PlatformStatistics.increment(review_count=1, rating_sum=instance.rating)
+    elif instance.has_tracked_value("rating"):
+        PlatformStatistics.increment(rating_sum=instance.rating - instance.get_tracked_value("rating"))
+
+
+@receiver(post_delete, sender=Review)
+def count_deleted_review(sender, instance, **kwargs):
+    """Remove a deleted review from the statistics."""
+    rating = instance.get_tracked_value("rating", instance.rating)
+    PlatformStatistics.increment(review_count=-1, rating_sum=-rating)
+
+
+@receiver(post_save, sender=Profile)
+def count_saved_profile(sender, instance, created, **kwargs):
+    """Count profiles that became (or stopped being) business profiles."""
+    was_business = not created and instance.get_tracked_value("type") == "business"
+    is_business = instance.type == "business"
+    if created or instance.has_tracked_value("type"):
+        PlatformStatistics.increment(business_profile_count=int(is_business) - int(was_business))
+
+
+@receiver(post_delete, sender=Profile)
+def count_deleted_profile(sender, instance, **kwargs):
+    """Remove a deleted business profile from the statistics."""
+    if instance.get_tracked_value("type", instance.type) == "business":
+        PlatformStatistics.increment(business_profile_count=-1)
+
+
+@receiver(post_save, sender=Offer)
+def count_saved_offer(sender, instance, created, **kwargs):
+    """Count a newly created offer."""
+    if created:
+        PlatformStatistics.increment(offer_count=1)
+
+
+@receiver(offers_bulk_created, sender=Offer)
+def count_bulk_created_offers(sender, offers, **kwargs):
+    """Count offers inserted in bulk."""
+    PlatformStatistics.increment(offer_count=len(offers))
+
+
+@receiver(post_delete, sender=Offer)
+def count_deleted_offer(sender, instance, **kwargs):
+    """Remove a deleted offer from the statistics."""
+    PlatformStatistics.increment(offer_count=-1)
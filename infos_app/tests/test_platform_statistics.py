@@ -0,0 +1,106 @@
+from io import StringIO
+from django.contrib.auth.models import User
+from django.core.management import call_command
+from django.urls import reverse
+from rest_framework.test import APITestCase
+from core.utils.test_client import JSONAPIClient
+from infos_app.models import PlatformStatistics
+from offers_app.models import Offer
+from reviews_app.models import Review
+
+
+class TestPlatformStatistics(APITestCase):
+    """Tests for the incrementally maintained platform statistics."""
+
+    client_class = JSONAPIClient
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.business = User.objects.create_user(username="business", email="business@mail.de")
+        cls.business.profile.type = "business"
+        cls.business.profile.save()
+        cls.customer = User.objects.create_user(username="customer", email="customer@mail.de")
+        cls.customer.profile.type = "customer"
+        cls.customer.profile.save()
+        cls.url = reverse("infos_app:base-info")
+
+    def assert_counters_match_source(self):
+        """Assert that the stored counters equal a recomputation from scratch."""
+        stats = PlatformStatistics.load()
+        self.assertEqual({name: getattr(stats, name) for name in PlatformStatistics.COUNTER_FIELDS}, stats.compute())
+
+    def test_review_create_update_delete(self):
+        """Test that review writes keep count and rating sum in sync."""
+        review = Review.objects.create(business_user=self.business, reviewer=self.customer, rating=4)
+        self.assertEqual(PlatformStatistics.load().average_rating, 4.0)
+        review.rating = 2
+        review.save()
+        self.assertEqual(PlatformStatistics.load().rating_sum, 2)
+        review.delete()
+        self.assertEqual(PlatformStatistics.load().review_count, 0)
+        self.assert_counters_match_source()
+
+    def test_profile_type_changes(self):
+        """Test that business profile count follows type changes and deletions."""
+        profile = self.customer.profile
+        profile.type = "business"
+        profile.save()
+        self.assertEqual(PlatformStatistics.load().business_profile_count, 2)
+        profile.type = "customer"
+        profile.save()
+        self.assertEqual(PlatformStatistics.load().business_profile_count, 1)
+        self.business.delete()
+        self.assertEqual(PlatformStatistics.load().business_profile_count, 0)
+        self.assert_counters_match_source()
+
+    def test_offer_create_delete_and_cascade(self):
+        """Test that offer count follows creation, deletion and user cascades."""
+        offer = Offer.objects.create(user=self.business, title="Offer", description="desc")
+        Offer.objects.create(user=self.business, title="Offer 2", description="desc")
+        offer.save()
+        self.assertEqual(PlatformStatistics.load().offer_count, 2)
+        offer.delete()
+        self.assertEqual(PlatformStatistics.load().offer_count, 1)
+        self.business.delete()
+        self.assert_counters_match_source()
+
+    def test_view_reads_single_row(self):
+        """Test that the base info view answers with a single query."""
+        PlatformStatistics.load()
+        with self.assertNumQueries(1):
+            response = self.client.get(self.url)
+        self.assertEqual(response.status_code, 200)
+        self.assertIn("ETag", response.headers)
+
+    def test_view_etag_not_modified(self):
+        """Test that a matching If-None-Match returns 304 until the statistics change."""
+        etag = self.client.get(self.url).headers["ETag"]
+        response = self.client.get(self.url, headers={"If-None-Match": etag})
+        self.assertEqual(response.status_code, 304)
+        Offer.objects.create(user=self.business, title="Offer", description="desc")
+        response = self.client.get(self.url, headers={"If-None-Match": etag})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data["offer_count"], 1)
+
+    def test_view_parses_if_none_match(self):
+        """Test that If-None-Match is parsed as a list of (weak) ETags or *, not matched as a substring."""
+        etag = self.client.get(self.url).headers["ETag"]
+        for header, expected in [(f'"other", W/{etag}', 304), ("*", 304), (etag[1:9], 200), (f'"x{etag[1:]}', 200)]:
+            with self.subTest(header=header):
+                self.assertEqual(self.client.get(self.url, headers={"If-None-Match": header}).status_code, expected)
+
+    def test_view_rebuilds_missing_row(self):
+        """Test that the view rebuilds the statistics row if it is missing."""
+        PlatformStatistics.objects.all().delete()
+        response = self.client.get(self.url)
+        self.assertEqual(response.data["business_profile_count"], 1)
+
+    def test_reconcile_command_reports_and_fixes_drift(self):
+        """Test that the reconcile command reports drift and repairs the counters."""
+        PlatformStatistics.objects.update(offer_count=42)
+        out = StringIO()
+        call_command("reconcile_platform_statistics", "--dry-run", stdout=out)
+        self.assertIn("offer_count", out.getvalue())
+        self.assertEqual(PlatformStatistics.load().offer_count, 42)
+        call_command("reconcile_platform_statistics", stdout=StringIO())
+        self.assert_counters_match_source()
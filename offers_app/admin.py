@@ -6,7 +6,7 @@ from offers_app.models import Offer, OfferDetail
 class OfferAdmin(admin.ModelAdmin):
     """Admin configuration for Offer model."""
 
-    list_display = ("id", "user", "title", "created_at", "updated_at")
+    list_display = ("id", "user", "title", "min_price", "min_delivery_time", "created_at", "updated_at")
     search_fields = ("title", "description", "user__username")
     list_filter = ("created_at", "updated_at", "user")
     ordering = ("-created_at",)
@@ -1,14 +1,15 @@
-from django.db.models import Q
 from django_filters import rest_framework as filters
+from rest_framework.filters import OrderingFilter
 from offers_app.models import Offer
+from offers_app.search import get_search_backend
 
 
 class OfferFilter(filters.FilterSet):
     """FilterSet for filtering offers by creator, price, delivery time, and search."""
 
     creator_id = filters.NumberFilter(field_name="user__id", lookup_expr="exact")
-    min_price = filters.NumberFilter(field_name="details__price", lookup_expr="gte")
-    max_delivery_time = filters.NumberFilter(field_name="details__delivery_time_in_days", lookup_expr="lte")
+    min_price = filters.NumberFilter(field_name="min_price", lookup_expr="gte")
+    max_delivery_time = filters.NumberFilter(field_name="min_delivery_time", lookup_expr="lte")
     search = filters.CharFilter(method="filter_search")
 
     class Meta:
@@ -16,9 +17,25 @@ class OfferFilter(filters.FilterSet):
         fields = []
 
     def filter_search(self, queryset, name, value):
-        """Custom search filter for title and description."""
-        terms = value.split()
-        q = Q()
-        for term in terms:
-            q |= Q(title__icontains=term) | Q(description__icontains=term)
-        return queryset.filter(q)
+        """Search title and description via the configured search backend."""
+        return get_search_backend().search(queryset, value)
+
+
+class OfferOrderingFilter(OrderingFilter):
+    """OrderingFilter supporting ordering=relevance for search results (best matches first)."""
+
+    def get_ordering(self, request, queryset, view):
+        """Map relevance to a descending rank and drop it when no search was applied."""
+        ordering = super().get_ordering(request, queryset, view)
+        if not ordering:
+            return ordering
+        has_relevance = "relevance" in queryset.query.annotations
+        result = []
+        for field in ordering:
+            if field.lstrip("-") != "relevance":
+                result.append(field)
+            elif has_relevance:
+                result.append("relevance" if field.startswith("-") else "-relevance")
+                if "updated_at" not in ordering and "-updated_at" not in ordering:
+                    result.append("-updated_at")
+        return result or self.get_default_ordering(view)
@@ -1,10 +1,41 @@
 from rest_framework.pagination import PageNumberPagination
+from core.utils.pagination import KeysetCursorPagination, get_pagination_mode
+
+
+class OfferCursorPagination(KeysetCursorPagination):
+    """Keyset pagination for offers matching the offer ordering_fields."""
+
+    keyset_fields = ["updated_at", "min_price"]
 
 
 class OfferPagination(PageNumberPagination):
-    """Pagination for offers with custom page size and query params."""
+    """Pagination for offers with custom page size and query params.
+
+    Page-number mode is the default; cursor mode is selected with ?pagination=cursor,
+    the X-Pagination header set to "cursor", or a ?cursor= parameter.
+    """
 
     page_size = 6
     page_size_query_param = "page_size"
     max_page_size = 1000
     page_query_param = "page"
+    cursor_class = OfferCursorPagination
+
+    def paginate_queryset(self, queryset, request, view=None):
+        """Paginate by page number or, when requested, by keyset cursor."""
+        self.cursor_paginator = None
+        if self.use_cursor(request):
+            self.cursor_paginator = self.cursor_class()
+            return self.cursor_paginator.paginate_queryset(queryset, request, view)
+        return super().paginate_queryset(queryset, request, view)
+
+    def get_paginated_response(self, data):
+        """Return the paginated response of the active mode."""
+        if self.cursor_paginator is not None:
+            return self.cursor_paginator.get_paginated_response(data)
+        return super().get_paginated_response(data)
+
+    def use_cursor(self, request):
+        """Return whether the client asked for cursor pagination."""
+        mode = get_pagination_mode(request)
+        return mode == "cursor" or self.cursor_class.cursor_query_param in request.query_params
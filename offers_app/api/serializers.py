@@ -1,10 +1,14 @@
 from rest_framework import serializers
-from django.db import models
 from django.contrib.auth.models import User
+from django.db import transaction
 from offers_app.models import Offer, OfferDetail
+from offers_app.search import get_search_backend
+from offers_app.signals import offers_bulk_created
+from core.utils.response_cache import invalidate_cached_responses
+from core.utils.sparse_fields import SparseFieldsMixin
 
 
-class OfferDetailSerializer(serializers.ModelSerializer):
+class OfferDetailSerializer(SparseFieldsMixin, serializers.ModelSerializer):
     """Serializer for OfferDetail model."""
 
     class Meta:
@@ -41,12 +45,53 @@ class OfferUserDetailSerializer(serializers.ModelSerializer):
         read_only_fields = ["first_name", "last_name", "username"]
 
 
-class OfferSerializer(serializers.ModelSerializer):
+class OfferListSerializer(serializers.ListSerializer):
+    """List serializer creating many offers with batched inserts."""
+
+    batch_size = 500
+
+    def run_child_validation(self, data):
+        """Validate one offer with its raw data available as initial_data."""
+        self.child.initial_data = data
+        return super().run_child_validation(data)
+
+    def create(self, validated_data):
+        """Insert all offers and their details with bulk_create in one transaction."""
+        user = self.context["request"].user
+        offers = []
+        details_per_offer = []
+        for item in validated_data:
+            details_data = [{k: v for k, v in d.items() if k != "id"} for d in item.pop("details", [])]
+            offers.append(
+                Offer(
+                    user=user,
+                    min_price=min((d["price"] for d in details_data), default=None),
+                    min_delivery_time=min((d["delivery_time_in_days"] for d in details_data), default=None),
+                    **item,
+                )
+            )
+            details_per_offer.append(details_data)
+        with transaction.atomic():
+            Offer.objects.bulk_create(offers, batch_size=self.batch_size)
+            OfferDetail.objects.bulk_create(
+                [
+                    OfferDetail(offer=offer, **detail_data)
+                    for offer, details_data in zip(offers, details_per_offer)
+                    for detail_data in details_data
+                ],
+                batch_size=self.batch_size,
+            )
+            get_search_backend().index_new_offers(offers)
+            offers_bulk_created.send(sender=Offer, offers=offers)
+        return offers
+
+
+class OfferSerializer(SparseFieldsMixin, serializers.ModelSerializer):
     """Serializer for Offer model with details and user info."""
 
     user_details = OfferUserDetailSerializer(source="user", read_only=True)
-    min_price = serializers.SerializerMethodField()
-    min_delivery_time = serializers.SerializerMethodField()
+    min_price = serializers.DecimalField(max_digits=10, decimal_places=2, read_only=True, coerce_to_string=False)
+    min_delivery_time = serializers.IntegerField(read_only=True)
     details = OfferDetailSerializer(many=True, required=False)
 
     class Meta:
@@ -65,6 +110,7 @@ class OfferSerializer(serializers.ModelSerializer):
             "user_details",
         )
         read_only_fields = ["user", "id", "created_at", "updated_at"]
+        list_serializer_class = OfferListSerializer
 
     def validate(self, attrs):
         """Validate offer details for creation and update."""
@@ -90,26 +136,12 @@ class OfferSerializer(serializers.ModelSerializer):
 
         return attrs
 
-    def get_min_price(self, obj):
-        """Get minimum price from offer details."""
-
-        if obj.details.exists():
-            return obj.details.aggregate(models.Min("price"))["price__min"]
-        return None
-
-    def get_min_delivery_time(self, obj):
-        """Get minimum delivery time from offer details."""
-
-        if obj.details.exists():
-            return obj.details.aggregate(models.Min("delivery_time_in_days"))["delivery_time_in_days__min"]
-        return None
-
     def __init__(self, *args, **kwargs):
         """Customize fields based on request method."""
 
         super().__init__(*args, **kwargs)
         request = self.context.get("request")
-        if request and request.method in ["GET"]:
+        if request and request.method in ["GET"] and "details" in self.fields:
             self.fields["details"] = OfferDetailLinkSerializer(many=True, read_only=True)
 
     def create(self, validated_data):
@@ -118,29 +150,47 @@ class OfferSerializer(serializers.ModelSerializer):
         validated_data["user"] = self.context["request"].user
         details_data = validated_data.pop("details", [])
         offer = Offer.objects.create(**validated_data)
-        for detail_data in details_data:
-            OfferDetail.objects.create(offer=offer, **detail_data)
+        OfferDetail.objects.bulk_create([OfferDetail(offer=offer, **detail_data) for detail_data in details_data])
+        Offer.objects.filter(pk=offer.pk).update_min_values()
+        offer.refresh_from_db(fields=["min_price", "min_delivery_time"])
+        invalidate_cached_responses(Offer, OfferDetail)
         return offer
 
     def update(self, instance, validated_data):
-        """Update offer and its details."""
+        """Update offer and its details, writing only changed detail fields in one bulk_update."""
 
         details_data = validated_data.pop("details", None)
         for attr, value in validated_data.items():
             setattr(instance, attr, value)
-        instance.save()
-        if details_data is not None:
-            for new_detail in details_data:
-                offer_type = new_detail.get("offer_type")
-                old_detail = instance.details.filter(offer_type=offer_type).first()
-                if old_detail:
-                    for key, value in new_detail.items():
-                        setattr(old_detail, key, value)
-                    old_detail.save()
-                else:
-                    raise serializers.ValidationError(
-                        {
-                            "details": f"No existing detail with offer_type '{offer_type}' found. Cannot create new details on update."
-                        }
-                    )
+        with transaction.atomic():
+            instance.save(update_fields=[*validated_data, "updated_at"])
+            if details_data is not None:
+                self.update_details(instance, details_data)
         return instance
+
+    def update_details(self, instance, details_data):
+        """Apply detail changes in memory and persist only the modified fields."""
+        details = {detail.offer_type: detail for detail in instance.details.all()}
+        changed_details = {}
+        changed_fields = set()
+        for new_detail in details_data:
+            offer_type = new_detail.get("offer_type")
+            old_detail = details.get(offer_type)
+            if old_detail is None:
+                raise serializers.ValidationError(
+                    {
+                        "details": f"No existing detail with offer_type '{offer_type}' found. Cannot create new details on update."
+                    }
+                )
+            for key, value in new_detail.items():
+                if key not in ("id", "offer_type") and getattr(old_detail, key) != value:
+                    setattr(old_detail, key, value)
+                    changed_fields.add(key)
+                    changed_details[old_detail.pk] = old_detail
+        if not changed_details:
+            return
+        OfferDetail.objects.bulk_update(changed_details.values(), sorted(changed_fields))
+        invalidate_cached_responses(OfferDetail)
+        if changed_fields & {"price", "delivery_time_in_days"}:
+            Offer.objects.filter(pk=instance.pk).update_min_values()
+            instance.refresh_from_db(fields=["min_price", "min_delivery_time"])
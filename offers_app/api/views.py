@@ -1,24 +1,67 @@
-from django.db.models import Min
+from django.db.models import Count, F, Max, Prefetch, Subquery
+from django_filters.rest_framework import DjangoFilterBackend
+from rest_framework.decorators import action
 from rest_framework.viewsets import ModelViewSet, ReadOnlyModelViewSet
 from rest_framework.response import Response
 from rest_framework import status
 from offers_app.models import Offer, OfferDetail
 from offers_app.api.serializers import OfferSerializer, OfferDetailSerializer
-from offers_app.api.filters import OfferFilter
+from offers_app.api.filters import OfferFilter, OfferOrderingFilter
 from offers_app.api.pagination import OfferPagination
 from offers_app.api.permissions import IsAuthenticatedOrBusinessCreateOrOwnerUpdateDelete
+from core.utils.conditional import ConditionalGetMixin
+from core.utils.query_budget import query_budget
+from core.utils.response_cache import CachedResponseMixin
+from core.utils.sparse_fields import SparseQuerysetMixin
+from profiles_app.models import Profile
 
 
-class OfferModelViewSet(ModelViewSet):
+@query_budget(list=6, retrieve=4, create=10, update=12, partial_update=12, destroy=10, bulk=60)
+class OfferModelViewSet(ConditionalGetMixin, SparseQuerysetMixin, CachedResponseMixin, ModelViewSet):
     """ViewSet for listing, creating, updating, and deleting offers."""
 
-    queryset = Offer.objects.all().distinct().annotate(min_price=Min("details__price"))
+    queryset = Offer.objects.all()
     serializer_class = OfferSerializer
+    filter_backends = [DjangoFilterBackend, OfferOrderingFilter]
     filterset_class = OfferFilter
-    ordering_fields = ["updated_at", "min_price"]
+    ordering_fields = ["updated_at", "min_price", "relevance"]
     ordering = ["-updated_at"]
     pagination_class = OfferPagination
     permission_classes = [IsAuthenticatedOrBusinessCreateOrOwnerUpdateDelete]
+    bulk_max_offers = 1000
+    cache_dependencies = (Offer, OfferDetail, Profile)
+
+    def get_queryset(self):
+        """Return offers with user joined and, for reads, only the detail ids prefetched.
+
+        Detail reads also annotate the updated_at of the owner's profile for the validators.
+        """
+        queryset = super().get_queryset().select_related("user")
+        if self.request.method == "GET":
+            detail_links = OfferDetail.objects.only("id", "offer_id")
+            queryset = queryset.prefetch_related(Prefetch("details", queryset=detail_links))
+            if self.is_detail_request():
+                queryset = queryset.annotate(owner_updated_at=F("user__profile__updated_at"))
+        return queryset
+
+    def get_list_validator_values(self, queryset):
+        """Also validate the newest profile update of the listed owners, whose names the user_details show.
+
+        It is read by a scalar subquery in the same aggregate query, so the offers are still aggregated
+        from the updated_at index instead of being joined row by row with their owners.
+        """
+        owners = Profile.objects.filter(user__in=queryset.values("user")).order_by("-updated_at")
+        result = queryset.aggregate(
+            last_modified=Max(self.last_modified_field),
+            owner_last_modified=Max(Subquery(owners.values("updated_at")[:1])),
+            count=Count("pk"),
+        )
+        return [result["last_modified"], result["owner_last_modified"], result["count"]]
+
+    def get_detail_validators(self, obj):
+        """Validate the offer together with its owner's profile, whose names the user_details show."""
+        values = [obj.updated_at, obj.owner_updated_at]
+        return values, max(filter(None, values))
 
     def update(self, request, *args, **kwargs):
         """Handle PATCH update, block PUT requests."""
@@ -29,11 +72,23 @@ class OfferModelViewSet(ModelViewSet):
         else:
             return super().update(request, *args, **kwargs)
 
+    @action(detail=False, methods=["post"], url_path="bulk")
+    def bulk(self, request, *args, **kwargs):
+        """Create many offers at once; all are validated first and errors are reported per item."""
+        serializer = self.get_serializer(data=request.data, many=True, allow_empty=False, max_length=self.bulk_max_offers)
+        serializer.is_valid(raise_exception=True)
+        offers = serializer.save()
+        created = Offer.objects.filter(pk__in=[offer.pk for offer in offers]).select_related("user")
+        created = created.prefetch_related("details").order_by("id")
+        return Response(self.get_serializer(created, many=True).data, status=status.HTTP_201_CREATED)
+
 
-class OfferDetailViewSet(ReadOnlyModelViewSet):
+@query_budget(default=2)
+class OfferDetailViewSet(SparseQuerysetMixin, CachedResponseMixin, ReadOnlyModelViewSet):
     """Read-only ViewSet for offer details."""
 
     queryset = OfferDetail.objects.all().distinct()
     serializer_class = OfferDetailSerializer
     pagination_class = None
     lookup_field = "id"
+    cache_dependencies = (OfferDetail,)
@@ -6,3 +6,7 @@ class OffersAppConfig(AppConfig):
 
     default_auto_field = "django.db.models.BigAutoField"
     name = "offers_app"
+
+    def ready(self):
+        """Import signals when app is ready."""
+        import offers_app.signals
@@ -0,0 +1,69 @@
+import random
+import statistics
+import time
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from offers_app.models import Offer
+from offers_app.search import IcontainsSearchBackend, InvertedIndexSearchBackend
+
+WORDS = [
+    "web", "design", "logo", "entwicklung", "python", "django", "shop", "seo", "marketing", "video",
+    "foto", "text", "übersetzung", "app", "android", "ios", "daten", "analyse", "beratung", "support",
+    "wordpress", "branding", "social", "media", "schnitt", "animation", "illustration", "druck", "server", "cloud",
+]
+VOCABULARY = [f"{word}{i}" for word in WORDS for i in range(100)]
+QUERIES = ["web", "logo design", "python17", "foto3 cloud42", "server support7", "nichtvorhanden"]
+
+
+class Command(BaseCommand):
+    help = "Vergleicht die Offer-Suche (icontains vs. invertierter Index) auf synthetischen Daten."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--offers", type=int, default=100000, help="Anzahl synthetischer Offers.")
+        parser.add_argument("--repeat", type=int, default=5, help="Wiederholungen pro Suchanfrage.")
+
+    def handle(self, *args, **options):
+        random.seed(42)
+        with transaction.atomic():
+            user, _ = User.objects.get_or_create(username="benchmark_search", defaults={"email": "bench@search.local"})
+            self.seed(user, options["offers"])
+            offers = Offer.objects.filter(user=user)
+            started = time.perf_counter()
+            written = InvertedIndexSearchBackend().rebuild(offers)
+            self.stdout.write(f"Index: {written} Einträge in {time.perf_counter() - started:.2f}s aufgebaut.")
+            for backend in (IcontainsSearchBackend(), InvertedIndexSearchBackend()):
+                for query in QUERIES:
+                    orderings = [["-updated_at"]]
+                    if "relevance" in backend.search(offers, query).query.annotations:
+                        orderings.append(["-relevance", "-updated_at"])
+                    for ordering in orderings:
+                        timings = []
+                        for _ in range(options["repeat"]):
+                            started = time.perf_counter()
+                            results = backend.search(offers, query).order_by(*ordering)
+                            count = results.count()
+                            list(results.values_list("id", flat=True)[:6])
+                            timings.append((time.perf_counter() - started) * 1000)
+                        self.stdout.write(
+                            f"{type(backend).__name__:<28} {query!r:<20} {ordering[0]:<12} Treffer={count:<7} "
+                            f"median={statistics.median(timings):.1f}ms max={max(timings):.1f}ms"
+                        )
+            transaction.set_rollback(True)
+        self.stdout.write(self.style.SUCCESS("Benchmark abgeschlossen, synthetische Daten wurden verworfen."))
+
+    def seed(self, user, total):
+        """Insert synthetic offers in batches without firing per-offer signals."""
+        batch = []
+        for i in range(total):
+            batch.append(
+                Offer(
+                    user=user,
+                    title=" ".join(random.sample(WORDS, 3)).title(),
+                    description=" ".join(random.choices(VOCABULARY, k=40)),
+                )
+            )
+            if len(batch) == 5000:
+                Offer.objects.bulk_create(batch)
+                batch = []
+        Offer.objects.bulk_create(batch)
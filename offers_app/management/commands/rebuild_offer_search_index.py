@@ -0,0 +1,13 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from offers_app.models import Offer
+from offers_app.search import get_search_backend
+
+
+class Command(BaseCommand):
+    help = "Baut den Suchindex für alle Offers neu auf."
+
+    def handle(self, *args, **options):
+        with transaction.atomic():
+            written = get_search_backend().rebuild(Offer.objects.all())
+        self.stdout.write(self.style.SUCCESS(f"Suchindex mit {written} Einträgen neu aufgebaut."))
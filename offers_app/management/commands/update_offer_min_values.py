@@ -0,0 +1,16 @@
+from django.core.management.base import BaseCommand
+from offers_app.models import Offer
+
+
+class Command(BaseCommand):
+    help = "Berechnet min_price und min_delivery_time aller Offers neu (Backfill/Reparatur)."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--offer-id", type=int, nargs="*", help="Nur die angegebenen Offers aktualisieren.")
+
+    def handle(self, *args, **options):
+        offers = Offer.objects.all()
+        if options["offer_id"]:
+            offers = offers.filter(id__in=options["offer_id"])
+        updated = offers.update_min_values()
+        self.stdout.write(self.style.SUCCESS(f"Mindestwerte für {updated} Offers aktualisiert."))
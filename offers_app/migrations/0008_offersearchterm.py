@@ -0,0 +1,51 @@
+# Generated by Django 5.2 on 2026-10-17 20:49
+
+import re
+from collections import Counter
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+# Frozen copy of offers_app.search.build_terms as of this migration.
+def build_terms(title, description):
+    weights = Counter()
+    for weight, text in ((3, title), (1, description)):
+        for token in re.findall(r'\w+', (text or '').lower()):
+            weights[token[:100]] += weight
+    return weights
+
+
+def build_search_index(apps, schema_editor):
+    Offer = apps.get_model('offers_app', 'Offer')
+    OfferSearchTerm = apps.get_model('offers_app', 'OfferSearchTerm')
+    entries = []
+    for offer in Offer.objects.only('id', 'title', 'description').iterator(chunk_size=1000):
+        entries.extend(
+            OfferSearchTerm(offer_id=offer.id, term=term, weight=weight)
+            for term, weight in build_terms(offer.title, offer.description).items()
+        )
+    OfferSearchTerm.objects.bulk_create(entries, batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('offers_app', '0007_offer_min_delivery_time_offer_min_price'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='OfferSearchTerm',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('term', models.CharField(db_index=True, max_length=100)),
+                ('weight', models.PositiveIntegerField(default=1)),
+                ('offer', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='search_terms', to='offers_app.offer')),
+            ],
+            options={
+                'unique_together': {('offer', 'term')},
+            },
+        ),
+        migrations.RunPython(build_search_index, migrations.RunPython.noop),
+    ]
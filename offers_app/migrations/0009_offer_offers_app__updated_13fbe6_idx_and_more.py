@@ -0,0 +1,49 @@
+# Generated by Django 5.2 on 2026-10-17 21:00
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+def check_duplicate_offer_types(apps, schema_editor):
+    OfferDetail = apps.get_model('offers_app', 'OfferDetail')
+    duplicates = (
+        OfferDetail.objects.exclude(offer_type='')
+        .values('offer_id', 'offer_type')
+        .annotate(count=models.Count('id'))
+        .filter(count__gt=1)
+        .order_by('offer_id', 'offer_type')
+    )
+    if duplicates:
+        listed = ', '.join(f"offer {row['offer_id']}: {row['offer_type']} ({row['count']}x)" for row in duplicates)
+        raise RuntimeError(
+            'Cannot add unique_offer_detail_type, these offers have more than one detail of the same type: '
+            f'{listed}. Delete the surplus details or change their offer_type, then run migrate again.'
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('offers_app', '0008_offersearchterm'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='offer',
+            index=models.Index(fields=['-updated_at'], name='offers_app__updated_13fbe6_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='offer',
+            index=models.Index(fields=['min_price'], name='offers_app__min_pri_b4052f_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='offer',
+            index=models.Index(fields=['min_delivery_time'], name='offers_app__min_del_5caed0_idx'),
+        ),
+        migrations.RunPython(check_duplicate_offer_types, migrations.RunPython.noop),
+        migrations.AddConstraint(
+            model_name='offerdetail',
+            constraint=models.UniqueConstraint(condition=models.Q(('offer_type', ''), _negated=True), fields=('offer', 'offer_type'), name='unique_offer_detail_type'),
+        ),
+    ]
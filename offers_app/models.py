@@ -1,4 +1,5 @@
 from django.db import models
+from django.db.models import Min, OuterRef, Subquery
 from django.contrib.auth.models import User
 
 
@@ -20,11 +21,30 @@ class OfferDetail(models.Model):
     offer_type = models.CharField(choices=OFFER_TYPE_CHOICES, max_length=50)
     offer = models.ForeignKey("Offer", on_delete=models.CASCADE, related_name="details", default=None)
 
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["offer", "offer_type"], condition=~models.Q(offer_type=""), name="unique_offer_detail_type"
+            )
+        ]
+
     def __str__(self):
         """String representation of OfferDetail."""
         return self.title
 
 
+class OfferQuerySet(models.QuerySet):
+    """QuerySet for offers with helpers for the denormalized detail minima."""
+
+    def update_min_values(self):
+        """Recompute min_price and min_delivery_time from the details in a single UPDATE."""
+        details = OfferDetail.objects.filter(offer=OuterRef("pk")).order_by().values("offer")
+        return self.update(
+            min_price=Subquery(details.annotate(value=Min("price")).values("value")),
+            min_delivery_time=Subquery(details.annotate(value=Min("delivery_time_in_days")).values("value")),
+        )
+
+
 class Offer(models.Model):
     """Model for an offer posted by a user."""
 
@@ -35,7 +55,33 @@ class Offer(models.Model):
     description = models.TextField()
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
+    min_price = models.DecimalField(max_digits=10, decimal_places=2, blank=True, null=True, editable=False)
+    min_delivery_time = models.IntegerField(blank=True, null=True, editable=False)
+
+    objects = OfferQuerySet.as_manager()
+
+    class Meta:
+        indexes = [
+            models.Index(fields=["-updated_at"]),
+            models.Index(fields=["min_price"]),
+            models.Index(fields=["min_delivery_time"]),
+        ]
 
     def __str__(self):
         """String representation of Offer."""
         return f"Offer by {self.user.username} for {self.title}"
+
+
+class OfferSearchTerm(models.Model):
+    """Inverted index entry mapping a normalized term to an offer with a relevance weight."""
+
+    offer = models.ForeignKey(Offer, on_delete=models.CASCADE, related_name="search_terms")
+    term = models.CharField(max_length=100, db_index=True)
+    weight = models.PositiveIntegerField(default=1)
+
+    class Meta:
+        unique_together = ("offer", "term")
+
+    def __str__(self):
+        """String representation of OfferSearchTerm."""
+        return f"{self.term} ({self.weight})"
@@ -0,0 +1,113 @@
+import re
+from collections import Counter
+from django.conf import settings
+from django.db.models import OuterRef, Q, Subquery, Sum
+from django.utils.module_loading import import_string
+from offers_app.models import OfferSearchTerm
+
+TERM_MAX_LENGTH = 100
+TITLE_WEIGHT = 3
+DESCRIPTION_WEIGHT = 1
+PREFIX_UPPER_BOUND = chr(0x10FFFF)
+DEFAULT_BACKEND = "offers_app.search.InvertedIndexSearchBackend"
+
+
+def tokenize(text):
+    """Split text into lowercase word terms."""
+    return [token[:TERM_MAX_LENGTH] for token in re.findall(r"\w+", (text or "").lower())]
+
+
+def build_terms(title, description):
+    """Return a mapping of term to weight for an offer's title and description."""
+    weights = Counter()
+    for token in tokenize(title):
+        weights[token] += TITLE_WEIGHT
+    for token in tokenize(description):
+        weights[token] += DESCRIPTION_WEIGHT
+    return weights
+
+
+class IcontainsSearchBackend:
+    """Search backend matching terms with icontains on title and description (no index, no relevance)."""
+
+    def index_offer(self, offer):
+        """Nothing to index for this backend."""
+
+    def index_new_offers(self, offers):
+        """Nothing to index for this backend."""
+
+    def rebuild(self, queryset):
+        """Nothing to rebuild for this backend."""
+        return 0
+
+    def search(self, queryset, value):
+        """Filter offers whose title or description contains any of the terms."""
+        terms = value.split()
+        q = Q()
+        for term in terms:
+            q |= Q(title__icontains=term) | Q(description__icontains=term)
+        return queryset.filter(q)
+
+
+class InvertedIndexSearchBackend(IcontainsSearchBackend):
+    """Search backend using the OfferSearchTerm inverted index with prefix matching.
+
+    The index is backfilled by migration 0008 and kept current on save and delete; offers inserted
+    outside the ORM need rebuild_offer_search_index. Without an index, use IcontainsSearchBackend.
+    """
+
+    def index_offer(self, offer):
+        """Replace the indexed terms of a single offer."""
+        OfferSearchTerm.objects.filter(offer=offer).delete()
+        OfferSearchTerm.objects.bulk_create(
+            [
+                OfferSearchTerm(offer=offer, term=term, weight=weight)
+                for term, weight in build_terms(offer.title, offer.description).items()
+            ]
+        )
+
+    def index_new_offers(self, offers, batch_size=1000):
+        """Index freshly inserted offers (e.g. from bulk_create, which sends no post_save) in one batch."""
+        OfferSearchTerm.objects.bulk_create(
+            [
+                OfferSearchTerm(offer_id=offer.id, term=term, weight=weight)
+                for offer in offers
+                for term, weight in build_terms(offer.title, offer.description).items()
+            ],
+            batch_size=batch_size,
+        )
+
+    def rebuild(self, queryset, batch_size=1000):
+        """Rebuild the index for all offers in the queryset and return the number of terms written."""
+        OfferSearchTerm.objects.filter(offer__in=queryset).delete()
+        entries = []
+        written = 0
+        for offer in queryset.only("id", "title", "description").iterator(chunk_size=batch_size):
+            entries.extend(
+                OfferSearchTerm(offer_id=offer.id, term=term, weight=weight)
+                for term, weight in build_terms(offer.title, offer.description).items()
+            )
+            if len(entries) >= batch_size:
+                OfferSearchTerm.objects.bulk_create(entries, batch_size=batch_size)
+                written += len(entries)
+                entries = []
+        OfferSearchTerm.objects.bulk_create(entries, batch_size=batch_size)
+        return written + len(entries)
+
+    def search(self, queryset, value):
+        """Filter offers with an indexed term starting with any query term, ranked by summed weight."""
+        tokens = set(tokenize(value))
+        if not tokens:
+            return queryset
+        match = Q()
+        for token in tokens:
+            match |= Q(term__gte=token, term__lt=token + PREFIX_UPPER_BOUND)
+        matches = OfferSearchTerm.objects.filter(match)
+        scores = matches.filter(offer=OuterRef("pk")).order_by().values("offer").annotate(score=Sum("weight"))
+        relevance = scores.values("score")
+        return queryset.filter(pk__in=matches.values("offer")).annotate(relevance=Subquery(relevance))
+
+
+def get_search_backend():
+    """Return an instance of the search backend configured in OFFER_SEARCH_BACKEND."""
+    return import_string(getattr(settings, "OFFER_SEARCH_BACKEND", DEFAULT_BACKEND))()
@@ -0,0 +1,38 @@
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import Signal, receiver
+from .models import Offer, OfferDetail
+from .search import get_search_backend
+from core.utils.response_cache import invalidate_cached_responses
+
+# Sent with offers=[...] after offers were inserted with bulk_create, which sends no post_save.
+offers_bulk_created = Signal()
+
+
+@receiver(post_save, sender=OfferDetail)
+@receiver(post_delete, sender=OfferDetail)
+def update_offer_min_values(sender, instance, **kwargs):
+    """Keep the denormalized minima of the offer in sync with its details."""
+    Offer.objects.filter(pk=instance.offer_id).update_min_values()
+
+
+@receiver(post_save, sender=Offer)
+def index_offer_for_search(sender, instance, update_fields=None, **kwargs):
+    """Reindex the offer's search terms when its title or description may have changed."""
+    if update_fields is not None and not {"title", "description"} & set(update_fields):
+        return
+    get_search_backend().index_offer(instance)
+
+
+@receiver(post_save, sender=Offer)
+@receiver(post_delete, sender=Offer)
+@receiver(post_save, sender=OfferDetail)
+@receiver(post_delete, sender=OfferDetail)
+def invalidate_offer_responses(sender, **kwargs):
+    """Drop cached responses that contain the changed offer or offer detail."""
+    invalidate_cached_responses(sender)
+
+
+@receiver(offers_bulk_created, sender=Offer)
+def invalidate_bulk_created_offer_responses(sender, offers, **kwargs):
+    """Drop cached responses after offers and details were bulk inserted without post_save."""
+    invalidate_cached_responses(Offer, OfferDetail)
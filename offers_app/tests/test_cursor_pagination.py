@@ -0,0 +1,94 @@
+from django.contrib.auth.models import User
+from django.urls import reverse
+from rest_framework.test import APITestCase
+from core.utils.test_client import JSONAPIClient
+from offers_app.models import Offer
+
+
+class OfferCursorPaginationTests(APITestCase):
+    """Tests for the opt-in cursor (keyset) pagination mode of the offer list."""
+
+    client_class = JSONAPIClient
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(username="business", password="pw123", email="b@mail.de")
+        prices = [50, 20, None, 20, 80, None, 35, 20, 65, 10, 95, None, 40]
+        cls.offers = Offer.objects.bulk_create(
+            [
+                Offer(user=cls.user, title=f"Offer {i}", description="desc", min_price=price)
+                for i, price in enumerate(prices)
+            ]
+        )
+        cls.url = reverse("offer-list")
+
+    def setUp(self):
+        self.client = self.client_class()
+
+    def walk(self, params, headers=None):
+        """Follow next links from the first page and return all ids and responses."""
+        response = self.client.get(self.url, params, headers=headers)
+        pages = [response]
+        while response.data["next"]:
+            response = self.client.get(response.data["next"])
+            pages.append(response)
+        ids = [offer["id"] for page in pages for offer in page.data["results"]]
+        return ids, pages
+
+    def test_page_number_is_default(self):
+        """Test that page-number pagination with count stays the default."""
+        response = self.client.get(self.url)
+        self.assertEqual(response.data["count"], len(self.offers))
+
+    def test_cursor_mode_by_query_param(self):
+        """Test that ?pagination=cursor returns cursor pages without a count."""
+        response = self.client.get(self.url, {"pagination": "cursor", "page_size": 5})
+        self.assertEqual(response.status_code, 200)
+        self.assertNotIn("count", response.data)
+        self.assertEqual(len(response.data["results"]), 5)
+        self.assertIsNone(response.data["previous"])
+        self.assertIn("cursor=", response.data["next"])
+
+    def test_cursor_mode_by_header(self):
+        """Test that the X-Pagination header selects cursor mode."""
+        response = self.client.get(self.url, headers={"X-Pagination": "cursor"})
+        self.assertNotIn("count", response.data)
+
+    def test_walk_updated_at_matches_page_number_order(self):
+        """Test that following next cursors yields every offer once in default order."""
+        ids, pages = self.walk({"pagination": "cursor", "page_size": 4})
+        expected = list(Offer.objects.order_by("-updated_at", "-id").values_list("id", flat=True))
+        self.assertEqual(ids, expected)
+        self.assertEqual(len(pages), 4)
+
+    def test_walk_min_price_with_ties_and_nulls(self):
+        """Test that ordering by min_price pages through ties and NULLs without gaps or duplicates."""
+        for ordering in ["min_price", "-min_price"]:
+            ids, _ = self.walk({"pagination": "cursor", "page_size": 3, "ordering": ordering})
+            self.assertEqual(sorted(ids), sorted(o.id for o in self.offers))
+            self.assertEqual(len(ids), len(set(ids)))
+            prices = [Offer.objects.get(id=i).min_price for i in ids]
+            non_null = [p for p in prices if p is not None]
+            self.assertEqual(non_null, sorted(non_null, reverse=ordering.startswith("-")))
+            self.assertEqual(prices[len(non_null) :], [None] * (len(prices) - len(non_null)))
+
+    def test_previous_link_returns_previous_page(self):
+        """Test that the previous cursor returns the preceding page in the same order."""
+        params = {"pagination": "cursor", "page_size": 3, "ordering": "min_price"}
+        first = self.client.get(self.url, params)
+        second = self.client.get(first.data["next"])
+        third = self.client.get(second.data["next"])
+        back = self.client.get(third.data["previous"])
+        self.assertEqual(back.data["results"], second.data["results"])
+        self.assertIsNotNone(back.data["next"])
+
+    def test_invalid_cursor(self):
+        """Test that a malformed cursor returns 404."""
+        response = self.client.get(self.url, {"cursor": "not-a-cursor"})
+        self.assertEqual(response.status_code, 404)
+
+    def test_unsupported_ordering(self):
+        """Test that cursor mode rejects orderings without a keyset."""
+        response = self.client.get(self.url, {"pagination": "cursor", "search": "offer", "ordering": "relevance"})
+        self.assertEqual(response.status_code, 400)
+        self.assertIn("ordering", response.data)
@@ -0,0 +1,81 @@
+from io import StringIO
+from decimal import Decimal
+from django.contrib.auth.models import User
+from django.core.management import call_command
+from django.urls import reverse
+from rest_framework.test import APITestCase
+from core.utils.test_client import JSONAPIClient
+from offers_app.models import Offer, OfferDetail
+
+
+class OfferMinValuesTests(APITestCase):
+    """Tests for the denormalized min_price and min_delivery_time columns on Offer."""
+
+    client_class = JSONAPIClient
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.business_user = User.objects.create_user(username="business", password="pw123", email="b@mail.de")
+        cls.business_user.profile.type = "business"
+        cls.business_user.profile.save()
+        cls.offer = Offer.objects.create(user=cls.business_user, title="Offer", description="desc")
+        cls.basic = OfferDetail.objects.create(
+            offer=cls.offer, title="Basic", delivery_time_in_days=7, price=100, offer_type="basic"
+        )
+        cls.premium = OfferDetail.objects.create(
+            offer=cls.offer, title="Premium", delivery_time_in_days=3, price=300, offer_type="premium"
+        )
+        cls.other_offer = Offer.objects.create(user=cls.business_user, title="Other", description="desc")
+        OfferDetail.objects.create(
+            offer=cls.other_offer, title="Basic", delivery_time_in_days=10, price=50, offer_type="basic"
+        )
+        cls.url = reverse("offer-list")
+
+    def setUp(self):
+        self.client = self.client_class()
+
+    def test_detail_create_updates_min_values(self):
+        """Test that creating details stores the minima on the offer."""
+        self.offer.refresh_from_db()
+        self.assertEqual(self.offer.min_price, Decimal("100.00"))
+        self.assertEqual(self.offer.min_delivery_time, 3)
+
+    def test_detail_update_updates_min_values(self):
+        """Test that saving a detail recomputes the minima."""
+        self.premium.price = 20
+        self.premium.save()
+        self.offer.refresh_from_db()
+        self.assertEqual(self.offer.min_price, Decimal("20.00"))
+
+    def test_detail_delete_updates_min_values(self):
+        """Test that deleting details recomputes the minima and resets them to None."""
+        self.premium.delete()
+        self.offer.refresh_from_db()
+        self.assertEqual(self.offer.min_delivery_time, 7)
+        self.basic.delete()
+        self.offer.refresh_from_db()
+        self.assertIsNone(self.offer.min_price)
+        self.assertIsNone(self.offer.min_delivery_time)
+
+    def test_filters_use_min_columns(self):
+        """Test that min_price and max_delivery_time filter on the stored minima."""
+        response = self.client.get(self.url + "?min_price=60")
+        self.assertEqual([o["id"] for o in response.data["results"]], [self.offer.id])
+        response = self.client.get(self.url + "?max_delivery_time=5")
+        self.assertEqual([o["id"] for o in response.data["results"]], [self.offer.id])
+
+    def test_ordering_by_min_price(self):
+        """Test that ordering by min_price uses the stored minima."""
+        response = self.client.get(self.url + "?ordering=min_price")
+        self.assertEqual([o["id"] for o in response.data["results"]], [self.other_offer.id, self.offer.id])
+        self.assertEqual(response.data["results"][0]["min_price"], 50)
+
+    def test_command_repairs_drifted_values(self):
+        """Test that the management command recomputes drifted minima."""
+        Offer.objects.update(min_price=None, min_delivery_time=None)
+        out = StringIO()
+        call_command("update_offer_min_values", stdout=out)
+        self.offer.refresh_from_db()
+        self.assertEqual(self.offer.min_price, Decimal("100.00"))
+        self.assertEqual(self.offer.min_delivery_time, 3)
+        self.assertIn("2", out.getvalue())
@@ -0,0 +1,99 @@
+from django.contrib.auth.models import User
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework.test import APITestCase
+from core.utils.test_client import JSONAPIClient
+from infos_app.models import PlatformStatistics
+from offers_app.models import Offer, OfferDetail, OfferSearchTerm
+
+
+def offer_payload(i, base_price=100):
+    """Return a valid offer with basic, standard and premium details."""
+    return {
+        "title": f"Bulk Offer {i}",
+        "description": f"Imported catalogue item {i}",
+        "details": [
+            {
+                "title": offer_type.capitalize(),
+                "revisions": j,
+                "delivery_time_in_days": 7 - j,
+                "price": base_price + j * 50,
+                "features": ["Feature"],
+                "offer_type": offer_type,
+            }
+            for j, offer_type in enumerate(["basic", "standard", "premium"])
+        ],
+    }
+
+
+class OfferBulkCreateTests(APITestCase):
+    """Tests for the bulk offer creation endpoint."""
+
+    client_class = JSONAPIClient
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.business = User.objects.create_user(username="business", password="pw123", email="b@mail.de")
+        cls.business.profile.type = "business"
+        cls.business.profile.save()
+        cls.customer = User.objects.create_user(username="customer", password="pw123", email="c@mail.de")
+        cls.customer.profile.type = "customer"
+        cls.customer.profile.save()
+        cls.url = reverse("offer-bulk")
+
+    def setUp(self):
+        self.client = self.client_class()
+        self.client.force_authenticate(user=self.business)
+
+    def test_bulk_create(self):
+        """Test that all offers and details are created with derived minima, index and statistics."""
+        offer_count = PlatformStatistics.load().offer_count
+        response = self.client.post(self.url, [offer_payload(i, 100 + i) for i in range(5)])
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(len(response.data), 5)
+        self.assertEqual(len(response.data[0]["details"]), 3)
+        self.assertEqual(response.data[2]["min_price"], 102)
+        self.assertEqual(response.data[2]["min_delivery_time"], 5)
+        self.assertEqual(Offer.objects.filter(user=self.business).count(), 5)
+        self.assertEqual(OfferDetail.objects.filter(offer__user=self.business).count(), 15)
+        self.assertTrue(OfferSearchTerm.objects.filter(offer_id=response.data[0]["id"], term="catalogue").exists())
+        self.assertEqual(PlatformStatistics.load().offer_count, offer_count + 5)
+
+    def test_bulk_create_uses_batched_inserts(self):
+        """Test that creating many offers costs a few batched inserts instead of queries per offer."""
+        with CaptureQueriesContext(connection) as captured:
+            response = self.client.post(self.url, [offer_payload(i) for i in range(200)])
+        self.assertEqual(response.status_code, 201)
+        statements = [query["sql"].split()[0] for query in captured.captured_queries]
+        self.assertLess(statements.count("INSERT"), 20)
+        self.assertEqual(statements.count("SELECT"), 2)
+
+    def test_invalid_item_rejects_whole_batch(self):
+        """Test that one invalid offer reports per-item errors and nothing is created."""
+        invalid = offer_payload(1)
+        invalid["details"] = invalid["details"][:2]
+        missing_title = offer_payload(2)
+        del missing_title["title"]
+        response = self.client.post(self.url, [offer_payload(0), invalid, missing_title])
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.data[0], {})
+        self.assertIn("details", response.data[1])
+        self.assertIn("title", response.data[2])
+        self.assertFalse(Offer.objects.exists())
+
+    def test_empty_and_non_list_payload(self):
+        """Test that an empty list and a single object are rejected."""
+        self.assertEqual(self.client.post(self.url, []).status_code, 400)
+        self.assertEqual(self.client.post(self.url, offer_payload(0)).status_code, 400)
+
+    def test_too_many_offers(self):
+        """Test that batches above the limit are rejected."""
+        response = self.client.post(self.url, [offer_payload(i) for i in range(1001)])
+        self.assertEqual(response.status_code, 400)
+
+    def test_customer_forbidden(self):
+        """Test that only business users can bulk create offers."""
+        self.client.force_authenticate(user=self.customer)
+        response = self.client.post(self.url, [offer_payload(0)])
+        self.assertEqual(response.status_code, 403)
@@ -0,0 +1,89 @@
+from django.contrib.auth.models import User
+from django.urls import reverse
+from rest_framework.test import APITestCase
+from core.utils.test_client import JSONAPIClient
+from offers_app.models import Offer, OfferDetail
+
+
+class OfferListQueryCountTests(APITestCase):
+    """Regression tests asserting that offer reads cost a constant number of queries."""
+
+    client_class = JSONAPIClient
+    offer_count = 1000
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.business_users = []
+        for i in range(3):
+            user = User.objects.create_user(username=f"business{i}", password="pw123", email=f"b{i}@mail.de")
+            user.profile.type = "business"
+            user.profile.save()
+            cls.business_users.append(user)
+        offers = Offer.objects.bulk_create(
+            [
+                Offer(
+                    user=cls.business_users[i % len(cls.business_users)],
+                    title=f"Offer {i}",
+                    description="desc",
+                    min_price=100 + i,
+                    min_delivery_time=3,
+                )
+                for i in range(cls.offer_count)
+            ]
+        )
+        OfferDetail.objects.bulk_create(
+            [
+                OfferDetail(
+                    offer=offer,
+                    title=offer_type.capitalize(),
+                    delivery_time_in_days=3 + j,
+                    price=offer.min_price + j * 50,
+                    offer_type=offer_type,
+                )
+                for offer in offers
+                for j, offer_type in enumerate(["basic", "standard", "premium"])
+            ]
+        )
+        cls.offer = offers[0]
+        cls.url = reverse("offer-list")
+
+    def setUp(self):
+        self.client = self.client_class()
+
+    def assert_page_queries(self, page_size, expected_queries=4):
+        """Assert that a page of the given size costs validator + count + offers/users + details queries."""
+        with self.assertNumQueries(expected_queries):
+            response = self.client.get(self.url, {"page_size": page_size})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.data["results"]), page_size)
+        first = response.data["results"][0]
+        self.assertEqual(len(first["details"]), 3)
+        self.assertIn("username", first["user_details"])
+        self.assertIsNotNone(first["min_price"])
+
+    def test_page_of_6_offers(self):
+        """Test that a default-sized page runs a constant number of queries."""
+        self.assert_page_queries(6)
+
+    def test_page_of_100_offers(self):
+        """Test that a page of 100 offers runs the same number of queries."""
+        self.assert_page_queries(100)
+
+    def test_page_of_1000_offers(self):
+        """Test that a page of 1000 offers runs the same number of queries."""
+        self.assert_page_queries(1000)
+
+    def test_filtered_and_ordered_page(self):
+        """Test that filters and ordering do not add per-row queries."""
+        with self.assertNumQueries(4):
+            response = self.client.get(self.url, {"page_size": 100, "ordering": "min_price", "min_price": 200})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.data["results"]), 100)
+
+    def test_retrieve_offer(self):
+        """Test that retrieving an offer runs one query for offer/user and one for details."""
+        self.client.force_authenticate(user=self.business_users[0])
+        with self.assertNumQueries(2):
+            response = self.client.get(reverse("offer-detail", args=[self.offer.id]))
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.data["details"]), 3)
@@ -0,0 +1,72 @@
+from django.contrib.auth.models import User
+from django.urls import reverse
+from rest_framework.test import APITestCase
+from core.utils.test_client import JSONAPIClient
+from offers_app.models import Offer, OfferDetail, OfferSearchTerm
+
+
+class OfferUpdateQueryCountTests(APITestCase):
+    """Regression tests asserting that offer PATCHes batch their detail writes."""
+
+    client_class = JSONAPIClient
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(username="business", password="pw123", email="b@mail.de")
+        cls.user.profile.type = "business"
+        cls.user.profile.save()
+        cls.offer = Offer.objects.create(user=cls.user, title="Logo Design", description="Vector logos")
+        for j, offer_type in enumerate(["basic", "standard", "premium"]):
+            OfferDetail.objects.create(
+                offer=cls.offer,
+                title=offer_type.capitalize(),
+                revisions=j,
+                delivery_time_in_days=5 + j,
+                price=100 + j * 50,
+                features=["Logo"],
+                offer_type=offer_type,
+            )
+        cls.url = reverse("offer-detail", kwargs={"pk": cls.offer.pk})
+
+    def setUp(self):
+        self.client = self.client_class()
+        self.client.force_authenticate(user=self.user)
+
+    def test_full_three_detail_patch_query_count(self):
+        """Test that a PATCH of all three details loads them once and writes them in one bulk_update."""
+        details = [
+            {"offer_type": offer_type, "price": 80 + j * 50, "delivery_time_in_days": 2 + j, "title": f"New {j}"}
+            for j, offer_type in enumerate(["basic", "standard", "premium"])
+        ]
+        with self.assertNumQueries(9):
+            response = self.client.patch(self.url, {"details": details})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual((response.data["min_price"], response.data["min_delivery_time"]), (80, 2))
+        prices = dict(OfferDetail.objects.filter(offer=self.offer).values_list("offer_type", "price"))
+        self.assertEqual(prices, {"basic": 80, "standard": 130, "premium": 180})
+
+    def test_unchanged_details_are_not_written(self):
+        """Test that details whose values did not change cause no UPDATE."""
+        with self.assertNumQueries(6):
+            response = self.client.patch(self.url, {"details": [{"offer_type": "basic", "price": "100.00"}]})
+        self.assertEqual(response.status_code, 200)
+
+    def test_title_only_patch_reindexes_without_touching_details(self):
+        """Test that an offer-only PATCH bumps updated_at, reindexes search terms and skips the details."""
+        updated_at = self.offer.updated_at
+        response = self.client.patch(self.url, {"title": "Brand Design"})
+        self.assertEqual(response.status_code, 200)
+        self.offer.refresh_from_db()
+        self.assertGreater(self.offer.updated_at, updated_at)
+        self.assertTrue(OfferSearchTerm.objects.filter(offer=self.offer, term="brand").exists())
+
+    def test_unknown_offer_type_rolls_back(self):
+        """Test that a missing detail type rejects the PATCH without saving the offer or other details."""
+        OfferDetail.objects.filter(offer=self.offer, offer_type="premium").delete()
+        response = self.client.patch(
+            self.url, {"title": "Changed", "details": [{"offer_type": "basic", "price": 1}, {"offer_type": "premium"}]}
+        )
+        self.assertEqual(response.status_code, 400)
+        self.offer.refresh_from_db()
+        self.assertEqual(self.offer.title, "Logo Design")
+        self.assertEqual(OfferDetail.objects.get(offer=self.offer, offer_type="basic").price, 100)
@@ -0,0 +1,99 @@
+from django.contrib.auth.models import User
+from django.test import override_settings
+from django.urls import reverse
+from rest_framework.test import APITestCase
+from core.utils.test_client import JSONAPIClient
+from offers_app.models import Offer, OfferSearchTerm
+from offers_app.api.filters import OfferFilter
+from offers_app.search import InvertedIndexSearchBackend, build_terms
+
+
+class OfferSearchIndexTests(APITestCase):
+    """Tests for the inverted-index offer search backend and relevance ordering."""
+
+    client_class = JSONAPIClient
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(username="user1", password="pw1", email="user1@test.com")
+        cls.title_match = Offer.objects.create(user=cls.user, title="Logo Design", description="Vector files.")
+        cls.description_match = Offer.objects.create(
+            user=cls.user, title="Branding", description="Includes a logo and a color palette."
+        )
+        cls.double_match = Offer.objects.create(
+            user=cls.user, title="Logo Package", description="Logo variants and logo guidelines."
+        )
+        cls.no_match = Offer.objects.create(user=cls.user, title="Data Entry", description="Fast typing.")
+        cls.url = reverse("offer-list")
+
+    def setUp(self):
+        self.client = self.client_class()
+
+    def test_build_terms_weights_title_higher(self):
+        """Test that title terms weigh more than description terms."""
+        terms = build_terms("Logo Design", "logo files")
+        self.assertEqual(terms["logo"], 4)
+        self.assertEqual(terms["files"], 1)
+
+    def test_index_maintained_on_save(self):
+        """Test that saving an offer replaces its indexed terms."""
+        offer = Offer.objects.create(user=self.user, title="Old Title", description="desc")
+        offer.title = "New Title"
+        offer.save()
+        terms = set(OfferSearchTerm.objects.filter(offer=offer).values_list("term", flat=True))
+        self.assertEqual(terms, {"new", "title", "desc"})
+
+    def test_index_removed_on_delete(self):
+        """Test that deleting an offer removes its indexed terms."""
+        offer = Offer.objects.create(user=self.user, title="Temporary", description="desc")
+        offer_id = offer.id
+        offer.delete()
+        self.assertFalse(OfferSearchTerm.objects.filter(offer_id=offer_id).exists())
+
+    def test_prefix_match(self):
+        """Test that query terms match indexed terms by prefix."""
+        filtered_qs = OfferFilter(data={"search": "bran"}, queryset=Offer.objects.all()).qs
+        self.assertEqual(list(filtered_qs), [self.description_match])
+
+    def test_ordering_relevance(self):
+        """Test that ordering=relevance returns the best matches first."""
+        response = self.client.get(self.url, {"search": "logo", "ordering": "relevance"})
+        self.assertEqual(response.status_code, 200)
+        ids = [o["id"] for o in response.data["results"]]
+        self.assertEqual(ids, [self.double_match.id, self.title_match.id, self.description_match.id])
+
+    def test_ordering_relevance_without_search(self):
+        """Test that ordering=relevance without a search falls back to the default ordering."""
+        response = self.client.get(self.url, {"ordering": "relevance"})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data["count"], 4)
+
+    def test_search_does_not_probe_the_index(self):
+        """Test that a search runs the queries of an unfiltered page and no check whether the index is filled."""
+        with self.assertNumQueries(4):
+            response = self.client.get(self.url, {"search": "logo"})
+        self.assertEqual(response.data["count"], 3)
+
+    def test_rebuild_index(self):
+        """Test that rebuilding the index restores all terms."""
+        expected = OfferSearchTerm.objects.count()
+        OfferSearchTerm.objects.all().delete()
+        written = InvertedIndexSearchBackend().rebuild(Offer.objects.all())
+        self.assertEqual(written, expected)
+        self.assertEqual(OfferSearchTerm.objects.count(), expected)
+
+    @override_settings(OFFER_SEARCH_BACKEND="offers_app.search.IcontainsSearchBackend")
+    def test_icontains_backend_matches_substrings(self):
+        """Test that the icontains backend keeps the previous substring search without an index."""
+        OfferSearchTerm.objects.all().delete()
+        filtered_qs = OfferFilter(data={"search": "ogo"}, queryset=Offer.objects.all()).qs
+        self.assertEqual(filtered_qs.count(), 3)
+        self.assertNotIn("relevance", filtered_qs.query.annotations)
+
+    @override_settings(OFFER_SEARCH_BACKEND="offers_app.search.IcontainsSearchBackend")
+    def test_icontains_backend_ignores_relevance_ordering(self):
+        """Test that ordering=relevance falls back to the default ordering with the icontains backend."""
+        response = self.client.get(self.url, {"search": "logo", "ordering": "relevance"})
+        self.assertEqual(response.status_code, 200)
+        ids = [o["id"] for o in response.data["results"]]
+        self.assertEqual(ids, [self.double_match.id, self.description_match.id, self.title_match.id])
@@ -5,6 +5,7 @@ from django.contrib.auth.models import User
 from offers_app.models import Offer, OfferDetail
 from offers_app.api.serializers import OfferSerializer
 from rest_framework.exceptions import ValidationError
+from django.db import IntegrityError, transaction
 from unittest.mock import patch
 from core.utils.test_client import JSONAPIClient
 
@@ -158,3 +159,13 @@ class OfferSerializerTests(APITestCase):
         self.assertEqual(str(self.offer_with_details), "Offer by testuser for Offer 1")
         self.assertEqual(str(self.detail1), "Detail 1.1")
         self.assertEqual(str(self.offer_no_details), "Offer by testuser for Offer 2")
+
+    def test_offer_detail_type_unique_per_offer(self):
+        """Test that an offer cannot have two details of the same offer_type."""
+        OfferDetail.objects.create(
+            offer=self.offer_no_details, title="Basic", price=10, delivery_time_in_days=1, offer_type="basic"
+        )
+        with self.assertRaises(IntegrityError), transaction.atomic():
+            OfferDetail.objects.create(
+                offer=self.offer_no_details, title="Basic 2", price=20, delivery_time_in_days=2, offer_type="basic"
+            )
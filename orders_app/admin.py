@@ -1,5 +1,5 @@
 from django.contrib import admin
-from .models import Order
+from .models import BusinessOrderStats, Order
 
 
 @admin.register(Order)
@@ -17,3 +17,20 @@ class OrderAdmin(admin.ModelAdmin):
         ("Details", {"fields": ("revisions", "delivery_time_in_days", "features")}),
         ("Zeitstempel", {"fields": ("created_at", "updated_at")}),
     )
+
+
+@admin.register(BusinessOrderStats)
+class BusinessOrderStatsAdmin(admin.ModelAdmin):
+    """Read-only admin for the per-business order counters."""
+
+    list_display = ("business_user", "in_progress_count", "completed_count", "cancelled_count")
+    readonly_fields = list_display
+    search_fields = ("business_user__username",)
+
+    def has_add_permission(self, request):
+        """Disallow adding rows, they follow the business profiles."""
+        return False
+
+    def has_change_permission(self, request, obj=None):
+        """Disallow editing, use the rebuild_business_order_stats command instead."""
+        return False
@@ -0,0 +1,14 @@
+from core.utils.pagination import KeysetCursorPagination, OptionalPagination, StandardPageNumberPagination
+
+
+class OrderCursorPagination(KeysetCursorPagination):
+    """Keyset pagination for orders on (created_at, id)."""
+
+    keyset_fields = ["created_at"]
+    default_ordering = "-created_at"
+
+
+class OrderPagination(OptionalPagination):
+    """Opt-in pagination for orders (?pagination=page or ?pagination=cursor)."""
+
+    paginator_classes = {"page": StandardPageNumberPagination, "cursor": OrderCursorPagination}
@@ -1,9 +1,13 @@
+from django.db import transaction
 from rest_framework import serializers
+from rest_framework.exceptions import NotFound
 from orders_app.models import Order
+from orders_app.signals import orders_bulk_created
 from offers_app.models import OfferDetail
+from core.utils.sparse_fields import SparseFieldsMixin
 
 
-class OrderSerializer(serializers.ModelSerializer):
+class OrderSerializer(SparseFieldsMixin, serializers.ModelSerializer):
     """Serializer for Order model."""
 
     offer_detail_id = serializers.IntegerField(write_only=True)
@@ -50,19 +54,45 @@ class OrderSerializer(serializers.ModelSerializer):
             "status": {"required": False},
         }
 
+    def validate(self, attrs):
+        """Resolve the ordered offer detail with its offer in one query when creating an order."""
+        if self.instance is None:
+            offer_detail_id = attrs.pop("offer_detail_id")
+            offer_detail = OfferDetail.objects.select_related("offer").filter(id=offer_detail_id).first()
+            if offer_detail is None:
+                raise NotFound("Offer detail not found.")
+            attrs["offer_detail"] = offer_detail
+        return attrs
+
     def create(self, validated_data):
-        """Create a new Order from offer_detail_id and validated data."""
-        offer_detail_id = validated_data.pop("offer_detail_id")
-        offer = OfferDetail.objects.get(id=offer_detail_id)
-        validated_data["title"] = offer.title
-        validated_data["revisions"] = offer.revisions
-        validated_data["delivery_time_in_days"] = offer.delivery_time_in_days
-        validated_data["price"] = offer.price
-        validated_data["features"] = offer.features
-        validated_data["offer_type"] = offer.offer_type
-        validated_data["customer_user"] = self.context["request"].user
-        validated_data["business_user"] = offer.offer.user
-        validated_data["status"] = "in_progress"
-        order = Order.objects.create(**validated_data)
+        """Create a new Order as a snapshot of the resolved offer detail with a single INSERT."""
+        order = Order.from_offer_detail(validated_data.pop("offer_detail"), self.context["request"].user)
         order.save()
         return order
+
+
+class OrderBulkCreateSerializer(serializers.Serializer):
+    """Serializer placing one order per offer detail id of a cart with batched queries."""
+
+    offer_detail_ids = serializers.ListField(child=serializers.IntegerField(), allow_empty=False, max_length=100)
+
+    def validate_offer_detail_ids(self, value):
+        """Resolve all offer details with their offers in one query and reject unknown ids."""
+        offer_details = OfferDetail.objects.select_related("offer").in_bulk(set(value))
+        missing = sorted(set(value) - offer_details.keys())
+        if missing:
+            raise NotFound(f"Offer details not found: {', '.join(map(str, missing))}.")
+        self.offer_details = offer_details
+        return value
+
+    def create(self, validated_data):
+        """Insert one order per requested offer detail with bulk_create in one transaction."""
+        customer_user = self.context["request"].user
+        orders = [
+            Order.from_offer_detail(self.offer_details[offer_detail_id], customer_user)
+            for offer_detail_id in validated_data["offer_detail_ids"]
+        ]
+        with transaction.atomic():
+            Order.objects.bulk_create(orders)
+            orders_bulk_created.send(sender=Order, orders=orders)
+        return orders
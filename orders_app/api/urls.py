@@ -1,6 +1,11 @@
 from django.urls import path
 from rest_framework.routers import DefaultRouter
-from orders_app.api.views import OrderModelViewSet, BusinessOrderCountView, BusinessOrderCompleteCountView
+from orders_app.api.views import (
+    OrderModelViewSet,
+    BusinessOrderCountView,
+    BusinessOrderCompleteCountView,
+    BusinessOrderStatsView,
+)
 
 router = DefaultRouter()
 router.register(r"orders", OrderModelViewSet, basename="order")
@@ -12,6 +17,7 @@ urlpatterns = [
         BusinessOrderCompleteCountView.as_view(),
         name="business-order-complete-count",
     ),
+    path("order-stats/<int:business_user_id>/", BusinessOrderStatsView.as_view(), name="business-order-stats"),
 ]
 
 urlpatterns += router.urls
@@ -1,36 +1,52 @@
-from django.db import models
-from rest_framework.views import APIView
+from django.db import models, transaction
 from rest_framework import viewsets
+from rest_framework.decorators import action
 from rest_framework.response import Response
 from rest_framework import status
-from orders_app.models import Order
-from orders_app.api.serializers import OrderSerializer
+from orders_app.models import BusinessOrderStats, Order
+from orders_app.api.serializers import OrderBulkCreateSerializer, OrderSerializer
 from orders_app.api.permissions import IsAuthenticatedOrCustomerCreateOrBusinessUpdateOrStaffDelete
-from django.contrib.auth.models import User
+from orders_app.api.pagination import OrderPagination
+from core.utils.async_views import AsyncAPIView
+from core.utils.conditional import ConditionalGetMixin
+from core.utils.streaming import StreamingListMixin
+from core.utils.query_budget import query_budget
+from core.utils.sparse_fields import SparseQuerysetMixin
 
 
-class OrderModelViewSet(viewsets.ModelViewSet):
+@query_budget(list=3, retrieve=3, create=7, update=9, partial_update=9, destroy=7, bulk=8)
+class OrderModelViewSet(ConditionalGetMixin, SparseQuerysetMixin, StreamingListMixin, viewsets.ModelViewSet):
     """ViewSet for listing, creating, updating, and deleting orders."""
 
     queryset = Order.objects.all()
     serializer_class = OrderSerializer
     permission_classes = [IsAuthenticatedOrCustomerCreateOrBusinessUpdateOrStaffDelete]
-    pagination_class = None
+    pagination_class = OrderPagination
+    conditional_detail = False
 
     def get_queryset(self):
         """Return queryset filtered by user role (staff, customer, business)."""
         user = self.request.user
         if user.is_staff:
-            return Order.objects.all().order_by("-created_at")
+            queryset = Order.objects.all().order_by("-created_at")
         else:
-            return Order.objects.filter(models.Q(customer_user=user) | models.Q(business_user=user)).order_by(
+            queryset = Order.objects.filter(models.Q(customer_user=user) | models.Q(business_user=user)).order_by(
                 "-created_at"
             )
+        if self.request.method in ("PATCH", "DELETE"):
+            queryset = queryset.select_for_update()
+        return queryset
+
+    def perform_create(self, serializer):
+        """Create the order and count it in the same transaction."""
+        with transaction.atomic():
+            serializer.save()
 
     def retrieve(self, request, *args, **kwargs):
         """Block GET on detail view (not allowed)."""
         return Response({"detail": "GET is not allowed in detail view."}, status=status.HTTP_405_METHOD_NOT_ALLOWED)
 
+    @transaction.atomic
     def update(self, request, *args, **kwargs):
         """Block PUT, allow PATCH for updates."""
         if request.method == "PUT":
@@ -40,24 +56,68 @@ class OrderModelViewSet(viewsets.ModelViewSet):
         else:
             return super().update(request, *args, **kwargs)
 
+    @transaction.atomic
+    def destroy(self, request, *args, **kwargs):
+        """Delete the locked order and uncount it in the same transaction."""
+        return super().destroy(request, *args, **kwargs)
+
+    @action(detail=False, methods=["post"], url_path="bulk")
+    def bulk(self, request, *args, **kwargs):
+        """Place one order per offer detail id of a cart in a single request."""
+        serializer = OrderBulkCreateSerializer(data=request.data, context=self.get_serializer_context())
+        serializer.is_valid(raise_exception=True)
+        orders = serializer.save()
+        return Response(self.get_serializer(orders, many=True).data, status=status.HTTP_201_CREATED)
+
+
+async def aget_business_order_stats(business_user_id):
+    """Return the order counters of a business user, or None if the user is no business user."""
+    return await BusinessOrderStats.objects.filter(business_user_id=business_user_id).afirst()
+
 
-class BusinessOrderCountView(APIView):
+def business_user_not_found():
+    """Return the 404 response for an unknown business user."""
+    return Response({"detail": "Business user not found."}, status=status.HTTP_404_NOT_FOUND)
+
+
+@query_budget(default=2)
+class BusinessOrderCountView(AsyncAPIView):
     """API view to get count of in-progress orders for a business user."""
 
-    def get(self, request, business_user_id, *args, **kwargs):
+    async def get(self, request, business_user_id, *args, **kwargs):
         """Return count of in-progress orders for given business user."""
-        if not User.objects.filter(id=business_user_id, profile__type="business").exists():
-            return Response({"detail": "Business user not found."}, status=status.HTTP_404_NOT_FOUND)
-        count = Order.objects.filter(business_user_id=business_user_id, status="in_progress").count()
-        return Response({"order_count": count})
+        stats = await aget_business_order_stats(business_user_id)
+        if stats is None:
+            return business_user_not_found()
+        return Response({"order_count": stats.in_progress_count})
 
 
-class BusinessOrderCompleteCountView(APIView):
+@query_budget(default=2)
+class BusinessOrderCompleteCountView(AsyncAPIView):
     """API view to get count of completed orders for a business user."""
 
-    def get(self, request, business_user_id, *args, **kwargs):
+    async def get(self, request, business_user_id, *args, **kwargs):
         """Return count of completed orders for given business user."""
-        if not User.objects.filter(id=business_user_id, profile__type="business").exists():
-            return Response({"detail": "Business user not found."}, status=status.HTTP_404_NOT_FOUND)
-        count = Order.objects.filter(business_user_id=business_user_id, status="completed").count()
-        return Response({"completed_order_count": count})
+        stats = await aget_business_order_stats(business_user_id)
+        if stats is None:
+            return business_user_not_found()
+        return Response({"completed_order_count": stats.completed_count})
+
+
+@query_budget(default=2)
+class BusinessOrderStatsView(AsyncAPIView):
+    """API view to get all order counters of a business user in one request."""
+
+    async def get(self, request, business_user_id, *args, **kwargs):
+        """Return in-progress, completed and cancelled order counts for given business user."""
+        stats = await aget_business_order_stats(business_user_id)
+        if stats is None:
+            return business_user_not_found()
+        return Response(
+            {
+                "business_user": stats.business_user_id,
+                "order_count": stats.in_progress_count,
+                "completed_order_count": stats.completed_count,
+                "cancelled_order_count": stats.cancelled_count,
+            }
+        )
@@ -6,3 +6,7 @@ class OrdersAppConfig(AppConfig):
 
     default_auto_field = "django.db.models.BigAutoField"
     name = "orders_app"
+
+    def ready(self):
+        """Import signals when app is ready."""
+        import orders_app.signals
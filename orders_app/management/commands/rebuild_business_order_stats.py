@@ -0,0 +1,32 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from orders_app.models import BusinessOrderStats
+from profiles_app.models import Profile
+
+
+class Command(BaseCommand):
+    help = "Berechnet die Auftragszähler aller Business-User neu und meldet Abweichungen."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--business-user-id", type=int, nargs="+", help="Nur diese Business-User neu berechnen.")
+
+    def handle(self, *args, **options):
+        profiles = Profile.objects.filter(type="business")
+        if options["business_user_id"]:
+            profiles = profiles.filter(user_id__in=options["business_user_id"])
+        business_user_ids = list(profiles.values_list("user_id", flat=True))
+        drifted = 0
+        with transaction.atomic():
+            stored = BusinessOrderStats.objects.select_for_update().in_bulk(business_user_ids)
+            for business_user_id in business_user_ids:
+                actual = BusinessOrderStats.compute(business_user_id)
+                old = stored.get(business_user_id)
+                if old is not None and all(getattr(old, name) == value for name, value in actual.items()):
+                    continue
+                drifted += 1
+                self.stdout.write(self.style.WARNING(f"Business-User {business_user_id}: tatsächlich={actual}"))
+                BusinessOrderStats.rebuild(business_user_id)
+            if not options["business_user_id"]:
+                stale, _ = BusinessOrderStats.objects.exclude(business_user__profile__type="business").delete()
+                drifted += stale
+        self.stdout.write(self.style.SUCCESS(f"{len(business_user_ids)} Business-User geprüft, {drifted} korrigiert."))
@@ -0,0 +1,46 @@
+# Generated by Django 5.2 on 2026-10-17 21:10
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models import Count, Q
+
+
+def build_business_order_stats(apps, schema_editor):
+    BusinessOrderStats = apps.get_model('orders_app', 'BusinessOrderStats')
+    Order = apps.get_model('orders_app', 'Order')
+    Profile = apps.get_model('profiles_app', 'Profile')
+    stats = []
+    for user_id in Profile.objects.filter(type='business').values_list('user_id', flat=True):
+        counts = Order.objects.filter(business_user_id=user_id).aggregate(
+            in_progress_count=Count('id', filter=Q(status='in_progress')),
+            completed_count=Count('id', filter=Q(status='completed')),
+            cancelled_count=Count('id', filter=Q(status='cancelled')),
+        )
+        stats.append(BusinessOrderStats(business_user_id=user_id, **counts))
+    BusinessOrderStats.objects.bulk_create(stats, batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('auth', '0012_alter_user_first_name_max_length'),
+        ('orders_app', '0002_order_orders_app__busines_7d89bd_idx_and_more'),
+        ('profiles_app', '0004_profile_profiles_ap_type_8348d7_idx'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='BusinessOrderStats',
+            fields=[
+                ('business_user', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='order_stats', serialize=False, to=settings.AUTH_USER_MODEL)),
+                ('in_progress_count', models.IntegerField(default=0)),
+                ('completed_count', models.IntegerField(default=0)),
+                ('cancelled_count', models.IntegerField(default=0)),
+            ],
+            options={
+                'verbose_name_plural': 'Business order stats',
+            },
+        ),
+        migrations.RunPython(build_business_order_stats, migrations.RunPython.noop),
+    ]
@@ -1,10 +1,14 @@
 from django.db import models
+from django.db.models import Count, F, Q
 from django.contrib.auth.models import User
+from core.utils.models import TrackedFieldsMixin
 
 
-class Order(models.Model):
+class Order(TrackedFieldsMixin, models.Model):
     """Model for an order between customer and business user."""
 
+    tracked_fields = ("business_user_id", "status")
+
     ORDER_STATUS_CHOICES = [
         ("in_progress", "In Progress"),
         ("completed", "Completed"),
@@ -23,3 +27,73 @@ class Order(models.Model):
     status = models.CharField(choices=ORDER_STATUS_CHOICES, max_length=50, default="in_progress")
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=["business_user", "status"]),
+            models.Index(fields=["-created_at"]),
+        ]
+
+    @classmethod
+    def from_offer_detail(cls, offer_detail, customer_user):
+        """Return an unsaved in-progress order snapshotting the offer detail (its offer must be loaded)."""
+        return cls(
+            customer_user=customer_user,
+            business_user_id=offer_detail.offer.user_id,
+            title=offer_detail.title,
+            revisions=offer_detail.revisions,
+            delivery_time_in_days=offer_detail.delivery_time_in_days,
+            price=offer_detail.price,
+            features=offer_detail.features,
+            offer_type=offer_detail.offer_type,
+            status="in_progress",
+        )
+
+
+class BusinessOrderStats(models.Model):
+    """Per-business order counters, one row for every user with a business profile."""
+
+    STATUS_FIELDS = {
+        "in_progress": "in_progress_count",
+        "completed": "completed_count",
+        "cancelled": "cancelled_count",
+    }
+
+    business_user = models.OneToOneField(User, on_delete=models.CASCADE, primary_key=True, related_name="order_stats")
+    in_progress_count = models.IntegerField(default=0)
+    completed_count = models.IntegerField(default=0)
+    cancelled_count = models.IntegerField(default=0)
+
+    class Meta:
+        verbose_name_plural = "Business order stats"
+
+    def __str__(self):
+        """String representation of BusinessOrderStats."""
+        return f"Order stats of {self.business_user_id}"
+
+    @classmethod
+    def compute(cls, business_user_id):
+        """Count the orders of a business user per status from the order table."""
+        return Order.objects.filter(business_user_id=business_user_id).aggregate(
+            **{field: Count("id", filter=Q(status=status)) for status, field in cls.STATUS_FIELDS.items()}
+        )
+
+    @classmethod
+    def rebuild(cls, business_user_id):
+        """Recompute and store the counters of a business user with a single upsert."""
+        stats = cls(business_user_id=business_user_id, **cls.compute(business_user_id))
+        cls.objects.bulk_create(
+            [stats],
+            update_conflicts=True,
+            unique_fields=["business_user"],
+            update_fields=list(cls.STATUS_FIELDS.values()),
+        )
+        return stats
+
+    @classmethod
+    def increment(cls, business_user_id, status, delta):
+        """Atomically add delta to the counter of the given status in a single UPDATE."""
+        field = cls.STATUS_FIELDS.get(status)
+        if field is None or not delta:
+            return
+        cls.objects.filter(business_user_id=business_user_id).update(**{field: F(field) + delta})
@@ -0,0 +1,53 @@
+from collections import Counter
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import Signal, receiver
+from profiles_app.models import Profile
+from .models import BusinessOrderStats, Order
+
+# Sent with orders=[...] after orders were inserted with bulk_create, which sends no post_save.
+orders_bulk_created = Signal()
+
+
+@receiver(post_save, sender=Order)
+def count_saved_order(sender, instance, created, **kwargs):
+    """Count a new order or move a changed order to its new business user and status."""
+    if not created:
+        old_business_user_id = instance.get_tracked_value("business_user_id", instance.business_user_id)
+        old_status = instance.get_tracked_value("status", instance.status)
+        if (old_business_user_id, old_status) == (instance.business_user_id, instance.status):
+            return
+        BusinessOrderStats.increment(old_business_user_id, old_status, -1)
+    BusinessOrderStats.increment(instance.business_user_id, instance.status, 1)
+
+
+@receiver(orders_bulk_created, sender=Order)
+def count_bulk_created_orders(sender, orders, **kwargs):
+    """Count orders inserted in bulk with one UPDATE per business user and status."""
+    for (business_user_id, status), count in Counter((o.business_user_id, o.status) for o in orders).items():
+        BusinessOrderStats.increment(business_user_id, status, count)
+
+
+@receiver(post_delete, sender=Order)
+def count_deleted_order(sender, instance, **kwargs):
+    """Remove a deleted order from the counters of its business user."""
+    business_user_id = instance.get_tracked_value("business_user_id", instance.business_user_id)
+    BusinessOrderStats.increment(business_user_id, instance.get_tracked_value("status", instance.status), -1)
+
+
+@receiver(post_save, sender=Profile)
+def sync_business_order_stats(sender, instance, created, **kwargs):
+    """Create the counters when a profile becomes a business profile and drop them when it stops being one."""
+    was_business = not created and instance.get_tracked_value("type") == "business"
+    if not created and not instance.has_tracked_value("type"):
+        return
+    if instance.type == "business" and not was_business:
+        BusinessOrderStats.rebuild(instance.user_id)
+    elif instance.type != "business" and was_business:
+        BusinessOrderStats.objects.filter(business_user_id=instance.user_id).delete()
+
+
+@receiver(post_delete, sender=Profile)
+def drop_business_order_stats(sender, instance, **kwargs):
+    """Drop the counters of a deleted business profile."""
+    if instance.get_tracked_value("type", instance.type) == "business":
+        BusinessOrderStats.objects.filter(business_user_id=instance.user_id).delete()
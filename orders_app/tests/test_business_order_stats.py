@@ -0,0 +1,116 @@
+import random
+from io import StringIO
+from django.contrib.auth.models import User
+from django.core.management import call_command
+from rest_framework.test import APITestCase
+from offers_app.models import Offer, OfferDetail
+from orders_app.models import BusinessOrderStats, Order
+from core.utils.test_client import JSONAPIClient
+
+
+class BusinessOrderStatsTestCase(APITestCase):
+    """Tests for the per-business order counters and the order stats endpoint."""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.customer = User.objects.create_user(username="customer", password="pass1234", email="kunde@mail.de")
+        cls.customer.profile.type = "customer"
+        cls.customer.profile.save()
+        cls.staff = User.objects.create_user(username="staff", password="pass1234", email="staff@mail.de", is_staff=True)
+        cls.businesses = []
+        cls.details = []
+        for i in range(2):
+            business = User.objects.create_user(username=f"business{i}", password="pass1234", email=f"b{i}@mail.de")
+            business.profile.type = "business"
+            business.profile.save()
+            offer = Offer.objects.create(user=business, title=f"Offer {i}", description="Test Offer")
+            detail = OfferDetail.objects.create(
+                offer=offer, title="Basic", revisions=1, delivery_time_in_days=3, price=100, offer_type="basic"
+            )
+            cls.businesses.append(business)
+            cls.details.append(detail)
+
+    def setUp(self):
+        self.client = JSONAPIClient()
+
+    def assert_stats_match_orders(self):
+        """Assert that every business user's counters equal a recount of the order table."""
+        for business in self.businesses:
+            stats = BusinessOrderStats.objects.get(business_user=business)
+            for field, value in BusinessOrderStats.compute(business.id).items():
+                self.assertEqual(getattr(stats, field), value, f"{field} of {business.username}")
+
+    def test_stats_created_for_business_profiles(self):
+        """Test that counters exist for business profiles only."""
+        self.assertTrue(BusinessOrderStats.objects.filter(business_user=self.businesses[0]).exists())
+        self.assertFalse(BusinessOrderStats.objects.filter(business_user=self.customer).exists())
+
+    def test_profile_type_change_rebuilds_and_drops_stats(self):
+        """Test that counters are recomputed when a profile becomes business and dropped when it stops."""
+        business = self.businesses[0]
+        Order.objects.create(customer_user=self.customer, business_user=business, title="x", price=1)
+        business.profile.type = "customer"
+        business.profile.save()
+        self.assertFalse(BusinessOrderStats.objects.filter(business_user=business).exists())
+        business.profile.type = "business"
+        business.profile.save()
+        self.assertEqual(BusinessOrderStats.objects.get(business_user=business).in_progress_count, 1)
+
+    def test_order_stats_view(self):
+        """Test that the order stats endpoint returns all counters in a single query."""
+        business = self.businesses[0]
+        for order_status in ["in_progress", "completed", "completed", "cancelled"]:
+            Order.objects.create(
+                customer_user=self.customer, business_user=business, title="x", price=1, status=order_status
+            )
+        self.client.force_authenticate(user=self.customer)
+        with self.assertNumQueries(1):
+            response = self.client.get(f"/api/order-stats/{business.id}/")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            response.data,
+            {"business_user": business.id, "order_count": 1, "completed_order_count": 2, "cancelled_order_count": 1},
+        )
+
+    def test_order_stats_view_not_found(self):
+        """Test that the order stats endpoint returns 404 for non-business users."""
+        self.client.force_authenticate(user=self.customer)
+        response = self.client.get(f"/api/order-stats/{self.customer.id}/")
+        self.assertEqual(response.status_code, 404)
+
+    def test_fuzz_status_transitions(self):
+        """Test that random creates, status changes, reassignments and deletes never let the counters drift."""
+        rng = random.Random(8)
+        statuses = [choice for choice, _ in Order.ORDER_STATUS_CHOICES]
+        for _ in range(150):
+            order_ids = list(Order.objects.values_list("id", flat=True))
+            action = rng.choice(["create", "patch", "patch", "reassign", "delete"]) if order_ids else "create"
+            if action == "create":
+                self.client.force_authenticate(user=self.customer)
+                response = self.client.post("/api/orders/", {"offer_detail_id": rng.choice(self.details).id})
+                self.assertEqual(response.status_code, 201)
+            elif action == "patch":
+                order = Order.objects.get(id=rng.choice(order_ids))
+                self.client.force_authenticate(user=order.business_user)
+                response = self.client.patch(f"/api/orders/{order.id}/", {"status": rng.choice(statuses)})
+                self.assertEqual(response.status_code, 200)
+            elif action == "reassign":
+                order = Order.objects.get(id=rng.choice(order_ids))
+                order.business_user = rng.choice(self.businesses)
+                order.status = rng.choice(statuses)
+                order.save()
+            else:
+                self.client.force_authenticate(user=self.staff)
+                response = self.client.delete(f"/api/orders/{rng.choice(order_ids)}/")
+                self.assertEqual(response.status_code, 204)
+            self.assert_stats_match_orders()
+
+    def test_rebuild_command_repairs_drift(self):
+        """Test that the rebuild command restores drifted counters."""
+        business = self.businesses[0]
+        Order.objects.create(customer_user=self.customer, business_user=business, title="x", price=1)
+        BusinessOrderStats.objects.filter(business_user=business).update(in_progress_count=7, completed_count=-1)
+        out = StringIO()
+        call_command("rebuild_business_order_stats", stdout=out)
+        self.assertIn("1 korrigiert", out.getvalue())
+        self.assert_stats_match_orders()
@@ -0,0 +1,83 @@
+from django.contrib.auth.models import User
+from rest_framework.test import APITestCase
+from offers_app.models import Offer, OfferDetail
+from orders_app.models import BusinessOrderStats, Order
+from core.utils.test_client import JSONAPIClient
+
+
+class OrdersBulkCreateAPITestCase(APITestCase):
+    """Tests for placing a cart of orders in one request."""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.customer = User.objects.create_user(username="kunde", password="pass1234", email="kunde@mail.de")
+        cls.customer.profile.type = "customer"
+        cls.customer.profile.save()
+        cls.businesses = []
+        cls.details = []
+        for i in range(2):
+            business = User.objects.create_user(username=f"business{i}", password="pass1234", email=f"b{i}@mail.de")
+            business.profile.type = "business"
+            business.profile.save()
+            offer = Offer.objects.create(user=business, title=f"Offer {i}", description="Test Offer")
+            for j, offer_type in enumerate(["basic", "standard"]):
+                cls.details.append(
+                    OfferDetail.objects.create(
+                        offer=offer,
+                        title=f"{offer_type} {i}",
+                        revisions=j,
+                        delivery_time_in_days=3 + j,
+                        price=100 + j * 50,
+                        features=["Feature"],
+                        offer_type=offer_type,
+                    )
+                )
+            cls.businesses.append(business)
+        cls.url = "/api/orders/bulk/"
+
+    def setUp(self):
+        self.client = JSONAPIClient()
+        self.client.force_authenticate(user=self.customer)
+
+    def test_bulk_create_orders(self):
+        """Test that one order is placed per requested offer detail, in request order."""
+        ids = [self.details[3].id, self.details[0].id, self.details[0].id]
+        response = self.client.post(self.url, {"offer_detail_ids": ids})
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual([order["title"] for order in response.data], ["standard 1", "basic 0", "basic 0"])
+        self.assertEqual(response.data[0]["business_user"], self.businesses[1].id)
+        self.assertTrue(all(order["customer_user"] == self.customer.id for order in response.data))
+        self.assertEqual(Order.objects.filter(customer_user=self.customer).count(), 3)
+
+    def test_bulk_create_updates_order_counters(self):
+        """Test that the per-business order counters count bulk created orders."""
+        ids = [detail.id for detail in self.details] + [self.details[0].id]
+        self.client.post(self.url, {"offer_detail_ids": ids})
+        counts = dict(BusinessOrderStats.objects.values_list("business_user_id", "in_progress_count"))
+        self.assertEqual(counts, {self.businesses[0].id: 3, self.businesses[1].id: 2})
+
+    def test_bulk_create_query_count(self):
+        """Test that the query count of a cart does not grow with the number of items."""
+        with self.assertNumQueries(6):
+            response = self.client.post(self.url, {"offer_detail_ids": [d.id for d in self.details] * 5})
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(len(response.data), 20)
+
+    def test_unknown_offer_detail_rejects_cart(self):
+        """Test that an unknown offer detail id returns 404 and places no orders."""
+        response = self.client.post(self.url, {"offer_detail_ids": [self.details[0].id, 9999]})
+        self.assertEqual(response.status_code, 404)
+        self.assertIn("9999", response.data["detail"])
+        self.assertFalse(Order.objects.exists())
+
+    def test_invalid_payload(self):
+        """Test that an empty or malformed cart returns 400."""
+        self.assertEqual(self.client.post(self.url, {"offer_detail_ids": []}).status_code, 400)
+        self.assertEqual(self.client.post(self.url, {"offer_detail_ids": ["abc"]}).status_code, 400)
+        self.assertEqual(self.client.post(self.url, {}).status_code, 400)
+
+    def test_business_forbidden(self):
+        """Test that business users cannot place orders in bulk."""
+        self.client.force_authenticate(user=self.businesses[0])
+        response = self.client.post(self.url, {"offer_detail_ids": [self.details[0].id]})
+        self.assertEqual(response.status_code, 403)
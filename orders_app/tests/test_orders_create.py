@@ -62,3 +62,18 @@ class OrdersCreateAPITestCase(APITestCase):
         self.client.force_authenticate(user=self.customer)
         response = self.client.post("/api/orders/", {})
         self.assertEqual(response.status_code, 400)
+
+    def test_create_order_query_count(self):
+        """Test that order creation resolves the offer detail in one query and writes the order once."""
+        self.client.force_authenticate(user=self.customer)
+        with self.assertNumQueries(5):
+            response = self.client.post("/api/orders/", {"offer_detail_id": self.offer_detail.id})
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(response.data["price"], "150.00")
+        self.assertEqual(response.data["features"], ["Logo Design", "Visitenkarten"])
+
+    def test_create_order_invalid_offer_detail_type(self):
+        """Test that a non-numeric offer_detail_id returns 400."""
+        self.client.force_authenticate(user=self.customer)
+        response = self.client.post("/api/orders/", {"offer_detail_id": "abc"})
+        self.assertEqual(response.status_code, 400)
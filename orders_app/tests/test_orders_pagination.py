@@ -0,0 +1,70 @@
+import json
+from django.contrib.auth.models import User
+from rest_framework.test import APITestCase
+from orders_app.models import Order
+from core.utils.test_client import JSONAPIClient
+
+
+class OrdersPaginationAPITestCase(APITestCase):
+    """Tests for the opt-in pagination and streaming modes of the order list."""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.customer = User.objects.create_user(username="kunde", password="pass1234", email="kunde@mail.de")
+        cls.customer.profile.type = "customer"
+        cls.customer.profile.save()
+        cls.business = User.objects.create_user(username="business", password="pass1234", email="business@mail.de")
+        cls.business.profile.type = "business"
+        cls.business.profile.save()
+        cls.staff = User.objects.create_user(username="staff", password="pass1234", email="staff@mail.de")
+        cls.staff.is_staff = True
+        cls.staff.save()
+        Order.objects.bulk_create(
+            [
+                Order(customer_user=cls.customer, business_user=cls.business, title=f"Order {i}", price=10 + i)
+                for i in range(25)
+            ]
+        )
+
+    def setUp(self):
+        self.client = JSONAPIClient()
+        self.client.force_authenticate(user=self.staff)
+
+    def test_default_response_is_unpaginated_list(self):
+        """Test that the order list stays a plain list without a pagination mode."""
+        response = self.client.get("/api/orders/")
+        self.assertEqual(response.status_code, 200)
+        self.assertIsInstance(response.data, list)
+        self.assertEqual(len(response.data), 25)
+
+    def test_page_mode(self):
+        """Test that ?pagination=page returns a counted page."""
+        response = self.client.get("/api/orders/", {"pagination": "page", "page_size": 10, "page": 3})
+        self.assertEqual(response.data["count"], 25)
+        self.assertEqual(len(response.data["results"]), 5)
+
+    def test_cursor_mode_walks_all_orders(self):
+        """Test that following cursor links returns every order once, newest first."""
+        response = self.client.get("/api/orders/", {"pagination": "cursor", "page_size": 10})
+        self.assertNotIn("count", response.data)
+        ids = [o["id"] for o in response.data["results"]]
+        while response.data["next"]:
+            response = self.client.get(response.data["next"])
+            ids += [o["id"] for o in response.data["results"]]
+        expected = list(Order.objects.order_by("-created_at", "-id").values_list("id", flat=True))
+        self.assertEqual(ids, expected)
+
+    def test_stream_mode(self):
+        """Test that ?pagination=stream streams the same JSON array as the default list."""
+        expected = self.client.get("/api/orders/").json()
+        response = self.client.get("/api/orders/", {"pagination": "stream"})
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.streaming)
+        self.assertEqual(json.loads(b"".join(response.streaming_content)), expected)
+
+    def test_stream_mode_respects_user_scope(self):
+        """Test that streaming only returns orders visible to the requesting user."""
+        other = User.objects.create_user(username="other", password="pass1234", email="other@mail.de")
+        self.client.force_authenticate(user=other)
+        response = self.client.get("/api/orders/", headers={"X-Pagination": "stream"})
+        self.assertEqual(json.loads(b"".join(response.streaming_content)), [])
@@ -0,0 +1,17 @@
+from django.db.models import F
+from rest_framework.filters import OrderingFilter
+
+
+class BusinessProfileOrderingFilter(OrderingFilter):
+    """OrderingFilter for business profiles that sorts profiles without reviews last."""
+
+    def get_ordering(self, request, queryset, view):
+        """Order by the requested review aggregate fields with NULLs last and the profile id as tiebreak."""
+        ordering = super().get_ordering(request, queryset, view)
+        if not ordering:
+            return ordering
+        result = []
+        for field in ordering:
+            expression = F(field.lstrip("-"))
+            result.append(expression.desc(nulls_last=True) if field.startswith("-") else expression.asc(nulls_last=True))
+        return result + ["pk"]
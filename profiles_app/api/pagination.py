@@ -0,0 +1,7 @@
+from core.utils.pagination import OptionalPagination, StandardPageNumberPagination
+
+
+class ProfilePagination(OptionalPagination):
+    """Opt-in page-number pagination for profile lists (?pagination=page)."""
+
+    paginator_classes = {"page": StandardPageNumberPagination}
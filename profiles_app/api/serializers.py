@@ -1,12 +1,16 @@
 from django.utils import timezone
 from rest_framework import serializers
 from profiles_app.models import Profile
+from reviews_app.models import ReviewAggregate
+from core.utils.sparse_fields import SparseFieldsMixin
 
 
-class ProfileSerializer(serializers.ModelSerializer):
-    """Serializer for the Profile model."""
+class ProfileSerializer(SparseFieldsMixin, serializers.ModelSerializer):
+    """Serializer for the Profile model; business profiles also show their review aggregate."""
 
     user = serializers.ReadOnlyField(source="user.pk")
+    review_count = serializers.SerializerMethodField()
+    average_rating = serializers.SerializerMethodField()
 
     class Meta:
         model = Profile
@@ -23,9 +27,38 @@ class ProfileSerializer(serializers.ModelSerializer):
             "type",
             "email",
             "created_at",
+            "review_count",
+            "average_rating",
         ]
         read_only_fields = ["user", "username", "type", "created_at"]
 
+    def get_review_aggregate(self, profile):
+        """Return the review aggregate of the profile's user, or None if it has no reviews yet."""
+        try:
+            return profile.user.review_aggregate
+        except ReviewAggregate.DoesNotExist:
+            return None
+
+    def get_review_count(self, profile):
+        """Return the number of reviews of the business."""
+        aggregate = self.get_review_aggregate(profile)
+        return aggregate.review_count if aggregate else 0
+
+    def get_average_rating(self, profile):
+        """Return the average rating of the business rounded to one decimal, or None without reviews."""
+        aggregate = self.get_review_aggregate(profile)
+        if aggregate is None or aggregate.average_rating is None:
+            return None
+        return round(aggregate.average_rating, 1)
+
+    def to_representation(self, instance):
+        """Drop the review aggregate from customer profiles."""
+        data = super().to_representation(instance)
+        if instance.type != "business":
+            data.pop("review_count", None)
+            data.pop("average_rating", None)
+        return data
+
     def update(self, instance, validated_data):
         """Update profile and set uploaded_at if file changes."""
         if "file" in validated_data and not validated_data["file"] == instance.file:
@@ -35,10 +68,10 @@ class ProfileSerializer(serializers.ModelSerializer):
         return super().update(instance, validated_data)
 
 
-class CustomerProfileSerializer(serializers.ModelSerializer):
+class CustomerProfileSerializer(SparseFieldsMixin, serializers.ModelSerializer):
     """Serializer for customer profiles."""
 
-    user = serializers.ReadOnlyField(source="user.pk")
+    user = serializers.ReadOnlyField(source="user_id")
 
     class Meta:
         model = Profile
@@ -53,10 +86,12 @@ class CustomerProfileSerializer(serializers.ModelSerializer):
         ]
 
 
-class BusinessProfileSerializer(serializers.ModelSerializer):
+class BusinessProfileSerializer(SparseFieldsMixin, serializers.ModelSerializer):
     """Serializer for business profiles."""
 
-    user = serializers.ReadOnlyField(source="user.pk")
+    user = serializers.ReadOnlyField(source="user_id")
+    review_count = serializers.IntegerField(read_only=True)
+    average_rating = serializers.DecimalField(max_digits=3, decimal_places=1, read_only=True, coerce_to_string=False)
 
     class Meta:
         model = Profile
@@ -71,4 +106,6 @@ class BusinessProfileSerializer(serializers.ModelSerializer):
             "description",
             "working_hours",
             "type",
+            "review_count",
+            "average_rating",
         ]
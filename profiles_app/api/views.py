@@ -1,12 +1,25 @@
-from rest_framework.generics import RetrieveUpdateAPIView, ListAPIView
+from django.db.models import Count, F, Max, Value
+from django.db.models.functions import Coalesce
+from django_filters.rest_framework import DjangoFilterBackend
+from rest_framework.generics import RetrieveUpdateAPIView
 from rest_framework.response import Response
 from rest_framework import status
 from profiles_app.models import Profile
 from profiles_app.api.serializers import ProfileSerializer, CustomerProfileSerializer, BusinessProfileSerializer
 from profiles_app.api.permissions import IsOwnerStaffOrReadOnly
+from profiles_app.api.pagination import ProfilePagination
+from profiles_app.api.filters import BusinessProfileOrderingFilter
+from core.utils.async_views import AsyncListAPIView
+from core.utils.conditional import ConditionalGetMixin
+from core.utils.streaming import StreamingListMixin
+from core.utils.query_budget import query_budget
+from core.utils.response_cache import CachedResponseMixin
+from core.utils.sparse_fields import SparseQuerysetMixin
+from reviews_app.models import Review, ReviewAggregate
 
 
-class ProfileDetailView(RetrieveUpdateAPIView):
+@query_budget(get=2, patch=6, put=6)
+class ProfileDetailView(ConditionalGetMixin, RetrieveUpdateAPIView):
     """Retrieve and update a user profile by user PK."""
 
     serializer_class = ProfileSerializer
@@ -15,13 +28,24 @@ class ProfileDetailView(RetrieveUpdateAPIView):
     lookup_field = "pk"
 
     def get_object(self):
-        """Get the profile object for the given user PK."""
+        """Get the profile object for the given user PK, with the user's review aggregate joined."""
         user_pk = self.kwargs.get("pk")
-        obj = Profile.objects.select_related("user").get(user__pk=user_pk)
+        obj = Profile.objects.select_related("user__review_aggregate").get(user__pk=user_pk)
 
         self.check_object_permissions(self.request, obj)
         return obj
 
+    def get_detail_validators(self, obj):
+        """Also validate business profiles by their review aggregate, which has no date to send as Last-Modified."""
+        values, last_modified = super().get_detail_validators(obj)
+        if obj.type != "business":
+            return values, last_modified
+        try:
+            aggregate = obj.user.review_aggregate
+        except ReviewAggregate.DoesNotExist:
+            return values + [None], None
+        return values + [(aggregate.review_count, aggregate.rating_sum)], None
+
     def update(self, request, *args, **kwargs):
         """Block PUT, allow PATCH for updates."""
         if request.method == "PUT":
@@ -32,17 +56,32 @@ class ProfileDetailView(RetrieveUpdateAPIView):
             return super().update(request, *args, **kwargs)
 
 
-class CustomerProfileListView(ListAPIView):
+@query_budget(default=3)
+class CustomerProfileListView(ConditionalGetMixin, SparseQuerysetMixin, StreamingListMixin, AsyncListAPIView):
     """List all customer profiles."""
 
     serializer_class = CustomerProfileSerializer
     queryset = Profile.objects.filter(type="customer")
-    pagination_class = None
+    pagination_class = ProfilePagination
 
 
-class BusinessProfileListView(ListAPIView):
-    """List all business profiles."""
+@query_budget(default=5)
+class BusinessProfileListView(
+    ConditionalGetMixin, SparseQuerysetMixin, CachedResponseMixin, StreamingListMixin, AsyncListAPIView
+):
+    """List all business profiles with their review aggregate, sortable by rating and review count."""
 
     serializer_class = BusinessProfileSerializer
-    queryset = Profile.objects.filter(type="business")
-    pagination_class = None
+    queryset = Profile.objects.filter(type="business").annotate(
+        review_count=Coalesce(F("user__review_aggregate__review_count"), Value(0)),
+        average_rating=F("user__review_aggregate__average_rating"),
+    )
+    pagination_class = ProfilePagination
+    filter_backends = [DjangoFilterBackend, BusinessProfileOrderingFilter]
+    ordering_fields = ["average_rating", "review_count"]
+    cache_dependencies = (Profile, Review)
+
+    def get_list_validator_values(self, queryset):
+        """Include the reviews, which change the ratings and review counts, in the list validators."""
+        reviews = Review.objects.aggregate(last_modified=Max("updated_at"), count=Count("pk"))
+        return super().get_list_validator_values(queryset) + [reviews["last_modified"], reviews["count"]]
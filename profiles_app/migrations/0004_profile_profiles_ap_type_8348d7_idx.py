@@ -0,0 +1,19 @@
+# Generated by Django 5.2 on 2026-10-17 21:00
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('profiles_app', '0003_alter_profile_file_alter_profile_type'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='profile',
+            index=models.Index(fields=['type'], name='profiles_ap_type_8348d7_idx'),
+        ),
+    ]
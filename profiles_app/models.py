@@ -1,11 +1,14 @@
 from django.db import models
 from django.contrib.auth.models import User
 from django.utils import timezone
+from core.utils.models import TrackedFieldsMixin
 
 
-class Profile(models.Model):
+class Profile(TrackedFieldsMixin, models.Model):
     """Model for user profile with business and customer types."""
 
+    tracked_fields = ("type", "first_name", "last_name", "email")
+
     TYPE_CHOICES = [
         ("customer", "Customer"),
         ("business", "Business"),
@@ -24,6 +27,12 @@ class Profile(models.Model):
     type = models.CharField(choices=TYPE_CHOICES, max_length=50, blank=True)
     email = models.EmailField(max_length=254, unique=True)
     created_at = models.DateTimeField(default=timezone.now)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        indexes = [models.Index(fields=["type"])]
+
+    USER_SYNC_FIELDS = ("first_name", "last_name", "email")
 
     def __str__(self):
         """String representation of Profile."""
@@ -1,11 +1,26 @@
 from django.contrib.auth.models import User
-from django.db.models.signals import post_save
+from django.db.models.signals import post_delete, post_save
 from django.dispatch import receiver
 from .models import Profile
+from core.utils.response_cache import invalidate_cached_responses
 
 
 @receiver(post_save, sender=User)
 def create_user_profile(sender, instance, created, **kwargs):
-    """Create a Profile instance when a new User is created."""
+    """Create a Profile instance when a new User is created, copying the synced user fields and its profile_type."""
     if created:
-        Profile.objects.get_or_create(user=instance, username=instance.username, email=instance.email)
+        Profile.objects.create(
+            user=instance,
+            username=instance.username,
+            email=instance.email,
+            first_name=instance.first_name,
+            last_name=instance.last_name,
+            type=getattr(instance, "profile_type", ""),
+        )
+
+
+@receiver(post_save, sender=Profile)
+@receiver(post_delete, sender=Profile)
+def invalidate_profile_responses(sender, **kwargs):
+    """Drop cached responses that contain the changed profile."""
+    invalidate_cached_responses(Profile)
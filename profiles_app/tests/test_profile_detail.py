@@ -5,6 +5,7 @@ from django.urls import reverse
 from rest_framework.test import APITestCase
 from core.utils.test_client import JSONAPIClient
 from profiles_app.models import Profile
+from reviews_app.models import Review
 from profiles_app.api.views import ProfileDetailView
 
 
@@ -44,6 +45,27 @@ class TestProfileDetailView(APITestCase):
         self.assertEqual(response.status_code, 200)
         self.assertEqual(response.data["user"], self.user.pk)
         self.assertEqual(response.data["username"], self.user.username)
+        self.assertNotIn("review_count", response.data)
+
+    def test_business_profile_shows_review_aggregate(self):
+        """Test that a business profile includes review count and average rating without extra queries."""
+        business = User.objects.create_user(username="business", password="pw123", email="business@mail.de")
+        business.profile.type = "business"
+        business.profile.save()
+        Review.objects.create(reviewer=self.user, business_user=business, rating=4, description="Gut")
+        Review.objects.create(reviewer=User.objects.create_user(username="other"), business_user=business, rating=5)
+        self.client.force_authenticate(user=self.user)
+        with self.assertNumQueries(1):
+            response = self.client.get(reverse("profile", kwargs={"pk": business.pk}))
+        self.assertEqual((response.data["review_count"], response.data["average_rating"]), (2, 4.5))
+
+    def test_business_profile_without_reviews(self):
+        """Test that a business profile without reviews shows 0 reviews and no rating."""
+        self.profile.type = "business"
+        self.profile.save()
+        self.client.force_authenticate(user=self.user)
+        response = self.client.get(self.url)
+        self.assertEqual((response.data["review_count"], response.data["average_rating"]), (0, None))
 
     def test_get_profile_internal_server_error(self):
         """Test that internal server error returns 500 for profile detail."""
@@ -0,0 +1,41 @@
+import json
+from django.contrib.auth.models import User
+from django.urls import reverse
+from rest_framework.test import APITestCase
+from core.utils.test_client import JSONAPIClient
+
+
+class TestProfileListPagination(APITestCase):
+    """Tests for the opt-in pagination and streaming modes of the profile lists."""
+
+    client_class = JSONAPIClient
+
+    @classmethod
+    def setUpTestData(cls):
+        for i in range(5):
+            user = User.objects.create_user(username=f"business{i}", password="pw123", email=f"b{i}@mail.de")
+            user.profile.type = "business"
+            user.profile.save()
+        cls.user = user
+        cls.business_url = reverse("business-profiles")
+
+    def setUp(self):
+        self.client = self.client_class()
+        self.client.force_authenticate(user=self.user)
+
+    def test_default_response_is_unpaginated_list(self):
+        """Test that the business list stays a plain list without a pagination mode."""
+        response = self.client.get(self.business_url)
+        self.assertEqual(len(response.data), 5)
+
+    def test_page_mode(self):
+        """Test that ?page= enables page-number pagination ordered by pk."""
+        response = self.client.get(self.business_url, {"page": 2, "page_size": 2})
+        self.assertEqual(response.data["count"], 5)
+        self.assertEqual([p["username"] for p in response.data["results"]], ["business2", "business3"])
+
+    def test_stream_mode(self):
+        """Test that ?pagination=stream streams the same profiles as the default list."""
+        expected = self.client.get(self.business_url).json()
+        response = self.client.get(self.business_url, {"pagination": "stream"})
+        self.assertEqual(json.loads(b"".join(response.streaming_content)), expected)
@@ -0,0 +1,54 @@
+from django.contrib.auth.models import User
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework.test import APITestCase
+from core.utils.test_client import JSONAPIClient
+from profiles_app.models import Profile
+
+
+class TestProfileUserSync(APITestCase):
+    """Tests for copying changed profile fields to the user."""
+
+    client_class = JSONAPIClient
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(
+            username="testuser", password="pw123", email="test@mail.de", first_name="Max", last_name="Muster"
+        )
+        cls.url = reverse("profile", kwargs={"pk": cls.user.pk})
+
+    def setUp(self):
+        self.client = self.client_class()
+        self.client.force_authenticate(user=self.user)
+
+    def user_updates(self, captured):
+        """Return the UPDATE statements on the user table."""
+        return [q["sql"] for q in captured.captured_queries if q["sql"].startswith('UPDATE "auth_user"')]
+
+    def test_new_profile_copies_user_fields(self):
+        """Test that a new profile starts with the user's names and email instead of blanking the user."""
+        profile = Profile.objects.get(user=self.user)
+        self.assertEqual((profile.first_name, profile.last_name, profile.email), ("Max", "Muster", "test@mail.de"))
+        self.user.refresh_from_db()
+        self.assertEqual(self.user.first_name, "Max")
+
+    def test_unchanged_fields_skip_user_write(self):
+        """Test that a PATCH without name or email changes does not write the user."""
+        with CaptureQueriesContext(connection) as captured:
+            response = self.client.patch(self.url, {"location": "Berlin", "first_name": "Max"})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(self.user_updates(captured), [])
+
+    def test_changed_fields_use_update_fields(self):
+        """Test that only the changed fields are written to the user."""
+        with CaptureQueriesContext(connection) as captured:
+            response = self.client.patch(self.url, {"last_name": "Mustermann", "location": "Berlin"})
+        self.assertEqual(response.status_code, 200)
+        updates = self.user_updates(captured)
+        self.assertEqual(len(updates), 1)
+        self.assertIn('"last_name"', updates[0])
+        self.assertNotIn('"password"', updates[0])
+        self.user.refresh_from_db()
+        self.assertEqual(self.user.last_name, "Mustermann")
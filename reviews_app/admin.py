@@ -1,5 +1,5 @@
 from django.contrib import admin
-from .models import Review
+from .models import Review, ReviewAggregate
 
 
 @admin.register(Review)
@@ -28,3 +28,30 @@ class ReviewAdmin(admin.ModelAdmin):
         return obj.business_user.username
 
     business_username.short_description = "Business User"
+
+
+@admin.register(ReviewAggregate)
+class ReviewAggregateAdmin(admin.ModelAdmin):
+    """Read-only admin for the per-business review aggregates."""
+
+    list_display = ("business_user", "review_count", "average_rating", "rating_sum")
+    readonly_fields = (
+        "business_user",
+        "review_count",
+        "rating_sum",
+        "average_rating",
+        "rating_1_count",
+        "rating_2_count",
+        "rating_3_count",
+        "rating_4_count",
+        "rating_5_count",
+    )
+    search_fields = ("business_user__username",)
+
+    def has_add_permission(self, request):
+        """Disallow adding rows, they follow the reviews."""
+        return False
+
+    def has_change_permission(self, request, obj=None):
+        """Disallow editing, use the rebuild_review_aggregates command instead."""
+        return False
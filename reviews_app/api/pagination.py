@@ -0,0 +1,14 @@
+from core.utils.pagination import KeysetCursorPagination, OptionalPagination, StandardPageNumberPagination
+
+
+class ReviewCursorPagination(KeysetCursorPagination):
+    """Keyset pagination for reviews matching the review ordering_fields."""
+
+    keyset_fields = ["updated_at", "rating"]
+    default_ordering = "-updated_at"
+
+
+class ReviewPagination(OptionalPagination):
+    """Opt-in pagination for reviews (?pagination=page or ?pagination=cursor)."""
+
+    paginator_classes = {"page": StandardPageNumberPagination, "cursor": ReviewCursorPagination}
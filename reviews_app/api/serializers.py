@@ -2,9 +2,10 @@ from rest_framework import serializers
 from reviews_app.models import Review
 from django.contrib.auth.models import User
 from django.db import IntegrityError
+from core.utils.sparse_fields import SparseFieldsMixin
 
 
-class ReviewSerializer(serializers.ModelSerializer):
+class ReviewSerializer(SparseFieldsMixin, serializers.ModelSerializer):
     """Serializer for the Review model."""
 
     reviewer = serializers.PrimaryKeyRelatedField(read_only=True)
@@ -1,10 +1,11 @@
 from django.urls import path, include
 from rest_framework.routers import DefaultRouter
-from reviews_app.api.views import ReviewViewSet
+from reviews_app.api.views import BusinessReviewStatsView, ReviewViewSet
 
 router = DefaultRouter()
 router.register(r"reviews", ReviewViewSet, basename="reviews")
 
 urlpatterns = [
+    path("review-stats/<int:business_user_id>/", BusinessReviewStatsView.as_view(), name="business-review-stats"),
     path("", include(router.urls)),
 ]
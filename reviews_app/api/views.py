@@ -1,28 +1,50 @@
+from django.contrib.auth.models import User
+from django.db import transaction
 from rest_framework import viewsets
+from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework import status
-from reviews_app.models import Review
+from reviews_app.models import Review, ReviewAggregate
 from reviews_app.api.serializers import ReviewSerializer
 from reviews_app.api.permissions import IsAuthenticatedOrCustomerCreateOrOwnerUpdateDelete
 from reviews_app.api.filters import ReviewFilter
+from reviews_app.api.pagination import ReviewPagination
+from core.utils.conditional import ConditionalGetMixin
+from core.utils.streaming import StreamingListMixin
+from core.utils.query_budget import query_budget
+from core.utils.sparse_fields import SparseQuerysetMixin
 
 
-class ReviewViewSet(viewsets.ModelViewSet):
+@query_budget(list=3, create=12, update=10, partial_update=10, destroy=8)
+class ReviewViewSet(ConditionalGetMixin, SparseQuerysetMixin, StreamingListMixin, viewsets.ModelViewSet):
     """ViewSet for listing, creating, and updating reviews."""
 
-    queryset = Review.objects.all().distinct()
+    queryset = Review.objects.select_related("business_user")
     serializer_class = ReviewSerializer
     filterset_class = ReviewFilter
     permission_classes = [IsAuthenticatedOrCustomerCreateOrOwnerUpdateDelete]
-    pagination_class = None
+    pagination_class = ReviewPagination
     ordering_fields = ["updated_at", "rating"]
     ordering = ["-updated_at"]
+    conditional_detail = False
+
+    def get_queryset(self):
+        """Lock the review for PATCH and DELETE so concurrent writes see its current rating."""
+        if self.request.method in ("PATCH", "DELETE"):
+            return Review.objects.select_for_update()
+        return super().get_queryset()
+
+    def perform_create(self, serializer):
+        """Create the review and add it to the business aggregate in the same transaction."""
+        with transaction.atomic():
+            serializer.save()
 
     def retrieve(self, request, *args, **kwargs):
         """Block GET on detail view (not allowed)."""
         if request.method == "GET":
             return Response({"detail": "GET is not allowed in detail View."}, status=status.HTTP_405_METHOD_NOT_ALLOWED)
 
+    @transaction.atomic
     def update(self, request, *args, **kwargs):
         """Block PUT, allow PATCH for updates."""
         if request.method == "PUT":
@@ -31,3 +53,29 @@ class ReviewViewSet(viewsets.ModelViewSet):
             )
         else:
             return super().update(request, *args, **kwargs)
+
+    @transaction.atomic
+    def destroy(self, request, *args, **kwargs):
+        """Delete the locked review and remove it from the business aggregate in the same transaction."""
+        return super().destroy(request, *args, **kwargs)
+
+
+@query_budget(default=3)
+class BusinessReviewStatsView(APIView):
+    """API view to get the review count, average rating and rating histogram of a business user."""
+
+    def get(self, request, business_user_id, *args, **kwargs):
+        """Return the review aggregate of the given business user."""
+        aggregate = ReviewAggregate.objects.filter(business_user_id=business_user_id).first()
+        if aggregate is None:
+            if not User.objects.filter(id=business_user_id, profile__type="business").exists():
+                return Response({"detail": "Business user not found."}, status=status.HTTP_404_NOT_FOUND)
+            aggregate = ReviewAggregate(business_user_id=business_user_id)
+        return Response(
+            {
+                "business_user": aggregate.business_user_id,
+                "review_count": aggregate.review_count,
+                "average_rating": round(aggregate.average_rating, 1) if aggregate.average_rating is not None else None,
+                "rating_histogram": aggregate.histogram,
+            }
+        )
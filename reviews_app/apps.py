@@ -6,3 +6,7 @@ class ReviewsAppConfig(AppConfig):
 
     default_auto_field = "django.db.models.BigAutoField"
     name = "reviews_app"
+
+    def ready(self):
+        """Import signals when app is ready."""
+        import reviews_app.signals
@@ -0,0 +1,21 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from reviews_app.models import Review, ReviewAggregate
+
+
+class Command(BaseCommand):
+    help = "Berechnet die Bewertungs-Aggregate aller Business-User neu."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--business-user-id", type=int, nargs="+", help="Nur diese Business-User neu berechnen.")
+
+    def handle(self, *args, **options):
+        business_user_ids = options["business_user_id"] or list(
+            Review.objects.values_list("business_user_id", flat=True).distinct()
+        )
+        with transaction.atomic():
+            for business_user_id in business_user_ids:
+                ReviewAggregate.rebuild(business_user_id)
+            if not options["business_user_id"]:
+                ReviewAggregate.objects.filter(business_user__business_reviews__isnull=True).delete()
+        self.stdout.write(self.style.SUCCESS(f"{len(business_user_ids)} Bewertungs-Aggregate neu berechnet."))
@@ -1,10 +1,15 @@
-from django.db import models
+from django.db import IntegrityError, models, transaction
+from django.db.models import Case, Count, F, FloatField, Q, Sum, When
+from django.db.models.functions import Cast
 from django.contrib.auth.models import User
+from core.utils.models import TrackedFieldsMixin
 
 
-class Review(models.Model):
+class Review(TrackedFieldsMixin, models.Model):
     """Model for a review of a business by a user."""
 
+    tracked_fields = ("business_user_id", "rating")
+
     id = models.AutoField(primary_key=True, editable=False)
     business_user = models.ForeignKey(User, on_delete=models.CASCADE, related_name="business_reviews")
     reviewer = models.ForeignKey(User, on_delete=models.CASCADE, related_name="user_reviews")
@@ -15,7 +20,98 @@ class Review(models.Model):
 
     class Meta:
         unique_together = ("reviewer", "business_user")
+        indexes = [
+            models.Index(fields=["business_user", "-updated_at"]),
+            models.Index(fields=["-updated_at"]),
+            models.Index(fields=["rating"]),
+        ]
 
     def __str__(self):
         """String representation of Review."""
         return f"Review by {self.reviewer.username} for {self.business_user.username}"
+
+
+class ReviewAggregate(models.Model):
+    """Per-business review counters: count, rating sum, average and 1-5 histogram."""
+
+    RATINGS = range(1, 6)
+
+    business_user = models.OneToOneField(
+        User, on_delete=models.CASCADE, primary_key=True, related_name="review_aggregate"
+    )
+    review_count = models.IntegerField(default=0)
+    rating_sum = models.IntegerField(default=0)
+    average_rating = models.FloatField(null=True, blank=True)
+    rating_1_count = models.IntegerField(default=0)
+    rating_2_count = models.IntegerField(default=0)
+    rating_3_count = models.IntegerField(default=0)
+    rating_4_count = models.IntegerField(default=0)
+    rating_5_count = models.IntegerField(default=0)
+
+    def __str__(self):
+        """String representation of ReviewAggregate."""
+        return f"Review aggregate of {self.business_user_id}"
+
+    @staticmethod
+    def histogram_field(rating):
+        """Return the histogram counter field for a rating, or None if it is out of range."""
+        return f"rating_{rating}_count" if rating in ReviewAggregate.RATINGS else None
+
+    @property
+    def histogram(self):
+        """Return the number of reviews per rating."""
+        return {str(rating): getattr(self, self.histogram_field(rating)) for rating in self.RATINGS}
+
+    @classmethod
+    def compute(cls, business_user_id):
+        """Aggregate the reviews of a business user from the review table."""
+        values = Review.objects.filter(business_user_id=business_user_id).aggregate(
+            review_count=Count("id"),
+            rating_sum=Sum("rating", default=0),
+            **{cls.histogram_field(rating): Count("id", filter=Q(rating=rating)) for rating in cls.RATINGS},
+        )
+        values["average_rating"] = values["rating_sum"] / values["review_count"] if values["review_count"] else None
+        return values
+
+    @classmethod
+    def rebuild(cls, business_user_id):
+        """Recompute and store the aggregate of a business user."""
+        aggregate, _ = cls.objects.update_or_create(
+            business_user_id=business_user_id, defaults=cls.compute(business_user_id)
+        )
+        return aggregate
+
+    @classmethod
+    def record(cls, business_user_id, added=None, removed=None):
+        """Atomically add and/or remove one rating in a single UPDATE.
+
+        When a rating is added and the row is missing, it is built from the review table;
+        if a concurrent write created it first, the delta is applied to that row instead.
+        """
+        count_delta = (added is not None) - (removed is not None)
+        sum_delta = (added or 0) - (removed or 0)
+        deltas = {"review_count": count_delta, "rating_sum": sum_delta}
+        for rating, delta in ((added, 1), (removed, -1)):
+            field = cls.histogram_field(rating)
+            if field:
+                deltas[field] = deltas.get(field, 0) + delta
+        updates = {name: F(name) + delta for name, delta in deltas.items() if delta}
+        if not updates:
+            return
+        updates["average_rating"] = Case(
+            When(
+                review_count__gt=-count_delta,
+                then=Cast(F("rating_sum") + sum_delta, FloatField()) / (F("review_count") + count_delta),
+            ),
+            default=None,
+            output_field=FloatField(),
+        )
+        queryset = cls.objects.filter(business_user_id=business_user_id)
+        if queryset.update(**updates) or added is None:
+            return
+        values = cls.compute(business_user_id)
+        try:
+            with transaction.atomic():
+                cls.objects.create(business_user_id=business_user_id, **values)
+        except IntegrityError:
+            queryset.update(**updates)
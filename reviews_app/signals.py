@@ -0,0 +1,34 @@
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+from .models import Review, ReviewAggregate
+from core.utils.response_cache import invalidate_cached_responses
+
+
+@receiver(post_save, sender=Review)
+def aggregate_saved_review(sender, instance, created, **kwargs):
+    """Add a new review to its business aggregate or move a changed rating."""
+    if created:
+        ReviewAggregate.record(instance.business_user_id, added=instance.rating)
+        return
+    old_business_user_id = instance.get_tracked_value("business_user_id", instance.business_user_id)
+    old_rating = instance.get_tracked_value("rating", instance.rating)
+    if old_business_user_id == instance.business_user_id:
+        if old_rating != instance.rating:
+            ReviewAggregate.record(instance.business_user_id, added=instance.rating, removed=old_rating)
+        return
+    ReviewAggregate.record(old_business_user_id, removed=old_rating)
+    ReviewAggregate.record(instance.business_user_id, added=instance.rating)
+
+
+@receiver(post_delete, sender=Review)
+def aggregate_deleted_review(sender, instance, **kwargs):
+    """Remove a deleted review from its business aggregate."""
+    business_user_id = instance.get_tracked_value("business_user_id", instance.business_user_id)
+    ReviewAggregate.record(business_user_id, removed=instance.get_tracked_value("rating", instance.rating))
+
+
+@receiver(post_save, sender=Review)
+@receiver(post_delete, sender=Review)
+def invalidate_review_responses(sender, **kwargs):
+    """Drop cached responses that contain the changed review or its business aggregate."""
+    invalidate_cached_responses(Review)
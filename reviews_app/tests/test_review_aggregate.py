@@ -0,0 +1,119 @@
+from io import StringIO
+from unittest import mock
+from django.contrib.auth.models import User
+from django.core.management import call_command
+from django.urls import reverse
+from rest_framework.test import APITestCase
+from core.utils.test_client import JSONAPIClient
+from reviews_app.models import Review, ReviewAggregate
+
+
+class TestReviewAggregate(APITestCase):
+    """Tests for the per-business review aggregate, its endpoint and the business profile sort key."""
+
+    client_class = JSONAPIClient
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.customers = []
+        for i in range(3):
+            customer = User.objects.create_user(username=f"customer{i}", password="pw1", email=f"c{i}@test.com")
+            customer.profile.type = "customer"
+            customer.profile.save()
+            cls.customers.append(customer)
+        cls.business = User.objects.create_user(username="business", password="pw1", email="business@test.com")
+        cls.business.profile.type = "business"
+        cls.business.profile.save()
+        cls.unrated = User.objects.create_user(username="unrated", password="pw1", email="unrated@test.com")
+        cls.unrated.profile.type = "business"
+        cls.unrated.profile.save()
+        cls.other = User.objects.create_user(username="other", password="pw1", email="other@test.com")
+        cls.other.profile.type = "business"
+        cls.other.profile.save()
+        Review.objects.create(reviewer=cls.customers[0], business_user=cls.other, rating=2, description="Meh.")
+
+    def assert_aggregate_matches_reviews(self, business_user):
+        """Assert that the stored aggregate equals a recomputation from the review table."""
+        aggregate = ReviewAggregate.objects.get(business_user=business_user)
+        for field, value in ReviewAggregate.compute(business_user.id).items():
+            self.assertAlmostEqual(getattr(aggregate, field), value, msg=field)
+
+    def stats(self, business_user):
+        """Return the review stats response for a business user."""
+        self.client.force_authenticate(user=self.customers[0])
+        return self.client.get(reverse("business-review-stats", kwargs={"business_user_id": business_user.id}))
+
+    def test_api_create_update_delete(self):
+        """Test that review writes through the API keep count, average and histogram in sync."""
+        url = reverse("reviews-list")
+        for customer, rating in zip(self.customers, [5, 4, 4]):
+            self.client.force_authenticate(user=customer)
+            response = self.client.post(url, {"business_user": self.business.id, "rating": rating, "description": "x"})
+            self.assertEqual(response.status_code, 201)
+        review_id = response.data["id"]
+        self.assert_aggregate_matches_reviews(self.business)
+        response = self.client.patch(reverse("reviews-detail", kwargs={"pk": review_id}), {"rating": 1})
+        self.assertEqual(response.status_code, 200)
+        self.assert_aggregate_matches_reviews(self.business)
+        response = self.client.delete(reverse("reviews-detail", kwargs={"pk": review_id}))
+        self.assertEqual(response.status_code, 204)
+        aggregate = ReviewAggregate.objects.get(business_user=self.business)
+        self.assertEqual((aggregate.review_count, aggregate.average_rating), (2, 4.5))
+        self.assertEqual(aggregate.histogram, {"1": 0, "2": 0, "3": 0, "4": 1, "5": 1})
+
+    def test_last_review_deleted_resets_average(self):
+        """Test that removing the last review clears the average rating."""
+        Review.objects.get(business_user=self.other).delete()
+        aggregate = ReviewAggregate.objects.get(business_user=self.other)
+        self.assertEqual((aggregate.review_count, aggregate.average_rating), (0, None))
+
+    def test_stats_endpoint(self):
+        """Test that the stats endpoint returns count, rounded average and histogram."""
+        Review.objects.create(reviewer=self.customers[1], business_user=self.other, rating=3, description="Ok.")
+        Review.objects.create(reviewer=self.customers[2], business_user=self.other, rating=3, description="Ok.")
+        response = self.stats(self.other)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data["review_count"], 3)
+        self.assertEqual(response.data["average_rating"], 2.7)
+        self.assertEqual(response.data["rating_histogram"], {"1": 0, "2": 1, "3": 2, "4": 0, "5": 0})
+
+    def test_stats_endpoint_without_reviews_and_not_found(self):
+        """Test that a business without reviews gets zeros and a non-business user gets 404."""
+        response = self.stats(self.unrated)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual((response.data["review_count"], response.data["average_rating"]), (0, None))
+        self.assertEqual(self.stats(self.customers[1]).status_code, 404)
+
+    def test_concurrent_first_review_applies_delta(self):
+        """Test that a row created by a concurrent first review still receives this review's delta."""
+        existing = ReviewAggregate.compute
+
+        def concurrent_compute(business_user_id):
+            """Insert the row as a concurrent writer would before returning the computed values."""
+            values = existing(business_user_id)
+            ReviewAggregate.objects.create(business_user_id=business_user_id, review_count=1, rating_sum=4)
+            return values
+
+        Review.objects.create(reviewer=self.customers[0], business_user=self.business, rating=4, description="x")
+        ReviewAggregate.objects.filter(business_user=self.business).delete()
+        with mock.patch.object(ReviewAggregate, "compute", side_effect=concurrent_compute):
+            Review.objects.create(reviewer=self.customers[1], business_user=self.business, rating=2, description="y")
+        aggregate = ReviewAggregate.objects.get(business_user=self.business)
+        self.assertEqual((aggregate.review_count, aggregate.rating_sum, aggregate.average_rating), (2, 6, 3.0))
+
+    def test_business_profiles_expose_and_sort_by_rating(self):
+        """Test that business profiles show their aggregate and sort by average rating with unrated last."""
+        Review.objects.create(reviewer=self.customers[0], business_user=self.business, rating=5, description="x")
+        self.client.force_authenticate(user=self.customers[0])
+        response = self.client.get(reverse("business-profiles"), {"ordering": "-average_rating"})
+        self.assertEqual(response.status_code, 200)
+        rows = [(p["user"], p["review_count"], p["average_rating"]) for p in response.data]
+        self.assertEqual(rows, [(self.business.id, 1, 5.0), (self.other.id, 1, 2.0), (self.unrated.id, 0, None)])
+        response = self.client.get(reverse("business-profiles"), {"ordering": "average_rating"})
+        self.assertEqual([p["user"] for p in response.data], [self.other.id, self.business.id, self.unrated.id])
+
+    def test_rebuild_command(self):
+        """Test that the rebuild command repairs a drifted aggregate."""
+        ReviewAggregate.objects.filter(business_user=self.other).update(review_count=9, rating_2_count=0)
+        call_command("rebuild_review_aggregates", stdout=StringIO())
+        self.assert_aggregate_matches_reviews(self.other)
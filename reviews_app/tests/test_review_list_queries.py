@@ -0,0 +1,39 @@
+from django.contrib.auth.models import User
+from rest_framework.test import APITestCase
+from core.utils.test_client import ConstantQueryCountMixin
+from reviews_app.models import Review
+
+
+class ReviewListQueryCountTests(ConstantQueryCountMixin, APITestCase):
+    """Regression tests asserting that the review list costs a constant number of queries."""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.customer = User.objects.create_user(username="customer", password="pw1", email="customer@test.com")
+        cls.customer.profile.type = "customer"
+        cls.customer.profile.save()
+
+    def setUp(self):
+        self.client = self.client_class()
+        self.client.force_authenticate(user=self.customer)
+        self.created = 0
+
+    def add_reviews(self, count):
+        """Add reviews of the customer for count new business users."""
+        businesses = User.objects.bulk_create(
+            User(username=f"business{self.created + i}", email=f"b{self.created + i}@test.com") for i in range(count)
+        )
+        Review.objects.bulk_create(
+            Review(reviewer=self.customer, business_user=business, rating=1 + i % 5, description="Gut")
+            for i, business in enumerate(businesses)
+        )
+        self.created += count
+
+    def test_review_list(self):
+        """Test that the list does not load the business user per review."""
+        self.assertConstantQueryCount("/api/reviews/", self.add_reviews)
+
+    def test_filtered_review_list(self):
+        """Test that filtering by reviewer and ordering by rating do not add per-row queries."""
+        params = {"reviewer_id": self.customer.id, "ordering": "rating"}
+        self.assertConstantQueryCount("/api/reviews/", self.add_reviews, params)
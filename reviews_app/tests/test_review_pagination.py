@@ -0,0 +1,54 @@
+import json
+from django.urls import reverse
+from django.contrib.auth.models import User
+from rest_framework import status
+from rest_framework.test import APITestCase
+from core.utils.test_client import JSONAPIClient
+from reviews_app.models import Review
+
+
+class TestReviewPagination(APITestCase):
+    """Tests for the opt-in cursor pagination and streaming modes of the review list."""
+
+    client_class = JSONAPIClient
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.business_user = User.objects.create_user(username="business", password="pw1", email="business@test.com")
+        cls.business_user.profile.type = "business"
+        cls.business_user.profile.save()
+        reviewers = [
+            User.objects.create_user(username=f"customer{i}", password="pw1", email=f"customer{i}@test.com")
+            for i in range(7)
+        ]
+        for i, reviewer in enumerate(reviewers):
+            Review.objects.create(
+                reviewer=reviewer, business_user=cls.business_user, rating=i % 5 + 1, description=f"Review {i}"
+            )
+        cls.url = reverse("reviews-list")
+
+    def setUp(self):
+        self.client = self.client_class()
+        self.client.force_authenticate(user=self.business_user)
+
+    def test_default_response_is_unpaginated_list(self):
+        """Test that the review list stays a plain list without a pagination mode."""
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.data), 7)
+
+    def test_cursor_mode_by_rating(self):
+        """Test that cursor pages ordered by rating cover every review once in order."""
+        response = self.client.get(self.url, {"pagination": "cursor", "ordering": "-rating", "page_size": 3})
+        ratings = [r["rating"] for r in response.data["results"]]
+        while response.data["next"]:
+            response = self.client.get(response.data["next"])
+            ratings += [r["rating"] for r in response.data["results"]]
+        self.assertEqual(ratings, sorted((i % 5 + 1 for i in range(7)), reverse=True))
+
+    def test_stream_mode_with_filter(self):
+        """Test that streaming applies filters and ordering like the default list."""
+        params = {"business_user_id": self.business_user.id, "ordering": "rating"}
+        expected = self.client.get(self.url, params).json()
+        response = self.client.get(self.url, {**params, "pagination": "stream"})
+        self.assertEqual(json.loads(b"".join(response.streaming_content)), expected)